@@ -6,61 +6,7 @@
 # In[1]:
 
 
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Clase para representar un cuerpo celeste
-class CuerpoCeleste:
-    def __init__(self, nombre, masa, eje_semi_mayor, velocidad_orbital):
-        self.nombre = nombre  # Nombre del cuerpo celeste
-        self.masa = masa  # Masa del cuerpo
-        self.posicion = np.array([eje_semi_mayor, 0.0, 0.0], dtype=float)  # Posición inicial
-        self.velocidad = np.array([0.0, velocidad_orbital, 0.0], dtype=float)  # Velocidad orbital
-        self.posiciones = []  # Lista para almacenar todas las posiciones durante la simulación
-
-# Función para calcular la aceleración gravitacional
-def aceleracion_gravitacional(cuerpo, otros_cuerpos):
-    G = 6.674 * (10**(-11))  # Constante gravitacional
-    fuerza_total = np.zeros(3)  # Fuerza total inicialmente en cero
-    for otro_cuerpo in otros_cuerpos:
-        if cuerpo != otro_cuerpo:
-            r = otro_cuerpo.posicion - cuerpo.posicion  # Vector de distancia
-            distancia = np.linalg.norm(r)  # Calcular la distancia
-            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)
-            fuerza_total += magnitud_fuerza * r / distancia
-    return fuerza_total / cuerpo.masa
-
-# Implementación del paso Euler-Cromer para la simulación
-def paso_euler_cromer(cuerpo, otros_cuerpos, dt):
-    aceleracion = aceleracion_gravitacional(cuerpo, otros_cuerpos)  # Calcular la aceleración
-    cuerpo.velocidad += dt * aceleracion  # Actualizar la velocidad
-    cuerpo.posicion += dt * cuerpo.velocidad  # Actualizar la posición
-    cuerpo.posiciones.append(cuerpo.posicion.copy())  # Guardar la posición actual
-
-# Simular el sistema solar
-def simular_sistema_solar(cuerpos_celestes, num_pasos, dt):
-    for paso in range(num_pasos):
-        for cuerpo in cuerpos_celestes:
-            otros_cuerpos = [otro for otro in cuerpos_celestes if otro != cuerpo]
-            paso_euler_cromer(cuerpo, otros_cuerpos, dt)
-
-# Visualizar las órbitas de los cuerpos celestes
-def visualizar_orbitas(cuerpos_celestes):
-    figura = plt.figure(figsize=(10, 8))
-    eje = figura.add_subplot(111, projection='3d')
-
-    for cuerpo in cuerpos_celestes:
-        posiciones = np.array(cuerpo.posiciones)
-        eje.plot(posiciones[:, 0], posiciones[:, 1], posiciones[:, 2], label=cuerpo.nombre)
-
-    eje.set_xlabel('X (m)')
-    eje.set_ylabel('Y (m)')
-    eje.set_zlabel('Z (m)')
-    eje.set_title('Órbitas del Sistema Solar')
-    eje.legend()
-
-    plt.show()
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
 
 # Datos de los planetas proporcionados por el usuario
 datos_cuerpos_celestes = {
@@ -89,10 +35,10 @@ dt = 86400  # Un día en segundos
 num_pasos = 365 * 10  # 10 años
 
 # Realizar la simulación
-simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
+trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt, metodo="euler_cromer")
 
 # Visualizar las órbitas
-visualizar_orbitas(cuerpos_celestes)
+visualizar_orbitas(cuerpos_celestes, trayectoria)
 
 
 # ### simulación del sistema solar interno con Euler Cromer 20 años
@@ -100,70 +46,8 @@ visualizar_orbitas(cuerpos_celestes)
 # In[2]:
 
 
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Clase para representar un cuerpo celeste en la simulación
-class CuerpoCeleste:
-    def __init__(self, nombre, masa, posicion, velocidad):
-        self.nombre = nombre  # Nombre del cuerpo celeste
-        self.masa = masa  # Masa del cuerpo
-        self.posicion = np.array(posicion, dtype=float)  # Posición inicial
-        self.velocidad = np.array(velocidad, dtype=float)  # Velocidad inicial
-        self.posiciones = []  # Almacena todas las posiciones durante la simulación
-
-# Función para calcular la aceleración gravitacional
-def aceleracion_gravitacional(cuerpo, otros_cuerpos):
-    G = 6.674 * (10**(-11))  # Constante gravitacional
-    fuerza_total = np.zeros(3)  # Fuerza total inicializada a cero
-    for otro_cuerpo in otros_cuerpos:
-        if cuerpo != otro_cuerpo:
-            r = otro_cuerpo.posicion - cuerpo.posicion  # Vector de distancia
-            distancia = np.linalg.norm(r)  # Distancia entre cuerpos
-            if distancia < 1e-10:  # Evitar división por cero
-                continue
-            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)  # Magnitud de la fuerza
-            fuerza_total += magnitud_fuerza * r / distancia  # Fuerza total
-    return fuerza_total / cuerpo.masa  # Aceleración
-
-# Paso del método Euler-Cromer
-def paso_euler_cromer(cuerpo, otros_cuerpos, dt):
-    aceleracion = aceleracion_gravitacional(cuerpo, otros_cuerpos)  # Calcular la aceleración
-    cuerpo.velocidad += dt * aceleracion  # Actualizar la velocidad
-    cuerpo.posicion += dt * cuerpo.velocidad  # Actualizar la posición
-    cuerpo.posiciones.append(cuerpo.posicion.copy())  # Almacenar la posición actual
-
-# Simular el sistema solar durante un número de pasos
-def simular_sistema_solar(cuerpos_celestes, numero_pasos, dt):
-    todas_posiciones = {cuerpo.nombre: [] for cuerpo in cuerpos_celestes}  # Diccionario para almacenar posiciones
-
-    for paso in range(numero_pasos):
-        for cuerpo in cuerpos_celestes:
-            otros_cuerpos = [otro for otro in cuerpos_celestes if otro != cuerpo]
-            paso_euler_cromer(cuerpo, otros_cuerpos, dt)  # Usar el método Euler-Cromer
-            todas_posiciones[cuerpo.nombre].append(cuerpo.posicion.copy())
-
-    return todas_posiciones
-
-# Visualizar las órbitas de los cuerpos celestes
-def visualizar_orbitas(cuerpos_celestes, todas_posiciones, titulo):
-    figura = plt.figure(figsize=(12, 10))
-    eje = figura.add_subplot(111, projection='3d')
-    colores = ['yellow', 'grey', 'orange', 'blue', 'red', 'brown', 'pink', 'lightblue', 'green']
-
-    eje.scatter([0], [0], [0], color='yellow', label='Sol', marker='o', s=300)  # Representar el Sol
-
-    for i, cuerpo in enumerate(cuerpos_celestes):
-        posiciones = np.array(todas_posiciones[cuerpo.nombre])
-        eje.plot(posiciones[:, 0], posiciones[:, 1], posiciones[:, 2], label=f'Órbita de {cuerpo.nombre}', color=colores[i % len(colores)])
-
-    eje.set_xlabel("Posición en el eje x (m)")
-    eje.set_ylabel("Posición en el eje y (m)")
-    eje.set_zlabel("Posición en el eje z (m)")
-    eje.set_title(titulo)
-    eje.legend()
-    plt.show()
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
+from orbitas.visualizacion import COLORES_SISTEMA_INTERNO
 
 if __name__ == "__main__":
     # Definir los cuerpos celestes del sistema solar
@@ -178,9 +62,9 @@ if __name__ == "__main__":
     dt_inicial = 86400  # Un día en segundos
     numero_pasos = 365 * 20  # 20 años
 
-    todas_posiciones = simular_sistema_solar(cuerpos_celestes, numero_pasos, dt_inicial)
+    trayectoria = simular_sistema_solar(cuerpos_celestes, numero_pasos, dt_inicial, metodo="euler_cromer")
 
-    visualizar_orbitas(cuerpos_celestes, todas_posiciones, "Sistema Solar Interno")
+    visualizar_orbitas(cuerpos_celestes, trayectoria, "Sistema Solar Interno", colores=COLORES_SISTEMA_INTERNO, marcar_sol=True)
 
 
 # ### simulación del sistema solar externo con Euler Cromer 50 años
@@ -188,68 +72,8 @@ if __name__ == "__main__":
 # In[3]:
 
 
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Definición de la clase para representar un cuerpo celeste
-class CuerpoCeleste:
-    def __init__(self, nombre, masa, posicion, velocidad):
-        self.nombre = nombre  # Nombre del cuerpo celeste
-        self.masa = masa  # Masa del cuerpo
-        self.posicion = np.array(posicion, dtype=float)  # Posición inicial
-        self.velocidad = np.array(velocidad, dtype=float)  # Velocidad inicial
-        self.posiciones = []  # Lista para almacenar todas las posiciones durante la simulación
-
-# Función para calcular la aceleración gravitacional
-def aceleracion_gravitacional(cuerpo, otros_cuerpos):
-    G = 6.674 * (10**(-11))  # Constante gravitacional
-    fuerza_total = np.zeros(3)  # Fuerza total inicialmente en cero
-    for otro_cuerpo in otros_cuerpos:
-        if cuerpo != otro_cuerpo:
-            r = otro_cuerpo.posicion - cuerpo.posicion  # Vector de distancia
-            distancia = np.linalg.norm(r)  # Calcular la distancia
-            if distancia < 1e-10:  # Evitar división por cero
-                continue
-            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)
-            fuerza_total += magnitud_fuerza * r / distancia
-    return fuerza_total / cuerpo.masa
-
-# Implementación del paso Euler-Cromer para la simulación
-def paso_euler_cromer(cuerpo, otros_cuerpos, dt):
-    aceleracion = aceleracion_gravitacional(cuerpo, otros_cuerpos)  # Calcular la aceleración
-    cuerpo.velocidad += dt * aceleracion  # Actualizar la velocidad
-    cuerpo.posicion += dt * cuerpo.velocidad  # Actualizar la posición
-    cuerpo.posiciones.append(cuerpo.posicion.copy())  # Guardar la posición actual
-
-# Simular el sistema solar
-def simular_sistema_solar(cuerpos_celestes, num_pasos, dt):
-    todas_posiciones = {cuerpo.nombre: [] for cuerpo in cuerpos_celestes}
-    for paso in range(num_pasos):
-        for cuerpo in cuerpos_celestes:
-            otros_cuerpos = [otro for otro in cuerpos_celestes if otro != cuerpo]
-            paso_euler_cromer(cuerpo, otros_cuerpos, dt)
-            todas_posiciones[cuerpo.nombre].append(cuerpo.posicion.copy())
-    return todas_posiciones
-
-# Visualizar las órbitas de los cuerpos celestes
-def visualizar_orbitas(cuerpos_celestes, todas_posiciones, titulo):
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='3d')
-    colores = ['yellow', 'orange', 'brown', 'blue', 'grey']
-
-    ax.scatter([0], [0], [0], color='yellow', label='Sol', marker='o', s=300)  # Representar el Sol
-
-    for i, cuerpo in enumerate(cuerpos_celestes):
-        posiciones = np.array(todas_posiciones[cuerpo.nombre])
-        ax.plot(posiciones[:, 0], posiciones[:, 1], posiciones[:, 2], label=f'Órbita de {cuerpo.nombre}', color=colores[i % len(colores)])
-
-    ax.set_xlabel("Posición en el eje x (m)")
-    ax.set_ylabel("Posición en el eje y (m)")
-    ax.set_zlabel("Posición en el eje z (m)")
-    ax.set_title(titulo)
-    ax.legend()
-    plt.show()
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
+from orbitas.visualizacion import COLORES_SISTEMA_EXTERNO
 
 if __name__ == "__main__":
     # Crear los cuerpos celestes del sistema solar
@@ -264,9 +88,9 @@ if __name__ == "__main__":
     dt = 86400  # Un día en segundos
     num_pasos = 365 * 50  # 50 años
 
-    todas_posiciones = simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
+    trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt, metodo="euler_cromer")
 
-    visualizar_orbitas(cuerpos_celestes, todas_posiciones, "Órbitas de Júpiter a Neptuno (con el Sol)")
+    visualizar_orbitas(cuerpos_celestes, trayectoria, "Órbitas de Júpiter a Neptuno (con el Sol)", colores=COLORES_SISTEMA_EXTERNO, marcar_sol=True)
 
 
 # ### simulación del sistema solar externo con Euler Cromer 84 años
@@ -274,68 +98,8 @@ if __name__ == "__main__":
 # In[4]:
 
 
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Definición de la clase para representar un cuerpo celeste
-class CuerpoCeleste:
-    def __init__(self, nombre, masa, posicion, velocidad):
-        self.nombre = nombre  # Nombre del cuerpo celeste
-        self.masa = masa  # Masa del cuerpo
-        self.posicion = np.array(posicion, dtype=float)  # Posición inicial
-        self.velocidad = np.array(velocidad, dtype=float)  # Velocidad inicial
-        self.posiciones = []  # Lista para almacenar todas las posiciones durante la simulación
-
-# Función para calcular la aceleración gravitacional
-def aceleracion_gravitacional(cuerpo, otros_cuerpos):
-    G = 6.674 * (10**(-11))  # Constante gravitacional
-    fuerza_total = np.zeros(3)  # Fuerza total inicialmente en cero
-    for otro_cuerpo in otros_cuerpos:
-        if cuerpo != otro_cuerpo:
-            r = otro_cuerpo.posicion - cuerpo.posicion  # Vector de distancia
-            distancia = np.linalg.norm(r)  # Calcular la distancia
-            if distancia < 1e-10:  # Evitar división por cero
-                continue
-            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)
-            fuerza_total += magnitud_fuerza * r / distancia
-    return fuerza_total / cuerpo.masa
-
-# Implementación del paso Euler-Cromer para la simulación
-def paso_euler_cromer(cuerpo, otros_cuerpos, dt):
-    aceleracion = aceleracion_gravitacional(cuerpo, otros_cuerpos)  # Calcular la aceleración
-    cuerpo.velocidad += dt * aceleracion  # Actualizar la velocidad
-    cuerpo.posicion += dt * cuerpo.velocidad  # Actualizar la posición
-    cuerpo.posiciones.append(cuerpo.posicion.copy())  # Guardar la posición actual
-
-# Simular el sistema solar
-def simular_sistema_solar(cuerpos_celestes, num_pasos, dt):
-    todas_posiciones = {cuerpo.nombre: [] for cuerpo in cuerpos_celestes}
-    for paso in range(num_pasos):
-        for cuerpo in cuerpos_celestes:
-            otros_cuerpos = [otro for otro in cuerpos_celestes if otro != cuerpo]
-            paso_euler_cromer(cuerpo, otros_cuerpos, dt)
-            todas_posiciones[cuerpo.nombre].append(cuerpo.posicion.copy())
-    return todas_posiciones
-
-# Visualizar las órbitas de los cuerpos celestes
-def visualizar_orbitas(cuerpos_celestes, todas_posiciones, titulo):
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='3d')
-    colores = ['yellow', 'orange', 'brown', 'blue', 'grey']
-
-    ax.scatter([0], [0], [0], color='yellow', label='Sol', marker='o', s=300)  # Representar el Sol
-
-    for i, cuerpo in enumerate(cuerpos_celestes):
-        posiciones = np.array(todas_posiciones[cuerpo.nombre])
-        ax.plot(posiciones[:, 0], posiciones[:, 1], posiciones[:, 2], label=f'Órbita de {cuerpo.nombre}', color=colores[i % len(colores)])
-
-    ax.set_xlabel("Posición en el eje x (m)")
-    ax.set_ylabel("Posición en el eje y (m)")
-    ax.set_zlabel("Posición en el eje z (m)")
-    ax.set_title(titulo)
-    ax.legend()
-    plt.show()
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
+from orbitas.visualizacion import COLORES_SISTEMA_EXTERNO
 
 if __name__ == "__main__":
     # Crear los cuerpos celestes del sistema solar
@@ -350,9 +114,34 @@ if __name__ == "__main__":
     dt = 86400  # Un día en segundos
     num_pasos = 365 * 84  # 84 años
 
-    todas_posiciones = simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
+    trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt, metodo="euler_cromer")
 
-    visualizar_orbitas(cuerpos_celestes, todas_posiciones, "Órbitas de Júpiter a Neptuno (con el Sol)")
+    visualizar_orbitas(cuerpos_celestes, trayectoria, "Órbitas de Júpiter a Neptuno (con el Sol)", colores=COLORES_SISTEMA_EXTERNO, marcar_sol=True)
+
+
+# In[5]:
+
+
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
+from orbitas.visualizacion import COLORES_SISTEMA_EXTERNO
+
+if __name__ == "__main__":
+    cuerpos_celestes = [
+        CuerpoCeleste("Sol", 1.989 * (10**30), [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]),
+        CuerpoCeleste("Júpiter", 1.898 * (10**27), [778.5e9, 0.0, 0.0], [0.0, 13070.0, 0.0]),
+        CuerpoCeleste("Saturno", 5.683 * (10**26), [1433.5e9, 0.0, 0.0], [0.0, 9690.0, 0.0]),
+        CuerpoCeleste("Urano", 8.681 * (10**25), [2872.5e9, 0.0, 0.0], [0.0, 6800.0, 0.0]),
+        CuerpoCeleste("Neptuno", 1.024 * (10**26), [4495.1e9, 0.0, 0.0], [0.0, 5430.0, 0.0])
+    ]
+
+    # Wisdom-Holman: la órbita alrededor del Sol se resuelve exactamente y solo las interacciones entre planetas
+    # se aproximan, así que un paso de 100 días es más preciso que el Leapfrog con paso de diez días
+    dt = 86400 * 100  # 100 días en segundos
+    num_pasos = 365 * 500 // 100  # 500 años
+
+    trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt, metodo="wisdom_holman")
+
+    visualizar_orbitas(cuerpos_celestes, trayectoria, "Órbitas de Júpiter a Neptuno durante cinco siglos (Wisdom-Holman)", colores=COLORES_SISTEMA_EXTERNO, marcar_sol=True)
 
 
 # In[ ]:
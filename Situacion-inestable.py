@@ -6,68 +6,7 @@
 # In[1]:
 
 
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Clase para representar un cuerpo celeste
-class CuerpoCeleste:
-    def __init__(self, nombre, masa, posicion, velocidad):
-        self.nombre = nombre
-        self.masa = masa
-        self.posicion = np.array(posicion, dtype=float)  # Posición como un array
-        self.velocidad = np.array(velocidad, dtype=float)  # Velocidad como un array
-        self.velocidad_media = None
-        self.posiciones = []
-
-# Función para calcular la aceleración gravitacional
-def aceleracion_gravitacional(cuerpo, otros_cuerpos):
-    G = 6.674 * (10**(-11))
-    fuerza_total = np.zeros(3)
-    for otro_cuerpo in otros_cuerpos:
-        if cuerpo != otro_cuerpo:
-            r = otro_cuerpo.posicion - cuerpo.posicion
-            distancia = np.linalg.norm(r)
-            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)
-            fuerza_total += magnitud_fuerza * r / distancia
-    return fuerza_total / cuerpo.masa
-
-# Implementación del paso Leapfrog para la simulación
-def paso_leapfrog(cuerpo, otros_cuerpos, dt):
-    if cuerpo.velocidad_media is None:
-        aceleracion = aceleracion_gravitacional(cuerpo, otros_cuerpos)
-        cuerpo.velocidad_media = cuerpo.velocidad + 0.5 * dt * aceleracion
-
-    cuerpo.posicion += dt * cuerpo.velocidad_media
-    aceleracion_completa = aceleracion_gravitacional(cuerpo, otros_cuerpos)
-    cuerpo.velocidad = cuerpo.velocidad_media + 0.5 * dt * aceleracion_completa
-    cuerpo.velocidad_media += dt * aceleracion_completa
-
-    cuerpo.posiciones.append(cuerpo.posicion.copy())
-
-# Simular el sistema solar
-def simular_sistema_solar(cuerpos_celestes, num_pasos, dt):
-    for paso in range(num_pasos):
-        for cuerpo in cuerpos_celestes:
-            otros_cuerpos = [otro for otro in cuerpos_celestes if otro != cuerpo]
-            paso_leapfrog(cuerpo, otros_cuerpos, dt)
-
-# Visualizar las órbitas de los cuerpos celestes
-def visualizar_orbitas(cuerpos_celestes):
-    figura = plt.figure(figsize=(10, 8))
-    eje = figura.add_subplot(111, projection='3d')
-
-    for cuerpo in cuerpos_celestes:
-        posiciones = np.array(cuerpo.posiciones)
-        eje.plot(posiciones[:, 0], posiciones[:, 1], posiciones[:, 2], label=cuerpo.nombre)
-
-    eje.set_xlabel('X (m)')
-    eje.set_ylabel('Y (m)')
-    eje.set_zlabel('Z (m)')
-    eje.set_title('Órbitas del Sistema Solar')
-    eje.legend()
-
-    plt.show()
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
 
 # Datos de los planetas proporcionados por el usuario
 datos_cuerpos_celestes = {
@@ -103,10 +42,10 @@ dt = 86400  # Un día en segundos
 num_pasos = 365 * 10  # 10 años
 
 # Realizar la simulación
-simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
+trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
 
 # Visualizar las órbitas
-visualizar_orbitas(cuerpos_celestes)
+visualizar_orbitas(cuerpos_celestes, trayectoria)
 
 
 # ### Alpha centauri a como estrella pasajera usando leapfrog
@@ -114,61 +53,7 @@ visualizar_orbitas(cuerpos_celestes)
 # In[2]:
 
 
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Clase para representar un cuerpo celeste
-class CuerpoCeleste:
-    def __init__(self, nombre, masa, posicion, velocidad):
-        self.nombre = nombre
-        self.masa = masa
-        self.posicion = np.array(posicion, dtype=float)
-        self.velocidad = np.array(velocidad, dtype=float)
-        self.posiciones = []
-
-# Función para calcular la aceleración gravitacional
-def aceleracion_gravitacional(cuerpo, otros_cuerpos):
-    G = 6.674 * (10**(-11))
-    fuerza_total = np.zeros(3)
-    for otro_cuerpo in otros_cuerpos:
-        if cuerpo != otro_cuerpo:
-            r = otro_cuerpo.posicion - cuerpo.posicion
-            distancia = np.linalg.norm(r)
-            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)
-            fuerza_total += magnitud_fuerza * r / distancia
-    return fuerza_total / cuerpo.masa
-
-# Implementación del paso Euler-Cromer para la simulación
-def paso_euler_cromer(cuerpo, otros_cuerpos, dt):
-    aceleracion = aceleracion_gravitacional(cuerpo, otros_cuerpos)
-    cuerpo.velocidad += dt * aceleracion
-    cuerpo.posicion += dt * cuerpo.velocidad
-    cuerpo.posiciones.append(cuerpo.posicion.copy())
-
-# Simular el sistema solar
-def simular_sistema_solar(cuerpos_celestes, num_pasos, dt):
-    for paso in range(num_pasos):
-        for cuerpo in cuerpos_celestes:
-            otros_cuerpos = [otro for otro in cuerpos_celestes if otro != cuerpo]
-            paso_euler_cromer(cuerpo, otros_cuerpos, dt)
-
-# Visualizar las órbitas de los cuerpos celestes
-def visualizar_orbitas(cuerpos_celestes):
-    figura = plt.figure(figsize=(10, 8))
-    eje = figura.add_subplot(111, projection='3d')
-
-    for cuerpo in cuerpos_celestes:
-        posiciones = np.array(cuerpo.posiciones)
-        eje.plot(posiciones[:, 0], posiciones[:, 1], posiciones[:, 2], label=cuerpo.nombre)
-
-    eje.set_xlabel('X (m)')
-    eje.set_ylabel('Y (m)')
-    eje.set_zlabel('Z (m)')
-    eje.set_title('Órbitas del Sistema Solar')
-    eje.legend()
-
-    plt.show()
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
 
 # Datos de los planetas proporcionados por el usuario
 datos_cuerpos_celestes = {
@@ -204,10 +89,10 @@ dt = 86400  # Un día en segundos
 num_pasos = 365 * 10  # 10 años
 
 # Realizar la simulación
-simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
+trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt, metodo="euler_cromer")
 
 # Visualizar las órbitas
-visualizar_orbitas(cuerpos_celestes)
+visualizar_orbitas(cuerpos_celestes, trayectoria)
 
 
 # ### Super gigante roja como estrella pasajera usando leapfrog
@@ -215,68 +100,7 @@ visualizar_orbitas(cuerpos_celestes)
 # In[4]:
 
 
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Clase para representar un cuerpo celeste
-class CuerpoCeleste:
-    def __init__(self, nombre, masa, posicion, velocidad):
-        self.nombre = nombre
-        self.masa = masa
-        self.posicion = np.array(posicion, dtype=float)
-        self.velocidad = np.array(velocidad, dtype=float)
-        self.velocidad_media = None  # Velocidad media para el método Leapfrog
-        self.posiciones = []
-
-# Función para calcular la aceleración gravitacional
-def aceleracion_gravitacional(cuerpo, otros_cuerpos):
-    G = 6.674 * (10**(-11))
-    fuerza_total = np.zeros(3)
-    for otro_cuerpo in otros_cuerpos:
-        if cuerpo != otro_cuerpo:
-            r = otro_cuerpo.posicion - cuerpo.posicion
-            distancia = np.linalg.norm(r)
-            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)
-            fuerza_total += magnitud_fuerza * r / distancia
-    return fuerza_total / cuerpo.masa
-
-# Implementación del paso Leapfrog para la simulación
-def paso_leapfrog(cuerpo, otros_cuerpos, dt):
-    if cuerpo.velocidad_media is None:
-        aceleracion = aceleracion_gravitacional(cuerpo, otros_cuerpos)
-        cuerpo.velocidad_media = cuerpo.velocidad + 0.5 * dt * aceleracion
-
-    cuerpo.posicion += dt * cuerpo.velocidad_media
-    aceleracion_completa = aceleracion_gravitacional(cuerpo, otros_cuerpos)
-    cuerpo.velocidad = cuerpo.velocidad_media + 0.5 * dt * aceleracion_completa
-    cuerpo.velocidad_media += dt * aceleracion_completa
-
-    cuerpo.posiciones.append(cuerpo.posicion.copy())
-
-# Simular el sistema solar
-def simular_sistema_solar(cuerpos_celestes, num_pasos, dt):
-    for paso in range(num_pasos):
-        for cuerpo in cuerpos_celestes:
-            otros_cuerpos = [otro for otro in cuerpos_celestes if otro != cuerpo]
-            paso_leapfrog(cuerpo, otros_cuerpos, dt)
-
-# Visualizar las órbitas de los cuerpos celestes
-def visualizar_orbitas(cuerpos_celestes):
-    figura = plt.figure(figsize=(10, 8))
-    eje = figura.add_subplot(111, projection='3d')
-
-    for cuerpo in cuerpos_celestes:
-        posiciones = np.array(cuerpo.posiciones)
-        eje.plot(posiciones[:, 0], posiciones[:, 1], posiciones[:, 2], label=cuerpo.nombre)
-
-    eje.set_xlabel('X (m)')
-    eje.set_ylabel('Y (m)')
-    eje.set_zlabel('Z (m)')
-    eje.set_title('Órbitas del Sistema Solar')
-    eje.legend()
-
-    plt.show()
+from orbitas import CuerpoCeleste, simular_sistema_solar, visualizar_orbitas
 
 # Datos de los planetas proporcionados por el usuario
 datos_cuerpos_celestes = {
@@ -311,8 +135,108 @@ dt = 86400  # Un día en segundos
 num_pasos = 365 * 10  # 10 años
 
 # Realizar la simulación
-simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
+trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt)
 
 # Visualizar las órbitas
-visualizar_orbitas(cuerpos_celestes)
+visualizar_orbitas(cuerpos_celestes, trayectoria)
+
+
+
+# ### Alpha centauri a dispersando un cinturón de partículas de prueba
+
+# In[5]:
+
+
+from orbitas import SistemaCeleste, simular_sistema_solar, visualizar_orbitas
+from orbitas.escenarios import alpha_centauri_A, cinturon_particulas_prueba
+
+# Sistema solar con Alpha Centauri A como estrella pasajera
+cuerpos_celestes = alpha_centauri_A()
+sistema = SistemaCeleste.desde_cuerpos(cuerpos_celestes)
+
+# 100000 asteroides y cometas sin masa entre 2 y 40 UA: sienten al Sol, los planetas y la estrella, pero no atraen
+posiciones_particulas, velocidades_particulas = cinturon_particulas_prueba(100000, 2.0 * 1.496e11, 40.0 * 1.496e11)
+sistema.agregar_particulas(posiciones_particulas, velocidades_particulas)
+
+# Parámetros de la simulación
+dt = 86400  # Un día en segundos
+num_pasos = 365 * 10  # 10 años
+
+# Realizar la simulación (una muestra al año; el motor compilado se usa si Numba está instalado)
+trayectoria = simular_sistema_solar(sistema.cuerpos, num_pasos, dt, cada=365, motor="auto")
+
+# Visualizar las órbitas y la posición final de las partículas
+visualizar_orbitas(sistema.cuerpos, trayectoria, titulo='Partículas de prueba dispersadas por Alpha Centauri A')
+
+
+# ### Conjunto de 1000 variantes del paso de Alpha centauri a usando leapfrog
+
+# In[6]:
+
+
+import numpy as np
 
+from orbitas import ConjuntoSistemas, simular_conjunto, visualizar_orbitas
+from orbitas.escenarios import (alpha_centauri_A, masa_alpha_centauri_A, posicion_inicial_alpha_centauri_A,
+                                velocidad_alpha_centauri_A)
+
+# Variantes de la estrella pasajera: masa, parámetro de impacto (altura sobre el plano) y velocidad
+numero_variantes = 1000
+generador = np.random.default_rng(0)
+masas_estrella = masa_alpha_centauri_A * generador.uniform(0.5, 2.0, numero_variantes)
+posiciones_estrella = np.tile(posicion_inicial_alpha_centauri_A, (numero_variantes, 1))
+posiciones_estrella[:, 2] = generador.uniform(0.2, 3.0, numero_variantes) * 1.496e12  # Entre 2 y 30 UA en Z
+velocidades_estrella = np.tile(velocidad_alpha_centauri_A, (numero_variantes, 1))
+velocidades_estrella[:, 0] = -generador.uniform(2.0, 10.0, numero_variantes) * 1000  # Entre 2 y 10 km/s hacia -X
+
+conjunto = ConjuntoSistemas.desde_variantes(alpha_centauri_A(), "Alpha Centauri A", masas=masas_estrella,
+                                            posiciones=posiciones_estrella, velocidades=velocidades_estrella)
+
+# Parámetros de la simulación
+dt = 86400  # Un día en segundos
+num_pasos = 365 * 10  # 10 años
+
+# Integrar todas las variantes a la vez (una muestra al año)
+trayectorias = simular_conjunto(conjunto, num_pasos, dt, cada=365)
+
+# Distancia final de Neptuno al Sol en cada variante
+indice_sol, indice_neptuno = conjunto.nombres.index("Sol"), conjunto.nombres.index("Neptuno")
+distancia_neptuno = np.linalg.norm(conjunto.posiciones[:, indice_neptuno] - conjunto.posiciones[:, indice_sol], axis=1)
+print(f"Distancia final de Neptuno al Sol: mediana {np.median(distancia_neptuno) / 1.496e11:.2f} UA, "
+      f"máxima {distancia_neptuno.max() / 1.496e11:.2f} UA")
+
+# Visualizar la variante que más perturba a Neptuno
+variante = int(np.argmax(distancia_neptuno))
+visualizar_orbitas(conjunto.miembro(variante).cuerpos, trayectorias.miembro(variante),
+                   titulo=f'Variante {variante} de Alpha Centauri A')
+
+
+# ### Paso cercano de Alpha centauri a con paso de tiempo adaptativo
+
+# In[7]:
+
+
+import numpy as np
+
+from orbitas import simular_sistema_solar, visualizar_orbitas
+from orbitas.escenarios import estrella_pasajera, masa_alpha_centauri_A
+
+# Alpha Centauri A atravesando la región planetaria: 20 UA en X, 0.3 UA sobre el plano, 20 km/s
+cuerpos_celestes = estrella_pasajera("Alpha Centauri A", masa_alpha_centauri_A, [20.0 * 1.496e11, 0.0, 0.3 * 1.496e11],
+                                     [-20.0 * 1000, 0.0, 0.0])
+
+# Parámetros de la simulación: dt y cada fijan solo la rejilla de salida (una muestra cada 5 días); el paso crece
+# hasta dt_maximo en los tramos tranquilos y cerca del encuentro se reduce según la tolerancia
+dt = 86400  # Un día en segundos
+num_pasos = 365 * 3  # 3 años
+dt_maximo = 10 * dt
+
+# Realizar la simulación con paso de tiempo adaptativo
+trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt, cada=5, tolerancia=0.2, criterio="encuentros",
+                                    dt_maximo=dt_maximo)
+estadisticas = trayectoria.estadisticas
+print(f"{estadisticas['pasos']} pasos adaptativos frente a {num_pasos} con dt fijo de un día; "
+      f"dt entre {estadisticas['paso_minimo'] / 3600:.1f} h y {estadisticas['paso_maximo'] / 86400:.1f} días")
+
+# Visualizar las órbitas
+visualizar_orbitas(cuerpos_celestes, trayectoria, titulo='Paso cercano de Alpha Centauri A (dt adaptativo)')
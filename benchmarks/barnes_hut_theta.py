@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Error de Barnes-Hut frente a la suma directa según el ángulo de apertura theta
+# sobre un disco de planetesimales alrededor de una estrella (semilla fija)
+#
+#   python benchmarks/barnes_hut_theta.py [--cuerpos 5000] [--thetas 0.2 0.3 0.5 0.7 1.0] [--semilla 0]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orbitas import aceleraciones_sistema, error_frente_a_theta
+from orbitas.escenarios import disco_planetesimales
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Error de Barnes-Hut frente a la suma directa")
+    parser.add_argument("--cuerpos", type=int, default=5000, help="número de cuerpos (estrella incluida)")
+    parser.add_argument("--thetas", type=float, nargs="+", default=[0.2, 0.3, 0.5, 0.7, 1.0])
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args()
+
+    sistema = disco_planetesimales(argumentos.cuerpos - 1, argumentos.semilla)  # Estrella y un disco de 0.5 a 5 UA
+    posiciones, masas = sistema.posiciones, sistema.masas
+    inicio = time.perf_counter()
+    referencia = aceleraciones_sistema(posiciones, masas)
+    segundos_directo = time.perf_counter() - inicio
+    print(f"N = {argumentos.cuerpos}, suma directa: {segundos_directo:.3f} s")
+    print(f"{'theta':>6} {'error mediano':>14} {'percentil 99':>13} {'error máximo':>13} {'s':>8} {'aceleración':>11}")
+    for theta, mediano, percentil, maximo, segundos in error_frente_a_theta(posiciones, masas, argumentos.thetas,
+                                                                            referencia):
+        print(f"{theta:>6.2f} {mediano:>14.3e} {percentil:>13.3e} {maximo:>13.3e} {segundos:>8.3f} "
+              f"{segundos_directo / segundos:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
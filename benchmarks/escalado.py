@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Escalado con el número de cuerpos: tiempo de una evaluación de fuerzas y de un paso Leapfrog completo sobre un
+# disco sintético de planetesimales (orbitas.escenarios.disco_planetesimales), para cada solucionador de fuerzas y
+# motor, en función de N y del número de hilos, con los puntos de cruce entre solucionadores
+#
+#   python benchmarks/escalado.py [--cuerpos 10 100 1000 10000 100000] [--hilos 1 4] \
+#       [--solucionadores numpy/directo numpy/barnes_hut numba/directo] [--limite-segundos 2] \
+#       [--salida escalado.json] [--grafica escalado.png]
+#
+# Cada número de hilos se mide en un proceso nuevo con OMP/OpenBLAS/MKL/NUMBA_NUM_THREADS fijados antes de importar
+# NumPy (los bucles del motor son de un hilo: los hilos solo afectan a las bibliotecas que los usen). Un solucionador
+# deja de medirse cuando su paso supera --limite-segundos o cuando la extrapolación desde la N anterior (o la memoria
+# estimada de sus arreglos de pares) lo pasaría con creces.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from orbitas.motores import aceleraciones_numba, obtener_motor
+from orbitas.escenarios import disco_planetesimales
+from orbitas.fuerzas import obtener_nucleo
+
+VARIABLES_HILOS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMBA_NUM_THREADS")
+CUERPOS = [10, 30, 100, 300, 1000, 3000, 10000, 30000, 100000, 300000]
+DIA = 86400
+# Solucionadores "motor/núcleo" y exponente con el que crece su coste (para no lanzar casos que no terminarían)
+SOLUCIONADORES = {
+    "numpy/directo": 2.0,
+    "numpy/pares": 2.0,
+    "numpy/pares_escalar": 2.0,
+    "numpy/barnes_hut": 1.3,
+    "numba/directo": 2.0,
+}
+BYTES_POR_PAR = {"numpy/pares": 120}  # Memoria de los arreglos por par no ordenado (índices, vectores, pesos)
+SEGUNDOS_MINIMOS = 0.2  # Tiempo mínimo de cada medida: se repite la operación hasta alcanzarlo
+
+
+# Mejor tiempo por llamada de funcion(): se repite hasta sumar SEGUNDOS_MINIMOS (como timeit.autorange), dos veces
+def _cronometrar(funcion):
+    mejores = []
+    for _ in range(2):
+        repeticiones, inicio = 0, time.perf_counter()
+        while True:
+            funcion()
+            repeticiones += 1
+            segundos = time.perf_counter() - inicio
+            if segundos >= SEGUNDOS_MINIMOS:
+                break
+        mejores.append(segundos / repeticiones)
+        if segundos > 5 * SEGUNDOS_MINIMOS:  # Un caso lento no se repite
+            break
+    return min(mejores)
+
+
+# Función que evalúa las fuerzas del sistema con el solucionador (motor/núcleo)
+def _evaluacion_fuerzas(solucionador, sistema):
+    motor, nucleo = solucionador.split("/")
+    posiciones, masas = sistema.posiciones, sistema.masas
+    if motor == "numba":
+        aceleraciones = np.empty((sistema.numero_cuerpos, 3))
+        prueba = sistema.prueba
+        return lambda: aceleraciones_numba(posiciones, masas, prueba, aceleraciones)
+    funcion = obtener_nucleo(nucleo, sistema.prueba)
+    return lambda: funcion(posiciones, masas)
+
+
+# Medir fuerzas y paso de un solucionador con N planetesimales (más la estrella)
+def medir(solucionador, numero, semilla=0):
+    motor, nucleo = solucionador.split("/")
+    sistema = disco_planetesimales(numero, semilla)
+    fuerzas = _cronometrar(_evaluacion_fuerzas(solucionador, sistema))
+    motor_elegido = obtener_motor(motor, "leapfrog", nucleo)
+    motor_elegido.avanzar(sistema, 1, DIA, metodo="leapfrog", nucleo=nucleo)  # Abre el Leapfrog (y compila)
+    paso = _cronometrar(lambda: motor_elegido.avanzar(sistema, 1, DIA, metodo="leapfrog", nucleo=nucleo))
+    return {"solucionador": solucionador, "cuerpos": numero + 1, "segundos_fuerzas": fuerzas, "segundos_paso": paso}
+
+
+# Recorrer N para cada solucionador con el número de hilos ya fijado en este proceso
+def barrer(solucionadores, cuerpos, limite, memoria_maxima, hilos):
+    medir(solucionadores[0], 10)  # Calentamiento: importaciones y compilación fuera de las medidas
+    resultados = []
+    for solucionador in solucionadores:
+        anterior = None
+        for numero in sorted(cuerpos):
+            pares = numero * (numero + 1) / 2
+            if pares * BYTES_POR_PAR.get(solucionador, 0) > memoria_maxima:
+                break
+            if anterior is not None:
+                previsto = anterior["segundos_paso"] * (numero + 1) ** SOLUCIONADORES[solucionador] / \
+                    anterior["cuerpos"] ** SOLUCIONADORES[solucionador]
+                if previsto > 4 * limite:
+                    break
+            anterior = medir(solucionador, numero)
+            anterior["hilos"] = hilos
+            resultados.append(anterior)
+            print(f"{hilos:>5} {solucionador:<20} {numero + 1:>8} {anterior['segundos_fuerzas'] * 1e3:>12.3f} "
+                  f"{anterior['segundos_paso'] * 1e3:>12.3f}", flush=True)
+            if anterior["segundos_paso"] > limite:
+                break
+    return resultados
+
+
+# Cruces entre dos solucionadores: N (interpolada en escala logarítmica) donde cambia cuál es más rápido
+def cruces(resultados, clave="segundos_paso"):
+    series = {}
+    for resultado in resultados:
+        series.setdefault((resultado["hilos"], resultado["solucionador"]), {})[resultado["cuerpos"]] = resultado[clave]
+    encontrados = []
+    for (hilos_a, a), serie_a in series.items():
+        for (hilos_b, b), serie_b in series.items():
+            if hilos_a != hilos_b or a >= b:
+                continue
+            comunes = sorted(set(serie_a) & set(serie_b))
+            diferencias = [np.log(serie_a[n]) - np.log(serie_b[n]) for n in comunes]
+            for k in range(1, len(comunes)):
+                if diferencias[k - 1] * diferencias[k] < 0:
+                    fraccion = diferencias[k - 1] / (diferencias[k - 1] - diferencias[k])
+                    izquierda, derecha = np.log(comunes[k - 1]), np.log(comunes[k])
+                    cruce = float(np.exp(izquierda + fraccion * (derecha - izquierda)))
+                    rapido = a if diferencias[k] < 0 else b  # Más rápido a partir del cruce
+                    encontrados.append({"hilos": hilos_a, "solucionadores": [a, b], "cuerpos": cruce,
+                                        "mas_rapido_despues": rapido})
+    return encontrados
+
+
+# Tiempo por paso frente a N en escala logarítmica, una curva por solucionador e hilos, con los cruces marcados
+def graficar(resultados, encontrados, archivo):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figura, eje = plt.subplots(figsize=(10, 7))
+    series = {}
+    for resultado in resultados:
+        series.setdefault((resultado["hilos"], resultado["solucionador"]), []).append(resultado)
+    for (hilos, solucionador), serie in series.items():
+        eje.loglog([r["cuerpos"] for r in serie], [r["segundos_paso"] for r in serie], marker="o",
+                   label=f"{solucionador} ({hilos} hilos)")
+    for cruce in encontrados:
+        eje.axvline(cruce["cuerpos"], color="grey", linestyle=":", linewidth=1)
+        eje.annotate(f"{' / '.join(cruce['solucionadores'])}\nN ≈ {cruce['cuerpos']:.0f}", (cruce["cuerpos"], 1),
+                     xycoords=("data", "axes fraction"), rotation=90, fontsize=7, va="top", ha="right")
+    eje.set_xlabel("Número de cuerpos N")
+    eje.set_ylabel("Tiempo por paso Leapfrog (s)")
+    eje.set_title("Escalado del paso con N por solucionador de fuerzas")
+    eje.grid(True, which="both", alpha=0.3)
+    eje.legend(fontsize=8)
+    figura.savefig(archivo)
+    plt.close(figura)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Escalado del tiempo por paso con N, hilos y solucionador")
+    parser.add_argument("--cuerpos", type=int, nargs="+", default=CUERPOS, help="planetesimales (más la estrella)")
+    parser.add_argument("--hilos", type=int, nargs="+", default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument("--solucionadores", nargs="+", default=list(SOLUCIONADORES), choices=list(SOLUCIONADORES))
+    parser.add_argument("--limite-segundos", type=float, default=2.0, help="tiempo por paso a partir del cual se para")
+    parser.add_argument("--memoria-maxima-gb", type=float, default=2.0, help="memoria máxima de los arreglos de pares")
+    parser.add_argument("--salida", help="archivo JSON con las medidas y los cruces")
+    parser.add_argument("--grafica", help="archivo de la gráfica de tiempo por paso frente a N")
+    parser.add_argument("--proceso-hilos", type=int, help=argparse.SUPPRESS)
+    argumentos = parser.parse_args(argumentos)
+
+    memoria_maxima = argumentos.memoria_maxima_gb * 1024 ** 3
+    if argumentos.proceso_hilos is not None:  # Proceso hijo: un número de hilos, resultados en JSON al final
+        resultados = barrer(argumentos.solucionadores, argumentos.cuerpos, argumentos.limite_segundos, memoria_maxima,
+                            argumentos.proceso_hilos)
+        print(json.dumps(resultados))
+        return
+
+    print(f"{'hilos':>5} {'solucionador':<20} {'N':>8} {'fuerzas (ms)':>12} {'paso (ms)':>12}")
+    resultados = []
+    for hilos in argumentos.hilos:
+        entorno = dict(os.environ, **{variable: str(hilos) for variable in VARIABLES_HILOS})
+        orden = [sys.executable, os.path.abspath(__file__), "--proceso-hilos", str(hilos),
+                 "--limite-segundos", str(argumentos.limite_segundos),
+                 "--memoria-maxima-gb", str(argumentos.memoria_maxima_gb),
+                 "--cuerpos", *map(str, argumentos.cuerpos), "--solucionadores", *argumentos.solucionadores]
+        with subprocess.Popen(orden, env=entorno, stdout=subprocess.PIPE, text=True) as proceso:
+            for linea in proceso.stdout:  # Filas de la tabla según se miden; la última, los resultados en JSON
+                if linea.startswith("["):
+                    resultados.extend(json.loads(linea))
+                else:
+                    print(linea, end="", flush=True)
+        if proceso.returncode:
+            raise subprocess.CalledProcessError(proceso.returncode, orden)
+
+    encontrados = cruces(resultados)
+    print(f"\n{'hilos':>5} {'cruce':<42} {'N':>10}  más rápido después")
+    for cruce in encontrados:
+        print(f"{cruce['hilos']:>5} {' / '.join(cruce['solucionadores']):<42} {cruce['cuerpos']:>10.0f}  "
+              f"{cruce['mas_rapido_despues']}")
+    if argumentos.salida:
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump({"medidas": resultados, "cruces": encontrados}, archivo, ensure_ascii=False, indent=1)
+    if argumentos.grafica:
+        graficar(resultados, encontrados, argumentos.grafica)
+        print(f"Gráfica en {argumentos.grafica}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Comparación medida de los núcleos de fuerza por pares frente a la suma directa con difusión (broadcast)
+# en los escenarios de estrella pasajera de Situacion-inestable.py y en discos sintéticos de más cuerpos
+#
+#   python benchmarks/pares_fuerza.py [--pasos 3650] [--cuerpos 100 300 1000]
+#
+# En cada simulación el núcleo se envuelve en un contador que mide las llamadas reales y el tiempo pasado dentro
+# de él; la razón es el tiempo en el núcleo de "directo" dividido por el del núcleo medido (> 1: más rápido).
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orbitas import NUCLEOS, simular_sistema_solar
+from orbitas.escenarios import alpha_centauri_A, disco_planetesimales, super_gigante_roja
+
+NUCLEOS_DIRECTOS = ("directo", "pares", "pares_escalar")  # Suma exacta: mismas fuerzas, distinto trabajo
+SEGUNDOS_MINIMOS = 0.2  # Tiempo mínimo de medida de una evaluación suelta en los discos
+
+ESCENARIOS = {
+    "Alpha Centauri A": alpha_centauri_A,
+    "Super Gigante Roja": super_gigante_roja,
+}
+
+
+# Núcleo que cuenta sus llamadas y acumula el tiempo pasado dentro
+class NucleoMedido:
+    def __init__(self, nucleo):
+        self.nucleo = NUCLEOS[nucleo]
+        self.llamadas = 0
+        self.segundos = 0.0
+
+    def __call__(self, posiciones, masas):
+        inicio = time.perf_counter()
+        aceleraciones = self.nucleo(posiciones, masas)
+        self.segundos += time.perf_counter() - inicio
+        self.llamadas += 1
+        return aceleraciones
+
+
+# Mejor tiempo medio de una evaluación del núcleo sobre el sistema (repitiendo hasta SEGUNDOS_MINIMOS)
+def cronometrar(nucleo, sistema):
+    funcion = NUCLEOS[nucleo]
+    mejores = []
+    for _ in range(3):
+        repeticiones, inicio = 0, time.perf_counter()
+        while True:
+            funcion(sistema.posiciones, sistema.masas)
+            repeticiones += 1
+            segundos = time.perf_counter() - inicio
+            if segundos >= SEGUNDOS_MINIMOS:
+                break
+        mejores.append(segundos / repeticiones)
+    return min(mejores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo medido de los núcleos de fuerza por pares")
+    parser.add_argument("--pasos", type=int, default=365 * 10, help="pasos de un día por ejecución")
+    parser.add_argument("--cuerpos", type=int, nargs="*", default=[100, 300, 1000],
+                        help="planetesimales de los discos sintéticos (evaluaciones sueltas)")
+    argumentos = parser.parse_args()
+
+    dt = 86400  # Un día en segundos
+    print(f"{'escenario':<20} {'N':>5} {'núcleo':<14} {'llamadas':>9} {'s núcleo':>9} {'µs/llamada':>11} "
+          f"{'s total':>8} {'razón':>6}")
+    for nombre, construir in ESCENARIOS.items():
+        referencia = None
+        for nucleo in NUCLEOS_DIRECTOS:
+            cuerpos_celestes = construir()
+            medido = NucleoMedido(nucleo)
+            inicio = time.perf_counter()
+            simular_sistema_solar(cuerpos_celestes, argumentos.pasos, dt, nucleo=medido, cada=argumentos.pasos)
+            duracion = time.perf_counter() - inicio
+            referencia = referencia or medido.segundos
+            print(f"{nombre:<20} {len(cuerpos_celestes):>5} {nucleo:<14} {medido.llamadas:>9} "
+                  f"{medido.segundos:>9.3f} {1e6 * medido.segundos / medido.llamadas:>11.1f} {duracion:>8.3f} "
+                  f"{referencia / medido.segundos:>6.2f}")
+
+    for numero in argumentos.cuerpos:
+        sistema = disco_planetesimales(numero)
+        referencia = None
+        for nucleo in NUCLEOS_DIRECTOS:
+            segundos = cronometrar(nucleo, sistema)
+            referencia = referencia or segundos
+            print(f"{'disco':<20} {sistema.numero_cuerpos:>5} {nucleo:<14} {'':>9} {'':>9} {1e6 * segundos:>11.1f} "
+                  f"{'':>8} {referencia / segundos:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
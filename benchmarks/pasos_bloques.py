@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Pasos por bloques frente a un Leapfrog uniforme con el paso del nivel más profundo que usaron los bloques
+# (la misma resolución para los cuerpos más rápidos): tiempo, evaluaciones de fuerza y diferencia final
+#
+#   python benchmarks/pasos_bloques.py [--cuerpos 1000] [--repeticiones 3]
+#
+# "sistema solar" es la configuración de la antigua celda de Leapfrog.py (dt máximo de 64 días, tolerancia 0.07,
+# criterio "aceleracion", 20 años): el Sol cae al nivel de Mercurio, así que cada subpaso evalúa fuerzas igual que
+# un paso uniforme y los bloques no pueden ganar. En el disco la mayoría de los planetesimales quedan en niveles
+# poco profundos y se ahorran la mayor parte de las evaluaciones.
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orbitas import simular_sistema_solar
+from orbitas.escenarios import disco_planetesimales, sistema_solar_completo
+
+DIA = 86400.0
+UA = 1.496e11
+
+
+# Mejor tiempo de varias repeticiones y la trayectoria de la última
+def cronometrar(construir, repeticiones, num_pasos, dt, **opciones):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        cuerpos_celestes = construir()
+        inicio = time.perf_counter()
+        trayectoria = simular_sistema_solar(cuerpos_celestes, num_pasos, dt, cada=num_pasos, **opciones)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, trayectoria
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pasos por bloques frente a un Leapfrog uniforme")
+    parser.add_argument("--cuerpos", type=int, default=1000, help="planetesimales del disco")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    argumentos = parser.parse_args()
+
+    escenarios = {
+        "sistema solar": (sistema_solar_completo, 365 * 20 // 64, 64 * DIA, 0.07),
+        f"disco {argumentos.cuerpos}": (lambda: disco_planetesimales(argumentos.cuerpos).cuerpos, 5, 64 * DIA, 0.07),
+    }
+    print(f"{'escenario':<14} {'nivel':>5} {'s bloques':>10} {'s uniforme':>11} {'razón':>6} {'evaluaciones':>13} "
+          f"{'uniforme':>10} {'diferencia (UA)':>16}")
+    for nombre, (construir, num_pasos, dt, tolerancia) in escenarios.items():
+        segundos_bloques, bloques = cronometrar(construir, argumentos.repeticiones, num_pasos, dt, bloques=True,
+                                                tolerancia=tolerancia, criterio="aceleracion")
+        estadisticas = bloques.estadisticas
+        nivel = max(bloque["nivel"] for bloque in estadisticas["bloques"])
+        segundos_uniforme, uniforme = cronometrar(construir, 1, num_pasos << nivel, dt / (1 << nivel))
+        diferencia = np.abs(bloques.posiciones[-1] - uniforme.posiciones[-1]).max() / UA
+        print(f"{nombre:<14} {nivel:>5} {segundos_bloques:>10.3f} {segundos_uniforme:>11.3f} "
+              f"{segundos_uniforme / segundos_bloques:>6.2f} {estadisticas['evaluaciones']:>13} "
+              f"{estadisticas['evaluaciones_paso_uniforme']:>10} {diferencia:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
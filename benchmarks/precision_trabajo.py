@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Precisión frente a trabajo: error final de posición y de energía frente al tiempo de cálculo para cada
+# integrador y cada dt sobre un escenario, con una referencia IAS15 en el mismo instante final
+#
+#   python benchmarks/precision_trabajo.py [--escenario sistema_solar] [--anios 10] \
+#       [--dts-dias 0.25 0.5 1 2 4 8 16] [--metodos leapfrog euler_cromer ...] [--motor numpy] \
+#       [--csv precision_trabajo.csv] [--grafica precision_trabajo.png] [--tolerancia-ua 1e-3]
+#
+# Cada dt se ajusta para que un número entero de pasos llegue exactamente al tiempo final de la referencia.
+# Con --tolerancia-ua se indica, para cada método, el dt más barato cuyo error de posición cumple la tolerancia.
+# Wisdom-Holman se salta si el Sol no domina el escenario (estrella pasajera más masiva que él).
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orbitas import METODOS, MotorIAS15, SistemaCeleste, rivales_central, simular_sistema_solar
+from orbitas.motores import obtener_motor
+from orbitas.escenarios import (alpha_centauri_A, sistema_solar_completo, sistema_solar_externo, sistema_solar_interno,
+                                super_gigante_roja)
+
+UA = 1.496e11  # Unidad astronómica en metros
+DIA = 86400
+ESCENARIOS = {
+    "sistema_solar": sistema_solar_completo,
+    "sistema_interno": sistema_solar_interno,
+    "sistema_externo": sistema_solar_externo,
+    "alpha_centauri_A": alpha_centauri_A,
+    "super_gigante_roja": super_gigante_roja,
+}
+COLUMNAS = ("escenario", "metodo", "motor", "dt_dias", "pasos", "segundos", "error_posicion_ua", "error_energia")
+
+
+# Posiciones finales de referencia (IAS15, una sola salida en el tiempo final)
+# El primer paso interno es de un día: por defecto sería el dt de salida, todo el intervalo, y solo llegaría a la
+# precisión pedida tras varios rechazos
+def referencia(construir, tiempo_final):
+    cuerpos = construir()
+    simular_sistema_solar(cuerpos, 1, tiempo_final, motor=MotorIAS15(dt_inicial=DIA))
+    return cuerpos[0].sistema.posiciones.copy()
+
+
+# Ejecutar un método con un dt y medir el tiempo (el mejor de `repeticiones`) y los errores finales
+# El error de energía sale de los diagnósticos medidos solo al principio y al final (no cambian los pasos)
+def medir(construir, metodo, motor, dt_dias, tiempo_final, posiciones_referencia, repeticiones=1):
+    num_pasos = max(1, int(round(tiempo_final / (dt_dias * DIA))))
+    dt = tiempo_final / num_pasos
+    simular_sistema_solar(construir(), min(num_pasos, 10), dt, metodo=metodo, motor=motor)  # Calentamiento
+    segundos = []
+    for _ in range(repeticiones):
+        cuerpos = construir()
+        inicio = time.perf_counter()
+        with np.errstate(all="ignore"):  # Un dt demasiado grande puede divergir: queda como error infinito o NaN
+            trayectoria = simular_sistema_solar(cuerpos, num_pasos, dt, metodo=metodo, motor=motor, cada=num_pasos,
+                                                diagnosticos=num_pasos)
+        segundos.append(time.perf_counter() - inicio)
+    with np.errstate(all="ignore"):
+        error_posicion = np.linalg.norm(cuerpos[0].sistema.posiciones - posiciones_referencia, axis=1).max() / UA
+    return {"metodo": metodo, "motor": motor, "dt_dias": dt / DIA, "pasos": num_pasos, "segundos": min(segundos),
+            "error_posicion_ua": float(error_posicion),
+            "error_energia": float(abs(trayectoria.diagnosticos.deriva_energia[-1]))}
+
+
+# Para cada método, la medida más rápida con error de posición dentro de la tolerancia (None si ninguna)
+def mas_baratos(resultados, tolerancia):
+    elegidos = {}
+    for resultado in resultados:
+        if not resultado["error_posicion_ua"] <= tolerancia:
+            continue
+        actual = elegidos.get(resultado["metodo"])
+        if actual is None or resultado["segundos"] < actual["segundos"]:
+            elegidos[resultado["metodo"]] = resultado
+    return {metodo: elegidos.get(metodo) for metodo in dict.fromkeys(r["metodo"] for r in resultados)}
+
+
+# Curvas de precisión frente a trabajo: error de posición y de energía frente al tiempo, una curva por método
+def graficar(resultados, titulo, archivo, tolerancia=None):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figura, (eje_posicion, eje_energia) = plt.subplots(1, 2, figsize=(14, 6))
+    for metodo in dict.fromkeys(resultado["metodo"] for resultado in resultados):
+        serie = sorted((r for r in resultados if r["metodo"] == metodo and np.isfinite(r["error_posicion_ua"])),
+                       key=lambda r: r["segundos"])
+        if not serie:
+            continue
+        segundos = [r["segundos"] for r in serie]
+        eje_posicion.loglog(segundos, [max(r["error_posicion_ua"], 1e-16) for r in serie], marker="o", label=metodo)
+        eje_energia.loglog(segundos, [max(r["error_energia"], 1e-17) for r in serie], marker="o", label=metodo)
+    if tolerancia is not None:
+        eje_posicion.axhline(tolerancia, color="grey", linestyle="--", linewidth=1, label="tolerancia")
+    eje_posicion.set_ylabel("Error final de posición (UA)")
+    eje_energia.set_ylabel("Error relativo final de energía")
+    for eje in (eje_posicion, eje_energia):
+        eje.set_xlabel("Tiempo de cálculo (s)")
+        eje.grid(True, which="both", alpha=0.3)
+        eje.legend(fontsize=8)
+    figura.suptitle(titulo)
+    figura.savefig(archivo)
+    plt.close(figura)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Precisión frente a trabajo de cada integrador y dt")
+    parser.add_argument("--escenario", default="sistema_solar", choices=list(ESCENARIOS))
+    parser.add_argument("--anios", type=float, default=10.0)
+    parser.add_argument("--dts-dias", type=float, nargs="+", default=[0.25, 0.5, 1, 2, 4, 8, 16])
+    parser.add_argument("--metodos", nargs="+", default=list(METODOS), choices=list(METODOS))
+    parser.add_argument("--motor", default="numpy", help="motor de los métodos de paso fijo (numpy, numba, auto)")
+    parser.add_argument("--repeticiones", type=int, default=1, help="ejecuciones por punto (se toma la más rápida)")
+    parser.add_argument("--csv", default="precision_trabajo.csv", help="archivo CSV de resultados")
+    parser.add_argument("--grafica", help="archivo de la gráfica de precisión frente a trabajo")
+    parser.add_argument("--tolerancia-ua", type=float, help="error de posición admisible para elegir el dt más barato")
+    argumentos = parser.parse_args(argumentos)
+
+    construir = ESCENARIOS[argumentos.escenario]
+    tiempo_final = argumentos.anios * 365.25 * DIA
+    inicio = time.perf_counter()
+    posiciones_referencia = referencia(construir, tiempo_final)
+    print(f"Referencia IAS15 ({argumentos.escenario}, {argumentos.anios:g} años): {time.perf_counter() - inicio:.2f} s")
+
+    print(f"{'método':<14} {'dt (días)':>10} {'pasos':>8} {'s':>9} {'error posición (UA)':>20} {'error energía':>14}")
+    resultados = []
+    rivales = rivales_central(SistemaCeleste.desde_cuerpos(construir()))
+    for metodo in argumentos.metodos:
+        if not obtener_motor(argumentos.motor, metodo).admite(metodo, "directo"):
+            print(f"{metodo:<14} (el motor {argumentos.motor} no lo admite)")
+            continue
+        if metodo == "wisdom_holman" and rivales:
+            print(f"{metodo:<14} (el Sol no domina a {', '.join(rivales)})")
+            continue
+        for dt_dias in sorted(argumentos.dts_dias):
+            resultado = medir(construir, metodo, argumentos.motor, dt_dias, tiempo_final, posiciones_referencia,
+                              argumentos.repeticiones)
+            resultado["escenario"] = argumentos.escenario
+            resultados.append(resultado)
+            print(f"{metodo:<14} {resultado['dt_dias']:>10.4g} {resultado['pasos']:>8} {resultado['segundos']:>9.3f} "
+                  f"{resultado['error_posicion_ua']:>20.3e} {resultado['error_energia']:>14.3e}", flush=True)
+
+    with open(argumentos.csv, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=COLUMNAS)
+        escritor.writeheader()
+        escritor.writerows({columna: resultado[columna] for columna in COLUMNAS} for resultado in resultados)
+    print(f"Resultados en {argumentos.csv}")
+
+    if argumentos.tolerancia_ua is not None:
+        print(f"\nMás barato con error de posición <= {argumentos.tolerancia_ua:g} UA:")
+        for metodo, elegido in mas_baratos(resultados, argumentos.tolerancia_ua).items():
+            if elegido is None:
+                print(f"  {metodo:<14} ningún dt cumple")
+            else:
+                print(f"  {metodo:<14} dt = {elegido['dt_dias']:.4g} días, {elegido['segundos']:.3f} s, "
+                      f"error {elegido['error_posicion_ua']:.3e} UA")
+        elegidos = [elegido for elegido in mas_baratos(resultados, argumentos.tolerancia_ua).values() if elegido]
+        if elegidos:
+            mejor = min(elegidos, key=lambda elegido: elegido["segundos"])
+            print(f"  En conjunto: {mejor['metodo']} con dt = {mejor['dt_dias']:.4g} días ({mejor['segundos']:.3f} s)")
+    if argumentos.grafica:
+        graficar(resultados, f"Precisión frente a trabajo: {argumentos.escenario}, {argumentos.anios:g} años",
+                 argumentos.grafica, argumentos.tolerancia_ua)
+        print(f"Gráfica en {argumentos.grafica}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Trayectorias de referencia con IAS15 para cada escenario y error de Leapfrog y Euler-Cromer frente a ellas
+#
+#   python benchmarks/referencia_ias15.py [--anios 10] [--dt-dias 1] [--metodos leapfrog euler_cromer]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orbitas import METODOS, simular_sistema_solar
+from orbitas.escenarios import alpha_centauri_A, sistema_solar_completo, super_gigante_roja
+
+UA = 1.496e11  # Unidad astronómica en metros
+ESCENARIOS = {
+    "sistema_solar": sistema_solar_completo,
+    "alpha_centauri_A": alpha_centauri_A,
+    "super_gigante_roja": super_gigante_roja,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Error de los métodos de paso fijo frente a una referencia IAS15")
+    parser.add_argument("--anios", type=float, default=10.0)
+    parser.add_argument("--dt-dias", type=float, default=1.0, help="paso de los métodos comparados (y de salida)")
+    parser.add_argument("--metodos", nargs="+", default=["leapfrog", "euler_cromer"], choices=sorted(METODOS))
+    parser.add_argument("--cada", type=int, default=10, help="pasos entre muestras comparadas")
+    argumentos = parser.parse_args()
+
+    dt = argumentos.dt_dias * 86400
+    num_pasos = int(round(argumentos.anios * 365.25 / argumentos.dt_dias))
+    print(f"{'escenario':<20} {'método':<14} {'error máximo (UA)':>18} {'error final (UA)':>17} {'s':>8}")
+    for nombre, escenario in ESCENARIOS.items():
+        inicio = time.perf_counter()
+        referencia = simular_sistema_solar(escenario(), num_pasos, dt, cada=argumentos.cada, motor="ias15")
+        segundos = time.perf_counter() - inicio
+        print(f"{nombre:<20} {'ias15':<14} {'(referencia)':>18} {'':>17} {segundos:>8.2f}   "
+              f"{referencia.estadisticas['pasos']} pasos internos")
+        for metodo in argumentos.metodos:
+            inicio = time.perf_counter()
+            trayectoria = simular_sistema_solar(escenario(), num_pasos, dt, metodo=metodo, cada=argumentos.cada)
+            segundos = time.perf_counter() - inicio
+            error = np.linalg.norm(trayectoria.posiciones - referencia.posiciones, axis=2).max(axis=1) / UA
+            print(f"{nombre:<20} {metodo:<14} {error.max():>18.3e} {error[-1]:>17.3e} {segundos:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Suite de rendimiento sobre los escenarios del cuaderno: pasos por segundo, tiempo total, memoria máxima y error
+# final de energía para cada escenario, integrador y motor, con resultados en JSON y comparación con una base
+#
+#   python benchmarks/suite_escenarios.py [--escenarios ...] [--metodos ...] [--motores numpy numba] \
+#       [--fraccion 1.0] [--repeticiones 1] [--salida suite.json] [--comparar base.json --umbral 0.1]
+#
+# Cada caso se ejecuta en un proceso nuevo, así que la memoria máxima (RSS) es la de ese caso y no arrastra las
+# anteriores. Antes de medir se da una ejecución corta de calentamiento (compilación de Numba, cachés).
+# Con --comparar el programa termina con código 1 si algún caso pierde más de --umbral de pasos por segundo.
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from orbitas import METODOS, MotorNumba, SistemaCeleste, rivales_central, simular_sistema_solar
+from orbitas.escenarios import (alpha_centauri_A, sistema_solar_completo, sistema_solar_externo, sistema_solar_interno,
+                                super_gigante_roja)
+
+DIA = 86400  # Paso de un día, como en los escenarios del cuaderno
+UMBRAL = 0.10  # Pérdida relativa de pasos por segundo que se considera una regresión
+
+# Escenarios de FisicaComputacional: nombre -> (cuerpos, años)
+ESCENARIOS = {
+    "sistema_solar_10": (sistema_solar_completo, 10),
+    "sistema_interno_20": (sistema_solar_interno, 20),
+    "sistema_externo_50": (sistema_solar_externo, 50),
+    "sistema_externo_84": (sistema_solar_externo, 84),
+    "alpha_centauri_A_10": (alpha_centauri_A, 10),
+    "super_gigante_roja_10": (super_gigante_roja, 10),
+}
+MOTORES_SUITE = ("numpy", "numba", "ias15")
+
+
+# Casos (escenario, metodo, motor) a medir; el motor Numba solo con los métodos que compila, IAS15 (que no usa
+# método) una sola vez por escenario y Wisdom-Holman solo si el Sol domina (no con una estrella pasajera más masiva)
+def casos(escenarios, metodos, motores):
+    for escenario in escenarios:
+        construir, _ = ESCENARIOS[escenario]
+        sin_wisdom_holman = bool(rivales_central(SistemaCeleste.desde_cuerpos(construir())))
+        for motor in motores:
+            if motor == "ias15":
+                yield escenario, "ias15", motor
+                continue
+            for metodo in metodos:
+                if metodo == "wisdom_holman" and sin_wisdom_holman:
+                    continue
+                if motor != "numba" or MotorNumba().admite(metodo, "directo"):
+                    yield escenario, metodo, motor
+
+
+# Memoria residente máxima del proceso en MB (ru_maxrss está en KB en Linux y en bytes en macOS)
+def _memoria_maxima_mb():
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+
+# Medir un caso en este proceso: el mejor tiempo de `repeticiones` ejecuciones y el error final de energía
+def medir_caso(escenario, metodo, motor, fraccion=1.0, repeticiones=1):
+    construir, anios = ESCENARIOS[escenario]
+    num_pasos = max(1, int(round(365 * anios * fraccion)))
+    opciones = {"motor": motor} if motor == "ias15" else {"metodo": metodo, "motor": motor}
+    simular_sistema_solar(construir(), min(num_pasos, 10), DIA, **opciones)  # Calentamiento
+    tiempos = []
+    for _ in range(repeticiones):
+        cuerpos = construir()
+        inicio = time.perf_counter()
+        # Diagnósticos solo al principio y al final: no cambian los pasos y su coste es despreciable
+        trayectoria = simular_sistema_solar(cuerpos, num_pasos, DIA, diagnosticos=num_pasos, **opciones)
+        tiempos.append(time.perf_counter() - inicio)
+    segundos = min(tiempos)
+    return {
+        "escenario": escenario, "metodo": metodo, "motor": motor, "cuerpos": len(cuerpos), "pasos": num_pasos,
+        "segundos": segundos, "pasos_por_segundo": num_pasos / segundos,
+        "memoria_maxima_mb": _memoria_maxima_mb(),
+        "error_energia": float(abs(trayectoria.diagnosticos.deriva_energia[-1])),
+    }
+
+
+# Medir un caso en un proceso nuevo (el mismo programa con --caso) y devolver su resultado
+def medir_en_proceso(escenario, metodo, motor, fraccion, repeticiones):
+    orden = [sys.executable, os.path.abspath(__file__), "--caso", escenario, metodo, motor,
+             "--fraccion", str(fraccion), "--repeticiones", str(repeticiones)]
+    salida = subprocess.run(orden, capture_output=True, text=True, check=True).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+# Versiones y máquina con las que se midió, para interpretar una comparación entre archivos
+def entorno():
+    try:
+        import numba
+        version_numba = numba.__version__
+    except ImportError:
+        version_numba = None
+    return {"python": platform.python_version(), "numpy": np.__version__, "numba": version_numba,
+            "plataforma": platform.platform(), "procesador": platform.processor() or platform.machine(),
+            "nucleos": os.cpu_count()}
+
+
+# Comparar los pasos por segundo con una base: devuelve las líneas del informe y los casos que empeoran más del umbral
+def comparar(resultados, base, umbral=UMBRAL):
+    referencia = {(caso["escenario"], caso["metodo"], caso["motor"]): caso for caso in base["casos"]}
+    lineas, regresiones = [], []
+    for caso in resultados["casos"]:
+        clave = (caso["escenario"], caso["metodo"], caso["motor"])
+        if clave not in referencia:
+            lineas.append(f"{' / '.join(clave):<52} sin base")
+            continue
+        cociente = caso["pasos_por_segundo"] / referencia[clave]["pasos_por_segundo"]
+        regresion = cociente < 1 - umbral
+        if regresion:
+            regresiones.append(clave)
+        lineas.append(f"{' / '.join(clave):<52} {cociente:>7.3f}x{'  REGRESIÓN' if regresion else ''}")
+    return lineas, regresiones
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Rendimiento de los escenarios por integrador y motor")
+    parser.add_argument("--escenarios", nargs="+", default=list(ESCENARIOS), choices=list(ESCENARIOS))
+    parser.add_argument("--metodos", nargs="+", default=list(METODOS), choices=list(METODOS))
+    parser.add_argument("--motores", nargs="+", default=["numpy", "numba"], choices=MOTORES_SUITE)
+    parser.add_argument("--fraccion", type=float, default=1.0,
+                        help="fracción de los años de cada escenario que se simula (p. ej. 0.1 para una prueba rápida)")
+    parser.add_argument("--repeticiones", type=int, default=1, help="ejecuciones por caso (se toma la más rápida)")
+    parser.add_argument("--salida", default="suite_escenarios.json", help="archivo JSON de resultados")
+    parser.add_argument("--comparar", metavar="BASE", help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--umbral", type=float, default=UMBRAL,
+                        help="pérdida relativa de pasos/s que falla la comparación (por defecto 0.10)")
+    parser.add_argument("--caso", nargs=3, metavar=("ESCENARIO", "METODO", "MOTOR"), help=argparse.SUPPRESS)
+    argumentos = parser.parse_args(argumentos)
+
+    if argumentos.caso:  # Proceso hijo: un solo caso, resultado en JSON por la salida estándar
+        print(json.dumps(medir_caso(*argumentos.caso, argumentos.fraccion, argumentos.repeticiones)))
+        return 0
+
+    resultados = {"entorno": entorno(), "fraccion": argumentos.fraccion, "casos": []}
+    print(f"{'escenario':<22} {'método':<14} {'motor':<6} {'pasos':>6} {'s':>8} {'pasos/s':>10} {'MB':>7} "
+          f"{'error energía':>14}")
+    for escenario, metodo, motor in casos(argumentos.escenarios, argumentos.metodos, argumentos.motores):
+        caso = medir_en_proceso(escenario, metodo, motor, argumentos.fraccion, argumentos.repeticiones)
+        resultados["casos"].append(caso)
+        print(f"{escenario:<22} {metodo:<14} {motor:<6} {caso['pasos']:>6} {caso['segundos']:>8.3f} "
+              f"{caso['pasos_por_segundo']:>10.0f} {caso['memoria_maxima_mb']:>7.1f} {caso['error_energia']:>14.3e}")
+    with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, ensure_ascii=False, indent=1)
+    print(f"Resultados en {argumentos.salida}")
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        lineas, regresiones = comparar(resultados, base, argumentos.umbral)
+        print(f"\nPasos/s frente a {argumentos.comparar} (regresión: < {1 - argumentos.umbral:.2f}x)")
+        print("\n".join(lineas))
+        if regresiones:
+            print(f"{len(regresiones)} casos con regresión de rendimiento")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Tiempo de importación (ms) de los módulos del motor, medido en procesos nuevos
+#
+#   python benchmarks/tiempo_importacion.py [--repeticiones 5] [--modulos orbitas FisicaComputacional]
+
+import argparse
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROGRAMA = ("import time; inicio = time.perf_counter(); import {modulo}; "
+            "print((time.perf_counter() - inicio) * 1000)")
+
+
+# Milisegundos que tarda `import modulo` en un intérprete nuevo (sin módulos en caché), una vez por repetición
+def tiempos_importacion(modulo, repeticiones=5):
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [RAIZ, os.environ.get("PYTHONPATH")])))
+    tiempos = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", PROGRAMA.format(modulo=modulo)], cwd=RAIZ, env=entorno,
+                                capture_output=True, text=True, check=True).stdout
+        tiempos.append(float(salida.strip().splitlines()[-1]))
+    return tiempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de importación de los módulos del motor")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--modulos", nargs="+", default=["numpy", "orbitas", "FisicaComputacional"])
+    argumentos = parser.parse_args()
+
+    print(f"{'módulo':<22} {'mediana (ms)':>13} {'mínimo (ms)':>12}")
+    for modulo in argumentos.modulos:
+        tiempos = tiempos_importacion(modulo, argumentos.repeticiones)
+        print(f"{modulo:<22} {np.median(tiempos):>13.1f} {min(tiempos):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+# Motor de simulación de órbitas planetarias
+
+from .fuerzas import (G, DISTANCIA_MINIMA, NUCLEOS, aceleracion_gravitacional, aceleraciones_sistema,
+                      aceleraciones_cuerpos, aceleraciones_pares, aceleraciones_pares_escalar, campo_gravitatorio,
+                      con_particulas_prueba)
+from .sistema import SistemaCeleste, CuerpoCeleste
+from .trayectoria import Trayectoria
+from .disco import TrayectoriaDisco, abrir_trayectoria
+from .integradores import (METODOS, paso_leapfrog, paso_euler_cromer, paso_compuesto, paso_yoshida4, paso_yoshida6,
+                          paso_forest_ruth)
+from .wisdom_holman import paso_wisdom_holman, avanzar_wisdom_holman, deriva_kepler, indice_central, rivales_central
+from .motores import MOTORES, NUMBA_DISPONIBLE, MotorNumpy, MotorNumba, aceleraciones_numba
+from .adaptativo import MotorAdaptativo, escalas_de_tiempo, escalas_por_cuerpo
+from .bloques import MotorBloques
+from .ias15 import MotorIAS15
+from .barnes_hut import Octree, BarnesHut, error_frente_a_theta
+from .diagnosticos import Diagnosticos, cantidades_conservadas, energia, momento_angular, momento_lineal
+from .instrumentacion import Fases, perfilar, pilas_colapsadas
+from .simulacion import Simulacion, simular_sistema_solar, reanudar_simulacion
+from .puntos_control import guardar_punto_control, cargar_punto_control
+from .conjunto import ConjuntoSistemas, TrayectoriaConjunto, aceleraciones_conjunto, simular_conjunto
+from .visualizacion import visualizar_orbitas, modo_sin_ventanas
@@ -0,0 +1,130 @@
+# Paso de tiempo global adaptativo: dt se elige en cada paso a partir de una tolerancia
+
+import numpy as np
+
+from .fuerzas import G, obtener_nucleo
+from .integradores import METODOS, obtener_metodo
+
+
+# Escalas de tiempo más cortas de cada cuerpo (o de los objetivos indicados) frente a los cuerpos masivos
+# caida: tiempo de caída libre del par sqrt(d³ / G (m_i + m_j)), es decir sqrt(d / |a_relativa|)
+# cruce: tiempo que tardaría el par en recorrer su separación a la velocidad relativa actual, d / |v_relativa|
+def escalas_por_cuerpo(posiciones, velocidades, masas, prueba=None, objetivos=None):
+    masivos = np.flatnonzero(masas > 0) if prueba is None else np.flatnonzero(~prueba)
+    if objetivos is None:
+        objetivos = slice(None)
+    r = posiciones[np.newaxis, objetivos, :] - posiciones[masivos, np.newaxis, :]  # (K, N, 3)
+    v = velocidades[np.newaxis, objetivos, :] - velocidades[masivos, np.newaxis, :]
+    distancia = np.sqrt(np.einsum('knd,knd->kn', r, r))
+    rapidez = np.sqrt(np.einsum('knd,knd->kn', v, v))
+    masa_par = masas[masivos, np.newaxis] + masas[np.newaxis, objetivos]
+    distancia[distancia == 0] = np.inf  # Cada cuerpo consigo mismo (y cuerpos coincidentes, como en las fuerzas)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        caida = np.sqrt(distancia ** 3 / (G * masa_par))
+        cruce = distancia / rapidez
+    return np.nanmin(caida, axis=0, initial=np.inf), np.nanmin(cruce, axis=0, initial=np.inf)
+
+
+# Escalas de tiempo más cortas de todo el sistema (caida, cruce)
+def escalas_de_tiempo(posiciones, velocidades, masas, prueba=None):
+    caida, cruce = escalas_por_cuerpo(posiciones, velocidades, masas, prueba)
+    return float(caida.min(initial=np.inf)), float(cruce.min(initial=np.inf))
+
+
+# Criterios para elegir dt = tolerancia * escala
+# "aceleracion": solo el tiempo de caída libre; "encuentros": además el tiempo de cruce (acercamientos rápidos)
+CRITERIOS = {
+    "aceleracion": lambda caida, cruce: caida,
+    "encuentros": np.minimum,
+}
+
+
+# Motor con paso de tiempo global adaptativo (cualquier método de METODOS)
+# Integra hasta sistema.tiempo + num_pasos * dt; el último paso se recorta para terminar exactamente en el tiempo final.
+# Sin dt_maximo, dt es también el paso máximo y la trayectoria registra el tiempo y la duración de cada paso (cada
+# paso interno cuenta como un paso del sistema). Con dt_maximo, dt solo fija la rejilla de salida como en IAS15: los
+# pasos pueden llegar a dt_maximo en los tramos tranquilos, se recortan para caer exactamente en cada muestra
+# registrada (cada `cada` pasos de dt) y sistema.numero_paso cuenta pasos de dt, no pasos internos.
+# Las estadísticas (pasos internos y paso más corto y más largo) se acumulan en todos los avances del motor hasta
+# reiniciar_estadisticas(), como en los motores de bloques e IAS15.
+class MotorAdaptativo:
+    nombre = "adaptativo"
+    pasos_variables = True  # El número de pasos no se conoce de antemano: la trayectoria debe poder crecer
+
+    def __init__(self, tolerancia=0.02, criterio="encuentros", dt_minimo=1.0, dt_maximo=None):
+        if criterio not in CRITERIOS:
+            raise ValueError(f"Criterio desconocido: {criterio!r} (disponibles: {', '.join(CRITERIOS)})")
+        self.tolerancia = tolerancia
+        self.criterio = criterio
+        self.dt_minimo = dt_minimo
+        self.dt_maximo = dt_maximo  # Paso máximo independiente de la rejilla de salida (None: el dt de salida)
+        self.pasos_dados = 0  # Pasos internos del último avance
+        self.contadores = None  # Contadores acumulados (serializables en JSON) de los que salen las estadísticas
+
+    def reiniciar_estadisticas(self):
+        self.contadores = None
+
+    @property
+    def estadisticas(self):
+        return None if self.contadores is None else dict(self.contadores)
+
+    def admite(self, metodo, nucleo):
+        return metodo in METODOS
+
+    # Paso de tiempo para el estado actual del sistema, entre dt_minimo y dt_maximo
+    def elegir_dt(self, sistema, dt_maximo):
+        caida, cruce = escalas_de_tiempo(sistema.posiciones, sistema.velocidades, sistema.masas, sistema.prueba)
+        dt = self.tolerancia * CRITERIOS[self.criterio](caida, cruce)
+        return min(dt_maximo, max(self.dt_minimo, dt))
+
+    # Dar un paso adaptativo sin pasar de tiempo_final (el que llega se ajusta a él exactamente); devuelve su duración
+    # Si quedan entre uno y dos pasos se reparte en dos iguales para no dejar un paso final diminuto
+    def _paso(self, sistema, paso, aceleraciones, dt_maximo, tiempo_final):
+        restante = tiempo_final - sistema.tiempo
+        dt_paso = self.elegir_dt(sistema, dt_maximo)
+        ultimo = dt_paso >= restante
+        if ultimo:
+            dt_paso = restante
+        elif self.dt_maximo is not None and 2 * dt_paso > restante:
+            dt_paso = 0.5 * restante
+        paso(sistema, dt_paso, aceleraciones)
+        sistema.tiempo = tiempo_final if ultimo else sistema.tiempo + dt_paso
+        self.pasos_dados += 1
+        contadores = self.contadores
+        contadores["pasos"] += 1
+        contadores["paso_minimo"] = min(contadores["paso_minimo"] or dt_paso, dt_paso)
+        contadores["paso_maximo"] = max(contadores["paso_maximo"] or dt_paso, dt_paso)
+        return dt_paso
+
+    def avanzar(self, sistema, num_pasos, dt, metodo="leapfrog", nucleo="directo", trayectoria=None):
+        if not self.admite(metodo, nucleo):
+            raise ValueError(f"El paso adaptativo no admite metodo={metodo!r}")
+        paso = obtener_metodo(metodo)
+        aceleraciones = obtener_nucleo(nucleo, sistema.prueba)
+        self.pasos_dados = 0
+        if self.contadores is None:
+            self.contadores = {"pasos": 0, "paso_minimo": None, "paso_maximo": None}
+        if self.dt_maximo is None:
+            tiempo_final = sistema.tiempo + num_pasos * dt
+            while sistema.tiempo < tiempo_final:
+                dt_paso = self._paso(sistema, paso, aceleraciones, dt, tiempo_final)
+                sistema.numero_paso += 1
+                if trayectoria is not None:
+                    trayectoria.registrar(sistema.numero_paso, sistema.tiempo, sistema, dt_paso)
+        elif num_pasos > 0:
+            self._avanzar_en_rejilla(sistema, num_pasos, dt, paso, aceleraciones, trayectoria)
+        if trayectoria is not None:
+            trayectoria.estadisticas = self.estadisticas
+
+    # Avance con dt_maximo: paradas exactas en los pasos de dt que se registran y al final
+    def _avanzar_en_rejilla(self, sistema, num_pasos, dt, paso, aceleraciones, trayectoria):
+        cada = trayectoria.cada if trayectoria is not None else num_pasos
+        tiempo_inicial, paso_inicial = sistema.tiempo, sistema.numero_paso
+        relativo = paso_inicial - (trayectoria.paso_inicial if trayectoria is not None else paso_inicial)
+        for parada in list(range(cada - relativo % cada, num_pasos, cada)) + [num_pasos]:
+            tiempo_parada = tiempo_inicial + parada * dt
+            while sistema.tiempo < tiempo_parada:
+                dt_paso = self._paso(sistema, paso, aceleraciones, self.dt_maximo, tiempo_parada)
+            sistema.numero_paso = paso_inicial + parada
+            if trayectoria is not None:
+                trayectoria.registrar(sistema.numero_paso, sistema.tiempo, sistema, dt_paso)
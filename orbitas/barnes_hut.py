@@ -0,0 +1,161 @@
+# Solver de gravedad Barnes-Hut: octree lineal (orden de Morton) construido y recorrido de forma vectorizada
+
+import time
+
+import numpy as np
+
+from .fuerzas import DISTANCIA_MINIMA, G, aceleraciones_sistema
+
+NIVEL_MAXIMO = 21  # 21 bits por eje caben en una clave de Morton de 64 bits
+OBJETIVOS_POR_BLOQUE = 2048  # Cuerpos recorridos a la vez (acota la memoria de los pares cuerpo-nodo)
+
+
+# Separar los 21 bits bajos de cada entero para intercalarlos con los de los otros dos ejes
+def _separar_bits(valores):
+    valores = valores.astype(np.uint64) & np.uint64(0x1FFFFF)
+    valores = (valores | (valores << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    valores = (valores | (valores << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    valores = (valores | (valores << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    valores = (valores | (valores << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    valores = (valores | (valores << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return valores
+
+
+# Claves de Morton de las posiciones dentro del cubo raíz (origen, lado)
+def claves_morton(posiciones, origen, lado):
+    celdas = 1 << NIVEL_MAXIMO
+    enteros = np.floor((posiciones - origen) / lado * celdas)
+    enteros = np.clip(enteros, 0, celdas - 1).astype(np.uint64)
+    return (_separar_bits(enteros[:, 0]) << np.uint64(2)) | (_separar_bits(enteros[:, 1]) << np.uint64(1)) | _separar_bits(enteros[:, 2])
+
+
+# Octree lineal: los nodos de cada nivel son los prefijos distintos de las claves ordenadas,
+# así que los cuerpos de un nodo ocupan un tramo contiguo [inicio, fin) del orden de Morton
+class Octree:
+    def __init__(self, posiciones, masas):
+        posiciones = np.asarray(posiciones, dtype=float)
+        masas = np.asarray(masas, dtype=float)
+        minimo, maximo = posiciones.min(axis=0), posiciones.max(axis=0)
+        lado = float((maximo - minimo).max()) * (1 + 1e-9) or 1.0
+        origen = 0.5 * (minimo + maximo) - 0.5 * lado
+        claves = claves_morton(posiciones, origen, lado)
+        self.orden = np.argsort(claves, kind='stable')  # Índice original de cada cuerpo en orden de Morton
+        self.posicion_ordenada = np.empty(len(masas), dtype=np.int64)  # Posición de cada cuerpo en ese orden
+        self.posicion_ordenada[self.orden] = np.arange(len(masas))
+        claves = claves[self.orden]
+        posiciones_ordenadas = posiciones[self.orden]
+        masas_ordenadas = masas[self.orden]
+        momentos = masas_ordenadas[:, np.newaxis] * posiciones_ordenadas
+
+        niveles = []
+        nivel = 0
+        while True:
+            prefijos = claves >> np.uint64(3 * (NIVEL_MAXIMO - nivel))
+            inicios = np.flatnonzero(np.concatenate(([True], prefijos[1:] != prefijos[:-1])))
+            niveles.append((nivel, inicios))
+            numero = np.diff(np.append(inicios, len(claves)))
+            if numero.max() == 1 or nivel == NIVEL_MAXIMO:
+                break
+            nivel += 1
+        ultimo_numero = np.diff(np.append(niveles[-1][1], len(claves)))
+        if ultimo_numero.max() > 1:  # Cuerpos coincidentes al nivel máximo: un nivel final con un cuerpo por nodo
+            niveles.append((NIVEL_MAXIMO, np.arange(len(claves))))
+
+        inicio_nivel = np.cumsum([0] + [len(inicios) for _, inicios in niveles])
+        self.numero_nodos = int(inicio_nivel[-1])
+        self.inicio = np.concatenate([inicios for _, inicios in niveles])
+        self.fin = np.concatenate([np.append(inicios[1:], len(claves)) for _, inicios in niveles])
+        self.tamano = np.concatenate([np.full(len(inicios), lado / (1 << nivel)) for nivel, inicios in niveles])
+        self.masa = np.concatenate([np.add.reduceat(masas_ordenadas, inicios) for _, inicios in niveles])
+        momento = np.concatenate([np.add.reduceat(momentos, inicios, axis=0) for _, inicios in niveles])
+        suma_posiciones = np.concatenate([np.add.reduceat(posiciones_ordenadas, inicios, axis=0) for _, inicios in niveles])
+        numero = (self.fin - self.inicio)[:, np.newaxis]
+        # Centro de masas (o centro geométrico de los cuerpos si la masa del nodo es nula)
+        self.centro = np.divide(momento, self.masa[:, np.newaxis], out=suma_posiciones / numero,
+                                where=self.masa[:, np.newaxis] > 0)
+        self.es_hoja = (self.fin - self.inicio) == 1
+        self.centro[self.es_hoja] = posiciones_ordenadas[self.inicio[self.es_hoja]]  # Exacto: m * x / m redondea
+
+        # Hijos de cada nodo: tramo de nodos del nivel siguiente que reparten sus cuerpos
+        self.hijo_inicio = np.zeros(self.numero_nodos, dtype=np.int64)
+        self.hijo_fin = np.zeros(self.numero_nodos, dtype=np.int64)
+        for k in range(len(niveles) - 1):
+            inicios_hijos = niveles[k + 1][1]
+            a, b = inicio_nivel[k], inicio_nivel[k + 1]
+            self.hijo_inicio[a:b] = b + np.searchsorted(inicios_hijos, self.inicio[a:b])
+            self.hijo_fin[a:b] = b + np.searchsorted(inicios_hijos, self.fin[a:b])
+
+    # Aceleraciones de objetivos (índices originales) con el criterio de apertura tamaño / distancia < theta
+    # Se recorre el árbol en anchura sobre todos los pares (cuerpo, nodo) de un bloque de objetivos a la vez
+    def aceleraciones(self, posiciones, theta, objetivos=None, distancia_minima=DISTANCIA_MINIMA,
+                      objetivos_por_bloque=OBJETIVOS_POR_BLOQUE):
+        numero_cuerpos = len(posiciones)
+        if objetivos is None:
+            objetivos = np.arange(numero_cuerpos)
+        aceleraciones = np.empty((len(objetivos), 3))
+        for inicio in range(0, len(objetivos), objetivos_por_bloque):
+            bloque = objetivos[inicio:inicio + objetivos_por_bloque]
+            aceleraciones[inicio:inicio + len(bloque)] = self._aceleraciones_bloque(posiciones, theta, bloque, distancia_minima)
+        return aceleraciones
+
+    def _aceleraciones_bloque(self, posiciones, theta, objetivos, distancia_minima):
+        aceleraciones = np.zeros((len(objetivos), 3))
+        # Posición de cada objetivo en el orden de Morton (-1 si no forma parte del árbol)
+        if len(self.posicion_ordenada) == len(posiciones):
+            ordenado = self.posicion_ordenada[objetivos]
+        else:
+            ordenado = np.full(len(objetivos), -1)
+        fila = np.arange(len(objetivos))
+        nodo = np.zeros(len(objetivos), dtype=np.int64)
+        theta_cuadrado = theta * theta
+        while len(fila):
+            r = self.centro[nodo] - posiciones[objetivos[fila]]
+            distancia_cuadrada = np.einsum('pk,pk->p', r, r)
+            contiene = (self.inicio[nodo] <= ordenado[fila]) & (ordenado[fila] < self.fin[nodo])
+            aceptar = self.es_hoja[nodo] | (~contiene & (self.tamano[nodo] ** 2 < theta_cuadrado * distancia_cuadrada))
+            # Contribución monopolar de los nodos aceptados (se omite el propio cuerpo y los coincidentes)
+            validos = aceptar & ~contiene & (distancia_cuadrada >= distancia_minima ** 2)
+            distancia = np.sqrt(distancia_cuadrada[validos])
+            peso = G * self.masa[nodo[validos]] / (distancia_cuadrada[validos] * distancia)
+            for eje in range(3):
+                aceleraciones[:, eje] += np.bincount(fila[validos], weights=peso * r[validos, eje], minlength=len(objetivos))
+            # Abrir los nodos rechazados: un par nuevo por cada hijo
+            abrir = ~aceptar
+            nodo_abierto, fila_abierta = nodo[abrir], fila[abrir]
+            hijos = self.hijo_fin[nodo_abierto] - self.hijo_inicio[nodo_abierto]
+            fila = np.repeat(fila_abierta, hijos)
+            desplazamiento = np.arange(len(fila)) - np.repeat(np.cumsum(hijos) - hijos, hijos)
+            nodo = np.repeat(self.hijo_inicio[nodo_abierto], hijos) + desplazamiento
+        return aceleraciones
+
+
+# Núcleo de fuerza Barnes-Hut con ángulo de apertura configurable; el árbol se reconstruye en cada llamada
+# Se usa como nucleo= en simular_sistema_solar: nucleo=BarnesHut(theta=0.5)
+class BarnesHut:
+    def __init__(self, theta=0.5, distancia_minima=DISTANCIA_MINIMA):
+        self.theta = theta
+        self.distancia_minima = distancia_minima
+
+    def __call__(self, posiciones, masas):
+        posiciones = np.asarray(posiciones, dtype=float)
+        arbol = Octree(posiciones, masas)
+        return arbol.aceleraciones(posiciones, self.theta, distancia_minima=self.distancia_minima)
+
+    def __repr__(self):
+        return f"BarnesHut(theta={self.theta})"
+
+
+# Error relativo de Barnes-Hut frente a la suma directa para varios ángulos de apertura
+# Devuelve una fila por theta: (theta, error mediano, percentil 99, error máximo, segundos)
+def error_frente_a_theta(posiciones, masas, thetas, referencia=None):
+    if referencia is None:
+        referencia = aceleraciones_sistema(posiciones, masas)
+    modulo_referencia = np.linalg.norm(referencia, axis=1)
+    filas = []
+    for theta in thetas:
+        inicio = time.perf_counter()
+        aproximadas = BarnesHut(theta)(posiciones, masas)
+        segundos = time.perf_counter() - inicio
+        error = np.linalg.norm(aproximadas - referencia, axis=1) / np.where(modulo_referencia > 0, modulo_referencia, 1.0)
+        filas.append((theta, float(np.median(error)), float(np.percentile(error, 99)), float(error.max()), segundos))
+    return filas
@@ -0,0 +1,157 @@
+# Barrido de parámetros de una estrella pasajera repartido en un grupo de procesos
+#
+#   python -m orbitas.barrido super_gigante_roja --rango masa=1e31:8e31:8 --rango posicion_z=0:4.488e12:5 \
+#       --pasos 3650 --salida barrido.jsonl
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .diagnosticos import energia
+from .escenarios import ESTRELLAS_PASAJERAS, estrella_pasajera
+from .fuerzas import G
+from .integradores import METODOS
+from .sistema import SistemaCeleste
+from .simulacion import simular_sistema_solar
+
+UA = 1.496e11  # Unidad astronómica en metros
+PARAMETROS = ("masa", "posicion_x", "posicion_y", "posicion_z", "velocidad_x", "velocidad_y", "velocidad_z")
+UMBRAL_ENERGIA = 1e-2  # Error relativo de energía a partir del cual una ejecución se considera divergente
+
+
+# Todas las combinaciones de una rejilla {parametro: valores} como diccionarios
+def combinaciones(rangos):
+    nombres = list(rangos)
+    for valores in itertools.product(*(rangos[nombre] for nombre in nombres)):
+        yield dict(zip(nombres, (float(valor) for valor in valores)))
+
+
+# Cuerpos del escenario con los parámetros de la estrella pasajera sustituidos
+def construir_escenario(escenario, parametros):
+    nombre, masa, posicion, velocidad = ESTRELLAS_PASAJERAS[escenario]
+    posicion, velocidad = list(posicion), list(velocidad)
+    for parametro, valor in parametros.items():
+        if parametro not in PARAMETROS:
+            raise ValueError(f"Parámetro desconocido: {parametro!r} (disponibles: {', '.join(PARAMETROS)})")
+        if parametro == "masa":
+            masa = valor
+        elif parametro.startswith("posicion_"):
+            posicion["xyz".index(parametro[-1])] = valor
+        else:
+            velocidad["xyz".index(parametro[-1])] = valor
+    return estrella_pasajera(nombre, masa, posicion, velocidad)
+
+
+# Ejecutar una combinación y devolver un resumen compacto (sin trayectorias)
+# estado: "ok", "divergente" (valores no finitos o error de energía > umbral_energia) o "error" (excepción)
+# central: cuerpo central de Wisdom-Holman (ver simular_sistema_solar)
+def ejecutar_caso(escenario, parametros, num_pasos, dt, metodo="leapfrog", cada=10, umbral_energia=UMBRAL_ENERGIA,
+                  central=None):
+    inicio = time.perf_counter()
+    resumen = {"escenario": escenario, "parametros": parametros}
+    try:
+        sistema = SistemaCeleste.desde_cuerpos(construir_escenario(escenario, parametros))
+        energia_inicial = energia(sistema.masas, sistema.posiciones, sistema.velocidades)
+        with np.errstate(all='ignore'):  # Una ejecución divergente se detecta por sus valores, no por avisos
+            trayectoria = simular_sistema_solar(sistema.cuerpos, num_pasos, dt, metodo=metodo, cada=cada,
+                                                central=central)
+            posiciones, velocidades = sistema.posiciones, sistema.velocidades
+            energia_final = energia(sistema.masas, posiciones, velocidades)
+    except Exception as error:
+        resumen.update(estado="error", mensaje=f"{type(error).__name__}: {error}",
+                       segundos=time.perf_counter() - inicio)
+        return resumen
+
+    sol, estrella = sistema.nombres.index("Sol"), sistema.numero_cuerpos - 1  # La estrella se añade al final
+    error_energia = abs((energia_final - energia_inicial) / energia_inicial)
+    finito = bool(np.isfinite(trayectoria.posiciones).all() and np.isfinite(velocidades).all())
+    separacion = trayectoria.posiciones[:, estrella] - trayectoria.posiciones[:, sol]
+    # Planetas respecto al Sol: distancia final y energía orbital específica (> 0: escapado)
+    planetas = [indice for indice in range(sistema.numero_cuerpos) if indice not in (sol, estrella)]
+    r = posiciones[planetas] - posiciones[sol]
+    v = velocidades[planetas] - velocidades[sol]
+    distancia = np.linalg.norm(r, axis=1)
+    energia_especifica = 0.5 * np.einsum('nk,nk->n', v, v) - G * sistema.masas[sol] / distancia
+    resumen.update(
+        estado="ok" if finito and error_energia <= umbral_energia else "divergente",
+        error_energia=float(error_energia),
+        distancia_minima_estrella_ua=float(np.linalg.norm(separacion, axis=1).min() / UA) if len(separacion) else None,
+        distancias_finales_ua={sistema.nombres[k]: float(d / UA) for k, d in zip(planetas, distancia)},
+        escapados=[sistema.nombres[k] for k, e in zip(planetas, energia_especifica) if not e < 0],
+        segundos=time.perf_counter() - inicio,
+    )
+    return resumen
+
+
+# Ejecutar todas las combinaciones de la rejilla en un grupo de procesos (por defecto, todos los núcleos)
+# Es un generador: entrega cada resumen en cuanto termina, en orden de finalización
+def barrido(escenario, rangos, num_pasos, dt, metodo="leapfrog", procesos=None, cada=10,
+            umbral_energia=UMBRAL_ENERGIA, central=None):
+    if escenario not in ESTRELLAS_PASAJERAS:
+        raise ValueError(f"Escenario desconocido: {escenario!r} (disponibles: {', '.join(ESTRELLAS_PASAJERAS)})")
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = {ejecutor.submit(ejecutar_caso, escenario, parametros, num_pasos, dt, metodo, cada,
+                                   umbral_energia, central): parametros
+                   for parametros in combinaciones(rangos)}
+        for futuro in as_completed(futuros):
+            try:
+                resumen = futuro.result()
+            except Exception as error:  # El proceso murió (memoria, señal): se anota y el barrido sigue
+                resumen = {"escenario": escenario, "parametros": futuros[futuro], "estado": "error",
+                           "mensaje": f"{type(error).__name__}: {error}"}
+            yield resumen
+
+
+# Interpretar "nombre=inicio:fin:numero" (valores equiespaciados) o "nombre=v1,v2,..."
+def _leer_rango(texto):
+    nombre, _, valores = texto.partition("=")
+    if nombre not in PARAMETROS or not valores:
+        raise argparse.ArgumentTypeError(f"Rango no válido: {texto!r} (parámetros: {', '.join(PARAMETROS)})")
+    if ":" in valores:
+        inicio, fin, numero = valores.split(":")
+        return nombre, np.linspace(float(inicio), float(fin), int(numero))
+    return nombre, [float(valor) for valor in valores.split(",")]
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros de una estrella pasajera")
+    parser.add_argument("escenario", choices=sorted(ESTRELLAS_PASAJERAS))
+    parser.add_argument("--rango", type=_leer_rango, action="append", required=True,
+                        help="nombre=inicio:fin:numero o nombre=v1,v2,... (repetible)")
+    parser.add_argument("--pasos", type=int, default=365 * 10, help="pasos por ejecución")
+    parser.add_argument("--dt", type=float, default=86400, help="paso de tiempo en segundos")
+    parser.add_argument("--metodo", default="leapfrog", choices=sorted(METODOS))
+    parser.add_argument("--central", help="cuerpo central de Wisdom-Holman (por defecto, el Sol)")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos (por defecto, todos los núcleos)")
+    parser.add_argument("--cada", type=int, default=10, help="pasos entre muestras para la distancia mínima")
+    parser.add_argument("--umbral-energia", type=float, default=UMBRAL_ENERGIA)
+    parser.add_argument("--salida", default="-", help="archivo JSON Lines (una línea por ejecución; - para stdout)")
+    argumentos = parser.parse_args(argumentos)
+
+    rangos = dict(argumentos.rango)
+    total = int(np.prod([len(valores) for valores in rangos.values()]))
+    salida = sys.stdout if argumentos.salida == "-" else open(argumentos.salida, "a", encoding="utf-8")
+    estados = {}
+    inicio = time.perf_counter()
+    try:
+        for numero, resumen in enumerate(barrido(argumentos.escenario, rangos, argumentos.pasos, argumentos.dt,
+                                                 argumentos.metodo, argumentos.procesos, argumentos.cada,
+                                                 argumentos.umbral_energia, argumentos.central), start=1):
+            salida.write(json.dumps(resumen, ensure_ascii=False) + "\n")
+            salida.flush()  # Cada resultado queda en disco en cuanto termina
+            estados[resumen["estado"]] = estados.get(resumen["estado"], 0) + 1
+            print(f"\r{numero}/{total} ({time.perf_counter() - inicio:.0f} s) {estados}", end="", file=sys.stderr)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    print(f"\n{total} ejecuciones con {argumentos.procesos or os.cpu_count()} procesos", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
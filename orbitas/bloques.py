@@ -0,0 +1,189 @@
+# Pasos de tiempo individuales por bloques: cada cuerpo avanza con dt / 2^nivel según su propia escala de tiempo
+#
+# Ahorra evaluaciones de fuerza, no subpasos: todos los cuerpos derivan en cada subpaso del nivel más profundo, así
+# que frente a un Leapfrog uniforme con ese paso solo gana cuando la fuerza sobre los cuerpos que no están en él
+# pesa más que el coste fijo de cada subpaso. Con los 9 cuerpos del sistema solar el Sol cae al nivel de Mercurio y
+# cada subpaso evalúa fuerzas igual que un paso uniforme: los bloques tardan unas 2.5 veces más. Con un disco de 1000
+# planetesimales hacen unas 7 veces menos evaluaciones y tardan unas 3.7 veces menos (benchmarks/pasos_bloques.py).
+
+import numpy as np
+
+from .adaptativo import CRITERIOS, escalas_por_cuerpo
+from .fuerzas import campo_gravitatorio
+
+
+# Motor Leapfrog con pasos jerárquicos en potencias de dos (bloques)
+# Cada cuerpo está en un nivel k con paso dt / 2^k elegido por tolerancia * su escala de tiempo más corta.
+# Todos los cuerpos derivan juntos hasta el siguiente instante en el que termina algún bloque; solo los cuerpos
+# activos en ese instante reciben fuerza nueva (objetivos activos frente a todas las fuentes) e impulso.
+# Un cuerpo puede bajar de nivel (paso más largo) solo cuando el nuevo bloque está alineado con el tiempo.
+# Al final de cada paso dt todos los cuerpos están sincronizados; ahí se registra la trayectoria.
+# Las estadísticas se acumulan en todos los avances del motor (una simulación troceada por diagnósticos, puntos de
+# control o Simulacion cuenta todos sus pasos) hasta reiniciar_estadisticas().
+class MotorBloques:
+    nombre = "bloques"
+
+    def __init__(self, tolerancia=0.02, criterio="aceleracion", niveles=10):
+        if criterio not in CRITERIOS:
+            raise ValueError(f"Criterio desconocido: {criterio!r} (disponibles: {', '.join(CRITERIOS)})")
+        self.tolerancia = tolerancia
+        self.criterio = criterio
+        self.niveles = niveles  # Nivel más profundo: dt / 2^niveles
+        self.contadores = None  # Contadores acumulados (serializables en JSON) de los que salen las estadísticas
+
+    def reiniciar_estadisticas(self):
+        self.contadores = None
+
+    # Estadísticas por nivel y trabajo frente a un paso uniforme igual al del nivel más profundo usado
+    @property
+    def estadisticas(self):
+        contadores = self.contadores
+        if contadores is None:
+            return None
+        dt, pasos = contadores["dt"], contadores["pasos"]
+        return {
+            "subpasos": contadores["subpasos"],
+            "evaluaciones": sum(contadores["evaluaciones"]),
+            "evaluaciones_paso_uniforme": contadores["pasos_cuerpo"] * (1 << contadores["nivel_maximo"]),
+            "bloques": [{"nivel": k, "dt": dt / (1 << k), "cuerpos_medios": ocupacion / max(pasos, 1),
+                         "evaluaciones": evaluaciones}
+                        for k, (ocupacion, evaluaciones) in enumerate(zip(contadores["ocupacion"],
+                                                                          contadores["evaluaciones"]))
+                        if ocupacion or evaluaciones],
+        }
+
+    def admite(self, metodo, nucleo):
+        return metodo == "leapfrog" and nucleo == "directo"
+
+    # Nivel deseado de cada cuerpo: el menor k con dt / 2^k <= tolerancia * escala
+    def niveles_deseados(self, posiciones, velocidades, masas, prueba, dt, objetivos=None):
+        caida, cruce = escalas_por_cuerpo(posiciones, velocidades, masas, prueba, objetivos)
+        escala = self.tolerancia * CRITERIOS[self.criterio](caida, cruce)
+        with np.errstate(divide='ignore'):
+            nivel = np.ceil(np.log2(dt / escala))
+        return np.clip(nivel, 0, self.niveles).astype(np.int64)
+
+    def avanzar(self, sistema, num_pasos, dt, metodo="leapfrog", nucleo="directo", trayectoria=None):
+        if not self.admite(metodo, nucleo):
+            raise ValueError(f"Los pasos por bloques solo admiten metodo='leapfrog' con nucleo='directo' "
+                             f"(recibido metodo={metodo!r}, nucleo={nucleo!r})")
+        masas = sistema.masas
+        prueba = sistema.prueba.copy()
+        masivos = np.flatnonzero(~prueba)
+        posiciones = sistema.posiciones
+        velocidades = sistema.velocidades.copy()
+        numero_cuerpos = sistema.numero_cuerpos
+        divisiones = 1 << self.niveles  # Unidades enteras de tiempo por paso dt: dt / 2^niveles cada una
+        tic = dt / divisiones
+
+        if self.contadores is None:
+            self.contadores = {"pasos": 0, "subpasos": 0, "pasos_cuerpo": 0, "nivel_maximo": 0, "dt": dt,
+                               "evaluaciones": [0] * (self.niveles + 1), "ocupacion": [0] * (self.niveles + 1)}
+        contadores = self.contadores
+        evaluaciones = np.array(contadores["evaluaciones"], dtype=np.int64)  # Fuerzas (pasos de cuerpo) por nivel
+        ocupacion = np.array(contadores["ocupacion"], dtype=np.int64)  # Cuerpos por nivel al inicio de cada paso dt
+        subpasos = contadores["subpasos"]
+        nivel_maximo = contadores["nivel_maximo"]
+
+        aceleraciones = sistema.aceleraciones
+        if aceleraciones is None:
+            aceleraciones = campo_gravitatorio(posiciones, posiciones[masivos], masas[masivos])
+            evaluaciones[0] += numero_cuerpos
+        for _ in range(num_pasos):
+            nivel = self.niveles_deseados(posiciones, velocidades, masas, prueba, dt)
+            ocupacion += np.bincount(nivel, minlength=self.niveles + 1)
+            nivel_maximo = max(nivel_maximo, int(nivel.max()))
+            # Durante el paso dt los cuerpos van ordenados del nivel más profundo al menos profundo: los activos en
+            # cada subpaso son entonces un prefijo y fuerzas e impulsos trabajan sobre rebanadas, sin índices
+            orden = np.argsort(-nivel, kind="stable")
+            estado = _Ordenado(self.niveles, nivel[orden], orden, posiciones[orden], velocidades[orden],
+                               aceleraciones[orden], masas[orden], prueba[orden], dt)
+            estado.impulsar(len(orden), 0.5)  # Impulso de apertura
+            ahora = 0  # Tiempo dentro del paso dt en unidades enteras
+            while True:
+                avance = divisiones >> int(estado.nivel[0])
+                estado.posiciones += (avance * tic) * estado.velocidades  # Deriva de todos los cuerpos
+                ahora += avance
+                subpasos += 1
+                umbral = self.niveles - ((ahora & -ahora).bit_length() - 1)  # Termina el bloque de nivel >= umbral
+                activos = estado.cuenta[umbral]
+                estado.fuerzas(activos)
+                evaluaciones[umbral:] += estado.por_nivel[umbral:]
+                if ahora == divisiones:
+                    estado.impulsar(activos, 0.5)  # Cierre
+                    break
+                # Nuevo nivel solo de los activos que cierran también un bloque del nivel inmediatamente menos
+                # profundo (cada dos pasos propios): más profundo siempre; menos profundo solo si está alineado
+                revisar = estado.cuenta[umbral + 1]
+                if not revisar:
+                    estado.impulsar(activos, 1.0)  # Cierre y apertura juntos: el paso de los activos no cambia
+                    continue
+                estado.impulsar(activos, 0.5)  # Cierre
+                deseado = self.niveles_deseados(estado.posiciones, estado.velocidades, estado.masas, estado.prueba,
+                                                dt, slice(0, revisar))
+                alineado = ahora % (divisiones >> deseado) == 0
+                deseado = np.where((deseado > estado.nivel[:revisar]) | alineado, deseado, estado.nivel[:revisar])
+                if not np.array_equal(deseado, estado.nivel[:revisar]):
+                    estado.cambiar_niveles(deseado)
+                    nivel_maximo = max(nivel_maximo, int(estado.nivel[0]))
+                    activos = estado.cuenta[umbral]
+                estado.impulsar(activos, 0.5)  # Apertura
+            posiciones[estado.orden] = estado.posiciones
+            velocidades[estado.orden] = estado.velocidades
+            aceleraciones[estado.orden] = estado.aceleraciones
+            sistema.tiempo += dt
+            sistema.numero_paso += 1
+            sistema.velocidades = velocidades  # Sincronizadas al final de cada paso dt
+            sistema.aceleraciones = aceleraciones
+            if trayectoria is not None:
+                trayectoria.registrar(sistema.numero_paso, sistema.tiempo, sistema, dt)
+
+        contadores.update(pasos=contadores["pasos"] + num_pasos, subpasos=subpasos, nivel_maximo=nivel_maximo, dt=dt,
+                          pasos_cuerpo=contadores["pasos_cuerpo"] + num_pasos * numero_cuerpos,
+                          evaluaciones=evaluaciones.tolist(), ocupacion=ocupacion.tolist())
+        if trayectoria is not None:
+            trayectoria.estadisticas = self.estadisticas
+
+
+# Estado de un paso dt de MotorBloques con los cuerpos ordenados por nivel descendente (copias, en el orden `orden`)
+# cuenta[k]: cuerpos con nivel >= k, es decir, el prefijo activo cuando termina un bloque de nivel k
+class _Ordenado:
+    def __init__(self, niveles, nivel, orden, posiciones, velocidades, aceleraciones, masas, prueba, dt):
+        self.niveles = niveles
+        self.dt = dt
+        self.posiciones = posiciones
+        self.velocidades = velocidades
+        self.aceleraciones = aceleraciones
+        self.masas = masas
+        self.prueba = prueba
+        self._ordenar(nivel, orden)
+
+    def _ordenar(self, nivel, orden):
+        self.nivel = nivel
+        self.orden = orden
+        self.duracion = self.dt / (1 << nivel)  # Paso de cada cuerpo
+        self.por_nivel = np.bincount(nivel, minlength=self.niveles + 1)
+        self.cuenta = np.append(np.cumsum(self.por_nivel[::-1])[::-1], 0).tolist()
+        if self.prueba.any():
+            masivos = np.flatnonzero(~self.prueba)
+            self.fuentes, self.masas_fuentes = masivos, self.masas[masivos]
+        else:
+            self.fuentes, self.masas_fuentes = None, self.masas  # Todas las filas son fuentes: sin copia
+
+    # Fuerza nueva sobre los `activos` primeros cuerpos
+    def fuerzas(self, activos):
+        fuentes = self.posiciones if self.fuentes is None else self.posiciones[self.fuentes]
+        self.aceleraciones[:activos] = campo_gravitatorio(self.posiciones[:activos], fuentes, self.masas_fuentes)
+
+    # Impulso de `fraccion` de su paso a los `activos` primeros cuerpos
+    def impulsar(self, activos, fraccion):
+        self.velocidades[:activos] += (fraccion * self.duracion[:activos, np.newaxis]) * self.aceleraciones[:activos]
+
+    # Asignar niveles nuevos a los primeros cuerpos y reordenar para que los activos sigan siendo un prefijo
+    def cambiar_niveles(self, deseado):
+        nivel = self.nivel.copy()
+        nivel[:len(deseado)] = deseado
+        permutacion = np.argsort(-nivel, kind="stable")
+        for nombre in ("posiciones", "velocidades", "aceleraciones", "masas", "prueba"):
+            setattr(self, nombre, getattr(self, nombre)[permutacion])
+        self._ordenar(nivel[permutacion], self.orden[permutacion])
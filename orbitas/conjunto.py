@@ -0,0 +1,251 @@
+# Integración por conjuntos: B copias independientes de un sistema avanzando juntas en un estado (B, N, 3)
+
+from functools import lru_cache
+
+import numpy as np
+
+from .fuerzas import DISTANCIA_MINIMA, G, _indices_pares, campo_gravitatorio
+from .sistema import SistemaCeleste
+from .trayectoria import Trayectoria
+
+METODOS_CONJUNTO = ("leapfrog", "euler_cromer")
+# Elementos máximos de cada matriz de pares (P, N): ocupan O(N³) memoria, así que por encima (N ≳ 160) se reparte
+# con índices y bincount, O(B·N²) como el núcleo por pares
+ELEMENTOS_MATRICES_PARES = 1 << 21
+
+
+# Matrices de pares: reparto (P, N) de cada par a su primer y a su segundo cuerpo, y diferencia (N, P) x_j - x_i
+# Con coeficientes 0 y ±1 los productos de matrices son exactos y más rápidos que indexar con i, j (N pequeña)
+@lru_cache(maxsize=16)
+def _matrices_pares(numero_cuerpos):
+    i, j = _indices_pares(numero_cuerpos)
+    numero_pares = len(i)
+    reparto_i = np.zeros((numero_pares, numero_cuerpos))
+    reparto_j = np.zeros((numero_pares, numero_cuerpos))
+    reparto_i[np.arange(numero_pares), i] = 1.0
+    reparto_j[np.arange(numero_pares), j] = 1.0
+    return reparto_i, reparto_j, np.ascontiguousarray((reparto_j - reparto_i).T)
+
+
+# Aceleraciones de B sistemas independientes evaluando cada par una vez (tercera ley de Newton)
+# posiciones: (B, N, 3), masas: (B, N) -> aceleraciones (B, N, 3)
+# prueba: máscara (N,) de partículas de prueba, que sienten la gravedad pero no la ejercen
+# Internamente se trabaja componente a componente (3, B, pares) para que cada operación recorra memoria contigua
+def aceleraciones_conjunto(posiciones, masas, distancia_minima=DISTANCIA_MINIMA, prueba=None):
+    posiciones = np.asarray(posiciones, dtype=float)
+    masas = np.asarray(masas, dtype=float)
+    if prueba is not None and np.any(prueba):
+        return _aceleraciones_conjunto_prueba(posiciones, masas, distancia_minima, np.asarray(prueba, dtype=bool))
+    numero_cuerpos = posiciones.shape[1]
+    if numero_cuerpos * (numero_cuerpos - 1) // 2 * numero_cuerpos > ELEMENTOS_MATRICES_PARES:
+        return _aceleraciones_conjunto_indices(posiciones, masas, distancia_minima)
+    reparto_i, reparto_j, diferencia = _matrices_pares(posiciones.shape[1])
+    componentes = np.ascontiguousarray(posiciones.transpose(2, 0, 1))  # (3, B, N)
+    r = componentes @ diferencia  # Vector de distancia de cada par en cada miembro (3, B, P)
+    distancia_cuadrada = r[0] * r[0] + r[1] * r[1] + r[2] * r[2]
+    distancia = np.sqrt(distancia_cuadrada)
+    inverso_cubo = np.zeros_like(distancia)
+    np.divide(G, distancia_cuadrada * distancia, out=inverso_cubo, where=distancia >= distancia_minima)
+    hacia_i = inverso_cubo * (masas @ reparto_j.T)  # m_j / d^3 hacia el primer cuerpo del par
+    hacia_j = inverso_cubo * (masas @ reparto_i.T)  # m_i / d^3 hacia el segundo
+    aceleraciones = (r * hacia_i) @ reparto_i - (r * hacia_j) @ reparto_j
+    return aceleraciones.transpose(1, 2, 0)
+
+
+# Con partículas de prueba, como con_particulas_prueba: los masivos entre sí por pares y las partículas solo frente
+# a los masivos, O(B·(N² + N·M)) en lugar de tratar las M partículas como cuerpos de masa nula
+def _aceleraciones_conjunto_prueba(posiciones, masas, distancia_minima, prueba):
+    masivos, particulas = np.flatnonzero(~prueba), np.flatnonzero(prueba)
+    fuentes, masas_fuentes = posiciones[:, masivos], masas[:, masivos]
+    aceleraciones = np.empty(posiciones.shape)
+    aceleraciones[:, masivos] = aceleraciones_conjunto(fuentes, masas_fuentes, distancia_minima)
+    for miembro in range(posiciones.shape[0]):
+        aceleraciones[miembro, particulas] = campo_gravitatorio(posiciones[miembro, particulas], fuentes[miembro],
+                                                                masas_fuentes[miembro], distancia_minima)
+    return aceleraciones
+
+
+# Misma suma por pares repartida con índices: cada par (i, j) de cada miembro b va a las filas b·N + i y b·N + j
+def _aceleraciones_conjunto_indices(posiciones, masas, distancia_minima):
+    numero_miembros, numero_cuerpos = masas.shape
+    i, j = _indices_pares(numero_cuerpos)
+    r = posiciones[:, j] - posiciones[:, i]  # (B, P, 3)
+    distancia_cuadrada = np.einsum('bpk,bpk->bp', r, r)
+    distancia = np.sqrt(distancia_cuadrada)
+    inverso_cubo = np.zeros_like(distancia)
+    np.divide(G, distancia_cuadrada * distancia, out=inverso_cubo, where=distancia >= distancia_minima)
+    hacia_i = inverso_cubo * masas[:, j]
+    hacia_j = inverso_cubo * masas[:, i]
+    desplazamiento = (numero_cuerpos * np.arange(numero_miembros))[:, np.newaxis]
+    filas_i, filas_j = (i + desplazamiento).ravel(), (j + desplazamiento).ravel()
+    total = numero_miembros * numero_cuerpos
+    aceleraciones = np.empty((numero_miembros, numero_cuerpos, 3))
+    for eje in range(3):
+        aceleraciones[:, :, eje] = (np.bincount(filas_i, weights=(hacia_i * r[:, :, eje]).ravel(), minlength=total)
+                                    - np.bincount(filas_j, weights=(hacia_j * r[:, :, eje]).ravel(),
+                                                  minlength=total)).reshape(numero_miembros, numero_cuerpos)
+    return aceleraciones
+
+
+# Conjunto de B variantes del mismo sistema (mismos cuerpos y orden, distintas condiciones iniciales)
+# prueba: máscara (N,) de partículas de prueba, común a todos los miembros
+class ConjuntoSistemas:
+    def __init__(self, nombres, masas, posiciones, velocidades, prueba=None):
+        self.nombres = list(nombres)
+        self.posiciones = np.array(posiciones, dtype=float)  # (B, N, 3)
+        self.velocidades = np.array(velocidades, dtype=float)  # (B, N, 3)
+        self.masas = np.broadcast_to(np.asarray(masas, dtype=float), self.posiciones.shape[:2]).copy()  # (B, N)
+        if self.posiciones.shape != self.velocidades.shape or self.posiciones.shape[1] != len(self.nombres):
+            raise ValueError("posiciones y velocidades deben ser (B, N, 3) con N igual al número de nombres")
+        self.prueba = np.zeros(len(self.nombres), dtype=bool) if prueba is None else np.array(prueba, dtype=bool)
+        self.tiempo = 0.0
+        self.numero_paso = 0
+
+    @property
+    def numero_miembros(self):
+        return self.posiciones.shape[0]
+
+    @property
+    def numero_cuerpos(self):
+        return self.posiciones.shape[1]
+
+    def __len__(self):
+        return self.numero_miembros
+
+    # Un conjunto a partir de varias listas de cuerpos con los mismos nombres en el mismo orden
+    @classmethod
+    def desde_cuerpos(cls, variantes):
+        variantes = [list(cuerpos_celestes) for cuerpos_celestes in variantes]
+        nombres = [cuerpo.nombre for cuerpo in variantes[0]]
+        prueba = [cuerpo.prueba for cuerpo in variantes[0]]
+        for cuerpos_celestes in variantes:
+            if [cuerpo.nombre for cuerpo in cuerpos_celestes] != nombres:
+                raise ValueError("Todas las variantes deben tener los mismos cuerpos en el mismo orden")
+            if [cuerpo.prueba for cuerpo in cuerpos_celestes] != prueba:
+                raise ValueError("Las partículas de prueba deben ser las mismas en todas las variantes")
+        masas = [[cuerpo.masa for cuerpo in cuerpos_celestes] for cuerpos_celestes in variantes]
+        posiciones = [[cuerpo.posicion for cuerpo in cuerpos_celestes] for cuerpos_celestes in variantes]
+        velocidades = [[cuerpo.velocidad for cuerpo in cuerpos_celestes] for cuerpos_celestes in variantes]
+        return cls(nombres, masas, posiciones, velocidades, prueba)
+
+    # Replicar un sistema base cambiando en cada miembro la masa, posición o velocidad de un cuerpo
+    # masas: (B,), posiciones y velocidades: (B, 3); lo que no se indique se copia del sistema base
+    @classmethod
+    def desde_variantes(cls, cuerpos_celestes, nombre, masas=None, posiciones=None, velocidades=None):
+        sistema = SistemaCeleste.desde_cuerpos(cuerpos_celestes)
+        indice = sistema.nombres.index(nombre)
+        numero_miembros = max(len(valores) for valores in (masas, posiciones, velocidades) if valores is not None)
+        conjunto = cls(sistema.nombres, np.tile(sistema.masas, (numero_miembros, 1)),
+                       np.tile(sistema.posiciones, (numero_miembros, 1, 1)),
+                       np.tile(sistema.velocidades, (numero_miembros, 1, 1)), sistema.prueba)
+        if masas is not None:
+            conjunto.masas[:, indice] = masas
+        if posiciones is not None:
+            conjunto.posiciones[:, indice] = posiciones
+        if velocidades is not None:
+            conjunto.velocidades[:, indice] = velocidades
+        return conjunto
+
+    # Estado actual de un miembro como SistemaCeleste independiente (copia)
+    def miembro(self, indice):
+        sistema = SistemaCeleste.desde_arreglos(self.nombres, self.masas[indice], self.posiciones[indice],
+                                                self.velocidades[indice], self.prueba)
+        sistema.tiempo, sistema.numero_paso = self.tiempo, self.numero_paso
+        return sistema
+
+
+# Historial de un conjunto: posiciones (num_muestras, B, N, 3) en un único búfer preasignado
+class TrayectoriaConjunto:
+    def __init__(self, nombres, numero_miembros, num_pasos, cada=1, guardar_velocidades=False, paso_inicial=0):
+        if cada < 1:
+            raise ValueError("cada debe ser un entero positivo")
+        self.nombres = list(nombres)
+        self.cada = int(cada)
+        self.paso_inicial = paso_inicial
+        capacidad = num_pasos // self.cada
+        forma = (capacidad, numero_miembros, len(self.nombres), 3)
+        self.numero_muestras = 0
+        self._posiciones = np.empty(forma, dtype=float)
+        self._velocidades = np.empty(forma, dtype=float) if guardar_velocidades else None
+        self._tiempos = np.empty(capacidad, dtype=float)
+        self._pasos = np.empty(capacidad, dtype=np.int64)
+
+    # Guardar el estado del conjunto si el paso coincide con el intervalo de registro
+    def registrar(self, paso, tiempo, posiciones, velocidades=None):
+        if (paso - self.paso_inicial) % self.cada != 0 or self.numero_muestras >= len(self._tiempos):
+            return
+        muestra = self.numero_muestras
+        self._posiciones[muestra] = posiciones
+        if self._velocidades is not None:
+            self._velocidades[muestra] = velocidades
+        self._tiempos[muestra] = tiempo
+        self._pasos[muestra] = paso
+        self.numero_muestras += 1
+
+    @property
+    def posiciones(self):
+        return self._posiciones[:self.numero_muestras]
+
+    @property
+    def velocidades(self):
+        if self._velocidades is None:
+            return None
+        return self._velocidades[:self.numero_muestras]
+
+    @property
+    def tiempos(self):
+        return self._tiempos[:self.numero_muestras]
+
+    @property
+    def pasos(self):
+        return self._pasos[:self.numero_muestras]
+
+    @property
+    def numero_miembros(self):
+        return self._posiciones.shape[1]
+
+    # Trayectoria de un miembro: vista sobre el búfer común, con la misma interfaz que simular_sistema_solar
+    def miembro(self, indice):
+        velocidades = None if self._velocidades is None else self._velocidades[:, indice]
+        return Trayectoria.desde_buferes(self.nombres, self._posiciones[:, indice], velocidades, self._tiempos,
+                                         self._pasos, self.numero_muestras, cada=self.cada,
+                                         paso_inicial=self.paso_inicial)
+
+    def miembros(self):
+        return [self.miembro(indice) for indice in range(self.numero_miembros)]
+
+    def __len__(self):
+        return self.numero_muestras
+
+
+# Integrar todos los miembros del conjunto con un único bucle de pasos y un único núcleo vectorizado
+# metodo: "leapfrog" (kick-drift-kick) o "euler_cromer"; devuelve una TrayectoriaConjunto
+def simular_conjunto(conjunto, num_pasos, dt, metodo="leapfrog", cada=1, guardar_velocidades=False):
+    if metodo not in METODOS_CONJUNTO:
+        raise ValueError(f"Método de integración desconocido para conjuntos: {metodo!r} "
+                         f"(disponibles: {', '.join(METODOS_CONJUNTO)})")
+    trayectoria = TrayectoriaConjunto(conjunto.nombres, conjunto.numero_miembros, num_pasos, cada=cada,
+                                      guardar_velocidades=guardar_velocidades, paso_inicial=conjunto.numero_paso)
+    posiciones, velocidades = conjunto.posiciones, conjunto.velocidades
+    masas, prueba = conjunto.masas, conjunto.prueba  # Las partículas de prueba no ejercen fuerza
+    paso_inicial, tiempo_inicial = conjunto.numero_paso, conjunto.tiempo
+    if metodo == "leapfrog" and num_pasos > 0:  # Sin pasos no se abre ni se cierra el medio impulso
+        aceleraciones = aceleraciones_conjunto(posiciones, masas, prueba=prueba)
+        velocidades += 0.5 * dt * aceleraciones  # Impulso de apertura: a partir de aquí son velocidades medias
+        for paso in range(paso_inicial + 1, paso_inicial + num_pasos + 1):
+            posiciones += dt * velocidades  # Deriva
+            aceleraciones = aceleraciones_conjunto(posiciones, masas, prueba=prueba)
+            velocidades += dt * aceleraciones  # Impulso de cierre y apertura del siguiente paso
+            sincronizadas = None
+            if guardar_velocidades and (paso - paso_inicial) % cada == 0:
+                sincronizadas = velocidades - 0.5 * dt * aceleraciones
+            trayectoria.registrar(paso, tiempo_inicial + (paso - paso_inicial) * dt, posiciones, sincronizadas)
+        velocidades -= 0.5 * dt * aceleraciones  # Sincronizar con las posiciones al terminar
+    elif metodo == "euler_cromer":
+        for paso in range(paso_inicial + 1, paso_inicial + num_pasos + 1):
+            velocidades += dt * aceleraciones_conjunto(posiciones, masas, prueba=prueba)
+            posiciones += dt * velocidades
+            trayectoria.registrar(paso, tiempo_inicial + (paso - paso_inicial) * dt, posiciones, velocidades)
+    conjunto.tiempo += num_pasos * dt
+    conjunto.numero_paso += num_pasos
+    return trayectoria
@@ -0,0 +1,209 @@
+# Diagnósticos de conservación: energía total, momento lineal y momento angular a lo largo de la simulación
+#
+# Las cantidades se calculan sobre los cuerpos masivos (las partículas de prueba no ejercen fuerza, así que no
+# forman parte de las cantidades conservadas). La energía potencial es O(N²) como una evaluación de fuerzas directa,
+# pero solo se mide cada `cada` pasos: con cada = k su coste es del orden de 1/k del de la integración.
+
+import warnings
+
+import numpy as np
+
+from .fuerzas import DISTANCIA_MINIMA, ELEMENTOS_POR_BLOQUE, G
+
+CANTIDADES = ("energia", "momento", "momento_angular")
+
+
+# Energía potencial gravitatoria -G Σ_{i<j} m_i m_j / r_ij, por bloques de filas para no crear la matriz (N, N)
+def energia_potencial(masas, posiciones, distancia_minima=DISTANCIA_MINIMA):
+    masas = np.asarray(masas, dtype=float)
+    posiciones = np.asarray(posiciones, dtype=float)
+    numero = len(masas)
+    filas_por_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(numero, 1))
+    potencial = 0.0
+    for inicio in range(0, numero, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, numero)
+        r = posiciones[np.newaxis, :, :] - posiciones[inicio:fin, np.newaxis, :]
+        distancia = np.sqrt(np.einsum('ijk,ijk->ij', r, r))
+        # Cada par una vez (j > i); los pares más cercanos que distancia_minima se ignoran como en las fuerzas
+        validos = (np.arange(numero)[np.newaxis, :] > np.arange(inicio, fin)[:, np.newaxis]) & (distancia >= distancia_minima)
+        inverso = np.zeros_like(distancia)
+        np.divide(1.0, distancia, out=inverso, where=validos)
+        potencial += masas[inicio:fin] @ (inverso @ masas)
+    return -G * potencial
+
+
+# Energía cinética Σ m v² / 2
+def energia_cinetica(masas, velocidades):
+    return 0.5 * float(np.dot(masas, np.einsum('nk,nk->n', velocidades, velocidades)))
+
+
+# Energía total (cinética + potencial)
+def energia(masas, posiciones, velocidades):
+    return energia_cinetica(masas, velocidades) + energia_potencial(masas, posiciones)
+
+
+# Momento lineal total Σ m v -> (3,)
+def momento_lineal(masas, velocidades):
+    return np.asarray(masas) @ np.asarray(velocidades)
+
+
+# Momento angular total respecto al origen Σ m r × v -> (3,)
+def momento_angular(masas, posiciones, velocidades):
+    return np.asarray(masas) @ np.cross(posiciones, velocidades)
+
+
+# Energía, momento lineal y momento angular de los cuerpos masivos del sistema
+def cantidades_conservadas(sistema):
+    masivos = ~sistema.prueba
+    masas = sistema.masas[masivos]
+    posiciones = sistema.posiciones[masivos]
+    velocidades = sistema.velocidades[masivos]  # Sincroniza el Leapfrog sin alterar su estado interno
+    return {
+        "energia": energia(masas, posiciones, velocidades),
+        "momento": momento_lineal(masas, velocidades),
+        "momento_angular": momento_angular(masas, posiciones, velocidades),
+    }
+
+
+# Registro de las cantidades conservadas cada `cada` pasos y de su deriva relativa respecto al estado inicial
+# Derivas: energía (E - E0) / |E0|; momentos |P - P0| / Σ m|v| y |L - L0| / Σ m|r × v| (escalas del estado
+# inicial, que no se anulan aunque el momento total sea cero en el sistema del centro de masas)
+# umbral: deriva a partir de la cual se da la alarma (una vez por cantidad); alarma: función
+# (diagnosticos, cantidad, deriva) a la que se llama entonces (por defecto, un RuntimeWarning). La función puede
+# lanzar una excepción para detener la simulación.
+class Diagnosticos:
+    def __init__(self, cada=100, umbral=None, alarma=None):
+        if cada < 1:
+            raise ValueError(f"cada debe ser al menos 1 (recibido {cada!r})")
+        self.cada = cada
+        self.umbral = umbral
+        self.alarma = alarma
+        self.pasos_hechos = 0  # Pasos avanzados desde la primera medida
+        self.escalas = None  # Escalas del estado inicial para las derivas de los momentos
+        self.alarmas = []  # Alarmas dadas: {"cantidad", "deriva", "paso", "tiempo"}
+        self._tiempos = []
+        self._pasos = []
+        self._energias = []
+        self._momentos = []
+        self._momentos_angulares = []
+
+    # Medir el estado actual (no repite la medida si el sistema no ha avanzado desde la anterior)
+    def medir(self, sistema):
+        if self._pasos and self._pasos[-1] == sistema.numero_paso:
+            return
+        cantidades = cantidades_conservadas(sistema)
+        if self.escalas is None:
+            masivos = ~sistema.prueba
+            masas = sistema.masas[masivos]
+            posiciones, velocidades = sistema.posiciones[masivos], sistema.velocidades[masivos]
+            self.escalas = {
+                "momento": float(np.dot(masas, np.linalg.norm(velocidades, axis=1))),
+                "momento_angular": float(np.dot(masas, np.linalg.norm(np.cross(posiciones, velocidades), axis=1))),
+            }
+        self._tiempos.append(sistema.tiempo)
+        self._pasos.append(sistema.numero_paso)
+        self._energias.append(cantidades["energia"])
+        self._momentos.append(cantidades["momento"])
+        self._momentos_angulares.append(cantidades["momento_angular"])
+        if self.umbral is not None:
+            self._comprobar(sistema)
+
+    # Dar la alarma por cada cantidad cuya deriva supere el umbral por primera vez
+    def _comprobar(self, sistema):
+        avisadas = {alarma["cantidad"] for alarma in self.alarmas}
+        for cantidad in CANTIDADES:
+            if cantidad in avisadas:
+                continue
+            deriva = abs(self._deriva(cantidad, -1))
+            if not deriva <= self.umbral:  # NaN también cuenta como deriva
+                self.alarmas.append({"cantidad": cantidad, "deriva": float(deriva), "paso": sistema.numero_paso,
+                                     "tiempo": sistema.tiempo})
+                if self.alarma is None:
+                    warnings.warn(f"Deriva de {cantidad} {deriva:.3e} por encima del umbral {self.umbral:.3e} "
+                                  f"en el paso {sistema.numero_paso}", RuntimeWarning, stacklevel=2)
+                else:
+                    self.alarma(self, cantidad, deriva)
+
+    def _deriva(self, cantidad, muestra):
+        if cantidad == "energia":
+            return (self._energias[muestra] - self._energias[0]) / abs(self._energias[0])
+        serie = self._momentos if cantidad == "momento" else self._momentos_angulares
+        return np.linalg.norm(serie[muestra] - serie[0]) / self.escalas[cantidad]
+
+    @property
+    def tiempos(self):
+        return np.array(self._tiempos)
+
+    @property
+    def pasos(self):
+        return np.array(self._pasos, dtype=np.int64)
+
+    @property
+    def energias(self):
+        return np.array(self._energias)
+
+    @property
+    def momentos(self):
+        return np.array(self._momentos).reshape(-1, 3)
+
+    @property
+    def momentos_angulares(self):
+        return np.array(self._momentos_angulares).reshape(-1, 3)
+
+    # Series de deriva relativa, una muestra por medida
+    @property
+    def deriva_energia(self):
+        return (self.energias - self._energias[0]) / abs(self._energias[0]) if self._energias else np.empty(0)
+
+    @property
+    def deriva_momento(self):
+        return self._serie_deriva("momento", self.momentos)
+
+    @property
+    def deriva_momento_angular(self):
+        return self._serie_deriva("momento_angular", self.momentos_angulares)
+
+    def _serie_deriva(self, cantidad, serie):
+        if not len(serie):
+            return np.empty(0)
+        return np.linalg.norm(serie - serie[0], axis=1) / self.escalas[cantidad]
+
+    # Máxima deriva absoluta de cada cantidad
+    def resumen(self):
+        return {
+            "energia": float(np.max(np.abs(self.deriva_energia), initial=0.0)),
+            "momento": float(np.max(self.deriva_momento, initial=0.0)),
+            "momento_angular": float(np.max(self.deriva_momento_angular, initial=0.0)),
+        }
+
+    def __len__(self):
+        return len(self._pasos)
+
+
+# Motor que envuelve a otro y mide los diagnósticos cada `diagnosticos.cada` pasos
+# Avanza el motor en bloques alineados con múltiplos de `cada`: el estado del integrador no cambia al medir,
+# así que los pasos son los mismos que sin diagnósticos (con paso fijo, idénticos bit a bit).
+class MotorDiagnosticado:
+    def __init__(self, motor, diagnosticos):
+        self.motor = motor
+        self.diagnosticos = diagnosticos
+        self.nombre = getattr(motor, "nombre", None) or type(motor).__name__
+        self.pasos_variables = getattr(motor, "pasos_variables", False)
+
+    def admite(self, metodo, nucleo):
+        return self.motor.admite(metodo, nucleo)
+
+    def avanzar(self, sistema, num_pasos, dt, metodo="leapfrog", nucleo="directo", trayectoria=None):
+        diagnosticos = self.diagnosticos
+        if not len(diagnosticos):
+            diagnosticos.medir(sistema)  # Estado inicial: referencia de las derivas
+        restantes = num_pasos
+        while restantes > 0:
+            bloque = min(diagnosticos.cada - diagnosticos.pasos_hechos % diagnosticos.cada, restantes)
+            self.motor.avanzar(sistema, bloque, dt, metodo=metodo, nucleo=nucleo, trayectoria=trayectoria)
+            diagnosticos.pasos_hechos += bloque
+            restantes -= bloque
+            if diagnosticos.pasos_hechos % diagnosticos.cada == 0:
+                diagnosticos.medir(sistema)
+        if hasattr(self.motor, "estadisticas"):
+            self.estadisticas = self.motor.estadisticas
@@ -0,0 +1,203 @@
+# Trayectorias en disco: búferes mapeados en memoria que se vuelcan por bloques mientras avanza la simulación
+#
+# Un directorio con cabecera.json (cuerpos, unidades, muestras válidas) y un archivo binario sin cabecera por arreglo
+# (posiciones.bin, velocidades.bin, tiempos.bin, pasos.bin, duraciones.bin, little-endian). La historia no tiene que
+# caber en memoria: el sistema operativo pagina los bloques ya escritos y abrir_trayectoria los lee bajo demanda.
+
+import json
+import os
+
+import numpy as np
+
+from .trayectoria import Trayectoria
+
+FORMATO = 1
+CABECERA = "cabecera.json"
+UNIDADES = {"posicion": "m", "velocidad": "m/s", "tiempo": "s", "masa": "kg"}
+MUESTRAS_POR_BLOQUE = 1024  # Muestras entre volcados a disco de los búferes y la cabecera
+
+# Arreglos de la trayectoria: atributo del búfer, archivo, forma de una muestra (sin N = por cuerpo) y tipo
+_CAMPOS = (
+    ("_posiciones", "posiciones.bin", (3,), "<f8"),
+    ("_velocidades", "velocidades.bin", (3,), "<f8"),
+    ("_tiempos", "tiempos.bin", (), "<f8"),
+    ("_pasos", "pasos.bin", (), "<i8"),
+    ("_duraciones", "duraciones.bin", (), "<f8"),
+)
+
+
+# Forma de una muestra de un campo: las posiciones y velocidades tienen una fila por cuerpo
+def _forma_muestra(forma, numero_cuerpos):
+    return (numero_cuerpos,) + forma if forma else ()
+
+
+# Mapear un archivo binario como arreglo (capacidad,) + forma; un arreglo vacío si la capacidad es cero
+def _mapear(ruta, tipo, forma, capacidad, modo):
+    if capacidad == 0:
+        return np.empty((0,) + forma, dtype=tipo)
+    return np.memmap(ruta, dtype=tipo, mode=modo, shape=(capacidad,) + forma)
+
+
+# Trayectoria cuyos búferes son archivos mapeados en memoria dentro del directorio `ruta`
+# Misma interfaz que Trayectoria (los motores, incluido el compilado, escriben en los búferes sin cambios).
+# Cada `muestras_por_bloque` muestras se vuelcan los búferes y se reescribe la cabecera; cerrar() deja los archivos
+# recortados a las muestras registradas.
+class TrayectoriaDisco(Trayectoria):
+    def __init__(self, ruta, nombres, num_pasos, cada=1, guardar_velocidades=False, paso_inicial=0, ampliable=False,
+                 masas=None, prueba=None, muestras_por_bloque=MUESTRAS_POR_BLOQUE):
+        super().__init__(nombres, 0, cada=cada, guardar_velocidades=guardar_velocidades, paso_inicial=paso_inicial,
+                         ampliable=ampliable)
+        self.ruta = os.fspath(ruta)
+        numero_cuerpos = len(self.nombres)
+        self.masas = None if masas is None else np.asarray(masas, dtype=float).copy()
+        self.prueba = np.zeros(numero_cuerpos, dtype=bool) if prueba is None else np.asarray(prueba, dtype=bool).copy()
+        self.unidades = dict(UNIDADES)
+        self.muestras_por_bloque = max(int(muestras_por_bloque), 1)
+        os.makedirs(self.ruta, exist_ok=True)
+        self._redimensionar(num_pasos // self.cada)
+        self.volcar()
+
+    def _campos(self):
+        for atributo, archivo, forma, tipo in _CAMPOS:
+            if atributo == "_velocidades" and self._velocidades is None:
+                continue
+            yield atributo, os.path.join(self.ruta, archivo), _forma_muestra(forma, len(self.nombres)), tipo
+
+    # Ajustar el tamaño de los archivos a `capacidad` muestras y volver a mapearlos (conserva lo ya escrito)
+    def _redimensionar(self, capacidad):
+        for atributo, ruta, forma, tipo in list(self._campos()):
+            viejo = getattr(self, atributo)
+            if isinstance(viejo, np.memmap):
+                viejo.flush()
+            setattr(self, atributo, None)  # Soltar el mapa anterior antes de cambiar el tamaño del archivo
+            with open(ruta, "r+b" if os.path.exists(ruta) else "w+b") as archivo:
+                archivo.truncate(capacidad * int(np.prod(forma, dtype=np.int64)) * np.dtype(tipo).itemsize)
+            setattr(self, atributo, _mapear(ruta, tipo, forma, capacidad, "r+"))
+
+    def _ampliar(self, capacidad):
+        self._redimensionar(capacidad)
+
+    def registrar(self, paso, tiempo, sistema, dt=np.nan):
+        antes = self.numero_muestras
+        super().registrar(paso, tiempo, sistema, dt)
+        if self.numero_muestras != antes and self.numero_muestras % self.muestras_por_bloque == 0:
+            self.volcar()
+
+    # Escribir a disco los bloques pendientes y la cabecera con el número de muestras válidas (de forma atómica)
+    def volcar(self):
+        for atributo, _, _, _ in self._campos():
+            bufer = getattr(self, atributo)
+            if isinstance(bufer, np.memmap):
+                bufer.flush()
+        _escribir_cabecera(self.ruta, self, self.masas, self.prueba, self.unidades, len(self._tiempos))
+
+    # Volcar y recortar los archivos a las muestras registradas
+    def cerrar(self):
+        self._redimensionar(self.numero_muestras)
+        self.volcar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    # Volver a abrir para escribir una trayectoria ya existente, con `numero_muestras` válidas (p. ej. las de un
+    # punto de control: lo escrito después se sobrescribe) y capacidad para num_pasos pasos
+    @classmethod
+    def reabrir(cls, ruta, numero_muestras, num_pasos=0, ampliable=False):
+        cabecera = leer_cabecera(ruta)
+        trayectoria = cls.__new__(cls)
+        Trayectoria.__init__(trayectoria, cabecera["nombres"], 0, cada=cabecera["cada"],
+                             guardar_velocidades=cabecera["velocidades"], paso_inicial=cabecera["paso_inicial"],
+                             ampliable=ampliable)
+        trayectoria.ruta = os.fspath(ruta)
+        trayectoria.masas = None if cabecera["masas"] is None else np.array(cabecera["masas"])
+        trayectoria.prueba = np.array(cabecera["prueba"], dtype=bool)
+        trayectoria.unidades = cabecera["unidades"]
+        trayectoria.muestras_por_bloque = MUESTRAS_POR_BLOQUE
+        trayectoria._redimensionar(max(num_pasos // trayectoria.cada, numero_muestras))
+        trayectoria.numero_muestras = numero_muestras
+        trayectoria.volcar()
+        return trayectoria
+
+
+# Escribir de forma atómica la cabecera de la trayectoria guardada en el directorio ruta
+def _escribir_cabecera(ruta, trayectoria, masas, prueba, unidades, capacidad):
+    cabecera = {
+        "formato": FORMATO,
+        "nombres": trayectoria.nombres,
+        "masas": None if masas is None else np.asarray(masas).tolist(),
+        "prueba": np.asarray(prueba).tolist(),
+        "unidades": unidades,
+        "cada": trayectoria.cada,
+        "paso_inicial": trayectoria.paso_inicial,
+        "numero_muestras": trayectoria.numero_muestras,
+        "capacidad": capacidad,
+        "velocidades": trayectoria._velocidades is not None,
+        "archivos": {archivo: {"forma_muestra": list(_forma_muestra(forma, len(trayectoria.nombres))), "tipo": tipo}
+                     for atributo, archivo, forma, tipo in _CAMPOS
+                     if atributo != "_velocidades" or trayectoria._velocidades is not None},
+    }
+    temporal = os.path.join(ruta, CABECERA + ".tmp")
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(cabecera, archivo, ensure_ascii=False, indent=1)
+    os.replace(temporal, os.path.join(ruta, CABECERA))
+
+
+# Guardar en el directorio ruta, con el formato de TrayectoriaDisco, las muestras de una trayectoria en memoria a
+# partir de la número `desde` (las anteriores ya están en disco; lo que hubiera después se sobrescribe). Solo se
+# escriben las muestras nuevas, así que guardar la historia en cada punto de control cuesta lo que ha crecido.
+# La cabecera se escribe al final: una escritura interrumpida deja válidas las muestras anteriores.
+def anexar_trayectoria(ruta, trayectoria, desde=0, masas=None, prueba=None):
+    os.makedirs(ruta, exist_ok=True)
+    numero_muestras = trayectoria.numero_muestras
+    desde = min(desde, numero_muestras)
+    for atributo, archivo, forma, tipo in _CAMPOS:
+        bufer = getattr(trayectoria, atributo)
+        if bufer is None:
+            continue
+        nuevas = np.ascontiguousarray(bufer[desde:numero_muestras], dtype=tipo)
+        bytes_por_muestra = (int(np.prod(_forma_muestra(forma, len(trayectoria.nombres)), dtype=np.int64))
+                             * np.dtype(tipo).itemsize)
+        ruta_archivo = os.path.join(ruta, archivo)
+        with open(ruta_archivo, "r+b" if desde and os.path.exists(ruta_archivo) else "wb") as destino:
+            destino.seek(desde * bytes_por_muestra)
+            destino.write(nuevas.tobytes())
+            destino.truncate()
+            destino.flush()
+            os.fsync(destino.fileno())
+    if prueba is None:
+        prueba = np.zeros(len(trayectoria.nombres), dtype=bool)
+    _escribir_cabecera(ruta, trayectoria, masas, prueba, dict(UNIDADES), numero_muestras)
+    return numero_muestras
+
+
+def leer_cabecera(ruta):
+    with open(os.path.join(ruta, CABECERA), encoding="utf-8") as archivo:
+        cabecera = json.load(archivo)
+    if cabecera.get("formato") != FORMATO:
+        raise ValueError(f"Formato de trayectoria no admitido: {cabecera.get('formato')!r} (se esperaba {FORMATO})")
+    return cabecera
+
+
+# Abrir una trayectoria guardada en disco sin leerla: los arreglos son mapas de solo lectura que se cargan bajo
+# demanda. Devuelve una Trayectoria con además masas, prueba, unidades y ruta.
+def abrir_trayectoria(ruta):
+    cabecera = leer_cabecera(ruta)
+    numero_muestras = cabecera["numero_muestras"]
+    numero_cuerpos = len(cabecera["nombres"])
+    buferes = {}
+    for atributo, archivo, forma, tipo in _CAMPOS:
+        if archivo in cabecera["archivos"]:
+            buferes[atributo] = _mapear(os.path.join(ruta, archivo), tipo, _forma_muestra(forma, numero_cuerpos),
+                                        numero_muestras, "r")
+    trayectoria = Trayectoria.desde_buferes(cabecera["nombres"], buferes["_posiciones"], buferes.get("_velocidades"),
+                                            buferes["_tiempos"], buferes["_pasos"], numero_muestras,
+                                            cada=cabecera["cada"], paso_inicial=cabecera["paso_inicial"],
+                                            duraciones=buferes["_duraciones"])
+    trayectoria.ruta = os.fspath(ruta)
+    trayectoria.masas = None if cabecera["masas"] is None else np.array(cabecera["masas"])
+    trayectoria.prueba = np.array(cabecera["prueba"], dtype=bool)
+    trayectoria.unidades = cabecera["unidades"]
+    return trayectoria
@@ -0,0 +1,119 @@
+# Datos y construcción de los escenarios de simulación
+
+import numpy as np
+
+from .fuerzas import G
+from .sistema import CuerpoCeleste, SistemaCeleste
+
+# Datos de los planetas proporcionados por el usuario
+datos_cuerpos_celestes = {
+    "Mercurio": {"mass": 3.285 * (10**23), "semi_major_axis": 0.3871 * 1.496e11, "orbital_velocity": 47.9 * 1000},
+    "Venus": {"mass": 4.867 * (10**24), "semi_major_axis": 0.7233 * 1.496e11, "orbital_velocity": 35.0 * 1000},
+    "Tierra": {"mass": 5.972 * (10**24), "semi_major_axis": 1.000 * 1.496e11, "orbital_velocity": 29.8 * 1000},
+    "Marte": {"mass": 6.39 * (10**23), "semi_major_axis": 1.5273 * 1.496e11, "orbital_velocity": 24.1 * 1000},
+    "Júpiter": {"mass": 1.898 * (10**27), "semi_major_axis": 5.2028 * 1.496e11, "orbital_velocity": 13.1 * 1000},
+    "Saturno": {"mass": 5.683 * (10**26), "semi_major_axis": 9.5388 * 1.496e11, "orbital_velocity": 9.6 * 1000},
+    "Urano": {"mass": 8.681 * (10**25), "semi_major_axis": 19.1914 * 1.496e11, "orbital_velocity": 6.8 * 1000},
+    "Neptuno": {"mass": 1.024 * (10**26), "semi_major_axis": 30.0611 * 1.496e11, "orbital_velocity": 5.4 * 1000}
+}
+
+MASA_SOL = 1.989 * (10**30)
+
+# Estrellas pasajeras: masa, posición inicial y velocidad
+masa_alpha_centauri_A = 2.18 * (10**30)
+posicion_inicial_alpha_centauri_A = [5.0 * 1.496e12, 0.0, 1.0 * 1.496e12]  # 5 UA en X, 1 UA en Z
+velocidad_alpha_centauri_A = [-5.0 * 1000, 0.0, 0.0]  # Movimiento hacia el negativo del eje X
+
+masa_super_gigante_roja = 3.978 * (10**31)  # Masa aproximada
+posicion_inicial_super_gigante_roja = [8.0 * 1.496e12, 0.0, 2.0 * 1.496e12]  # 8 UA en X, 2 UA en Z
+velocidad_super_gigante_roja = [-7.0 * 1000, 0.0, 0.0]  # Movimiento hacia el negativo del eje X
+
+
+# Sol en el origen seguido de los ocho planetas de datos_cuerpos_celestes
+def sistema_solar_completo():
+    cuerpos_celestes = []
+    for nombre, datos in datos_cuerpos_celestes.items():
+        cuerpo = CuerpoCeleste(nombre, datos["mass"], [datos["semi_major_axis"], 0.0, 0.0], [0.0, datos["orbital_velocity"], 0.0])
+        cuerpos_celestes.append(cuerpo)
+    sol = CuerpoCeleste("Sol", MASA_SOL, [0, 0, 0], [0, 0, 0])
+    cuerpos_celestes.insert(0, sol)
+    return cuerpos_celestes
+
+
+# Sol y planetas interiores (Mercurio a Marte) en órbitas circulares
+def sistema_solar_interno():
+    return [
+        CuerpoCeleste("Sol", MASA_SOL, [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]),
+        CuerpoCeleste("Mercurio", 3.285 * (10**23), [57.9e9, 0.0, 0.0], [0.0, 47870.0, 0.0]),
+        CuerpoCeleste("Venus", 4.867 * (10**24), [108.2e9, 0.0, 0.0], [0.0, 35020.0, 0.0]),
+        CuerpoCeleste("Tierra", 5.972 * (10**24), [149.6e9, 0.0, 0.0], [0.0, 29783.0, 0.0]),
+        CuerpoCeleste("Marte", 6.39 * (10**23), [227.9e9, 0.0, 0.0], [0.0, 24007.0, 0.0])
+    ]
+
+
+# Sol y planetas exteriores (Júpiter a Neptuno) en órbitas circulares
+def sistema_solar_externo():
+    return [
+        CuerpoCeleste("Sol", MASA_SOL, [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]),
+        CuerpoCeleste("Júpiter", 1.898 * (10**27), [778.5e9, 0.0, 0.0], [0.0, 13070.0, 0.0]),
+        CuerpoCeleste("Saturno", 5.683 * (10**26), [1433.5e9, 0.0, 0.0], [0.0, 9690.0, 0.0]),
+        CuerpoCeleste("Urano", 8.681 * (10**25), [2872.5e9, 0.0, 0.0], [0.0, 6800.0, 0.0]),
+        CuerpoCeleste("Neptuno", 1.024 * (10**26), [4495.1e9, 0.0, 0.0], [0.0, 5430.0, 0.0])
+    ]
+
+
+# Sistema solar completo con una estrella pasajera añadida al final
+def estrella_pasajera(nombre, masa, posicion, velocidad):
+    cuerpos_celestes = sistema_solar_completo()
+    cuerpos_celestes.append(CuerpoCeleste(nombre, masa, posicion, velocidad))
+    return cuerpos_celestes
+
+
+def alpha_centauri_A():
+    return estrella_pasajera("Alpha Centauri A", masa_alpha_centauri_A, posicion_inicial_alpha_centauri_A, velocidad_alpha_centauri_A)
+
+
+def super_gigante_roja():
+    return estrella_pasajera("Super Gigante Roja", masa_super_gigante_roja, posicion_inicial_super_gigante_roja, velocidad_super_gigante_roja)
+
+
+# Cinturón de partículas de prueba en órbitas circulares alrededor del Sol (semilla fija)
+# Devuelve posiciones y velocidades (numero, 3) para SistemaCeleste.agregar_particulas
+def cinturon_particulas_prueba(numero, radio_interior, radio_exterior, semilla=0):
+    generador = np.random.default_rng(semilla)
+    radio = generador.uniform(radio_interior, radio_exterior, numero)
+    angulo = generador.uniform(0.0, 2 * np.pi, numero)
+    altura = generador.normal(0.0, 0.01 * radio)  # Disco delgado
+    posiciones = np.column_stack([radio * np.cos(angulo), radio * np.sin(angulo), altura])
+    rapidez = np.sqrt(G * MASA_SOL / radio)  # Velocidad circular
+    velocidades = np.column_stack([-rapidez * np.sin(angulo), rapidez * np.cos(angulo), np.zeros(numero)])
+    return posiciones, velocidades
+
+
+# Disco sintético para medir el escalado: una estrella en el origen y `numero` planetesimales masivos en órbitas
+# circulares alrededor de ella (semilla fija). Radios uniformes entre radio_interior y radio_exterior (densidad
+# superficial ∝ 1/r), espesor del 1 % del radio y masas uniformes entre masa_minima y masa_maxima.
+# Devuelve directamente un SistemaCeleste con numero + 1 cuerpos (la estrella primero), sin crear un CuerpoCeleste
+# por planetesimal, para llegar a cientos de miles de cuerpos.
+def disco_planetesimales(numero, semilla=0, radio_interior=0.5 * 1.496e11, radio_exterior=5.0 * 1.496e11,
+                         masa_minima=1e18, masa_maxima=1e21, masa_estrella=MASA_SOL):
+    generador = np.random.default_rng(semilla)
+    radio = generador.uniform(radio_interior, radio_exterior, numero)
+    angulo = generador.uniform(0.0, 2 * np.pi, numero)
+    altura = generador.normal(0.0, 0.01 * radio)
+    rapidez = np.sqrt(G * masa_estrella / radio)
+    posiciones = np.vstack([np.zeros(3), np.column_stack([radio * np.cos(angulo), radio * np.sin(angulo), altura])])
+    velocidades = np.vstack([np.zeros(3), np.column_stack([-rapidez * np.sin(angulo), rapidez * np.cos(angulo),
+                                                           np.zeros(numero)])])
+    masas = np.concatenate([[masa_estrella], generador.uniform(masa_minima, masa_maxima, numero)])
+    nombres = ["Estrella"] + [f"Planetesimal {indice}" for indice in range(1, numero + 1)]
+    return SistemaCeleste.desde_arreglos(nombres, masas, posiciones, velocidades)
+
+
+# Estrellas pasajeras disponibles por nombre: (nombre del cuerpo, masa, posición inicial, velocidad)
+ESTRELLAS_PASAJERAS = {
+    "alpha_centauri_A": ("Alpha Centauri A", masa_alpha_centauri_A, posicion_inicial_alpha_centauri_A,
+                         velocidad_alpha_centauri_A),
+    "super_gigante_roja": ("Super Gigante Roja", masa_super_gigante_roja, posicion_inicial_super_gigante_roja,
+                           velocidad_super_gigante_roja),
+}
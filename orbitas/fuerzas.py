@@ -0,0 +1,162 @@
+# Núcleos de fuerza gravitacional para la simulación de órbitas
+
+from functools import lru_cache
+
+import numpy as np
+
+G = 6.674 * (10**(-11))  # Constante gravitacional
+DISTANCIA_MINIMA = 1e-10  # Distancia bajo la cual se ignora la interacción (evita división por cero)
+ELEMENTOS_POR_BLOQUE = 1 << 20  # Pares (objetivo, fuente) por bloque en el núcleo directo
+
+
+# Función para calcular la aceleración gravitacional de un cuerpo (versión escalar, cuerpo a cuerpo)
+def aceleracion_gravitacional(cuerpo, otros_cuerpos):
+    fuerza_total = np.zeros(3)  # Fuerza total inicializada a cero
+    for otro_cuerpo in otros_cuerpos:
+        if cuerpo != otro_cuerpo:
+            r = otro_cuerpo.posicion - cuerpo.posicion  # Vector de distancia
+            distancia = np.linalg.norm(r)  # Distancia entre cuerpos
+            if distancia < DISTANCIA_MINIMA:  # Evitar división por cero
+                continue
+            magnitud_fuerza = (G * cuerpo.masa * otro_cuerpo.masa) / (distancia**2)  # Magnitud de la fuerza
+            fuerza_total += magnitud_fuerza * r / distancia  # Fuerza total
+    return fuerza_total / cuerpo.masa  # Aceleración
+
+
+# Aceleraciones de todo el sistema en una sola pasada vectorizada
+# posiciones: arreglo (N, 3) en metros, masas: arreglo (N,) en kilogramos -> aceleraciones (N, 3)
+def aceleraciones_sistema(posiciones, masas, distancia_minima=DISTANCIA_MINIMA):
+    posiciones = np.asarray(posiciones, dtype=float)
+    return campo_gravitatorio(posiciones, posiciones, masas, distancia_minima)
+
+
+# Aceleración en las posiciones objetivo (M, 3) producida por las fuentes (N, 3) de masas (N,)
+# Para M * N grande se procesa por bloques de objetivos para no crear el arreglo (M, N, 3) completo
+def campo_gravitatorio(objetivos, fuentes, masas, distancia_minima=DISTANCIA_MINIMA):
+    objetivos = np.asarray(objetivos, dtype=float)
+    fuentes = np.asarray(fuentes, dtype=float)
+    masas = np.asarray(masas, dtype=float)
+    numero_objetivos = len(objetivos)
+    filas_por_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(len(fuentes), 1))
+    if filas_por_bloque >= numero_objetivos:
+        return _aceleraciones_bloque(objetivos, fuentes, masas, distancia_minima)
+    aceleraciones = np.empty((numero_objetivos, 3))
+    for inicio in range(0, numero_objetivos, filas_por_bloque):
+        fin = inicio + filas_por_bloque
+        aceleraciones[inicio:fin] = _aceleraciones_bloque(objetivos[inicio:fin], fuentes, masas, distancia_minima)
+    return aceleraciones
+
+
+# Aceleraciones sobre los objetivos producidas por todas las fuentes (pares ordenados, broadcast)
+def _aceleraciones_bloque(objetivos, fuentes, masas, distancia_minima):
+    r = fuentes[np.newaxis, :, :] - objetivos[:, np.newaxis, :]  # r[i, j] = x_j - x_i
+    distancia_cuadrada = np.einsum('ijk,ijk->ij', r, r)
+    distancia = np.sqrt(distancia_cuadrada)
+    cercanos = distancia < distancia_minima  # Incluye cada cuerpo consigo mismo
+    inverso_cubo = np.zeros_like(distancia)
+    np.divide(1.0, distancia_cuadrada * distancia, out=inverso_cubo, where=~cercanos)
+    return G * np.einsum('ij,ijk->ik', inverso_cubo * masas[np.newaxis, :], r)
+
+
+# Aceleraciones de una lista de objetos CuerpoCeleste usando el núcleo vectorizado
+def aceleraciones_cuerpos(cuerpos_celestes):
+    posiciones = np.array([cuerpo.posicion for cuerpo in cuerpos_celestes], dtype=float)
+    masas = np.array([cuerpo.masa for cuerpo in cuerpos_celestes], dtype=float)
+    return aceleraciones_sistema(posiciones, masas)
+
+
+# Índices (i, j) con i < j de todos los pares no ordenados de N cuerpos
+@lru_cache(maxsize=32)
+def _indices_pares(numero_cuerpos):
+    return np.triu_indices(numero_cuerpos, k=1)
+
+
+# Aceleraciones evaluando cada par una sola vez (tercera ley de Newton), versión vectorizada
+# Cada par aporta +m_j r / d^3 al cuerpo i y -m_i r / d^3 al cuerpo j
+def aceleraciones_pares(posiciones, masas, distancia_minima=DISTANCIA_MINIMA):
+    posiciones = np.asarray(posiciones, dtype=float)
+    masas = np.asarray(masas, dtype=float)
+    numero_cuerpos = len(masas)
+    i, j = _indices_pares(numero_cuerpos)
+    r = posiciones[j] - posiciones[i]  # Vector de distancia de cada par
+    distancia_cuadrada = np.einsum('pk,pk->p', r, r)
+    distancia = np.sqrt(distancia_cuadrada)
+    inverso_cubo = np.zeros_like(distancia)
+    np.divide(G, distancia_cuadrada * distancia, out=inverso_cubo, where=distancia >= distancia_minima)
+    hacia_i = inverso_cubo * masas[j]
+    hacia_j = inverso_cubo * masas[i]
+    aceleraciones = np.empty((numero_cuerpos, 3))
+    for eje in range(3):  # Repartir la contribución de cada par a sus dos cuerpos
+        aceleraciones[:, eje] = (np.bincount(i, weights=hacia_i * r[:, eje], minlength=numero_cuerpos)
+                                 - np.bincount(j, weights=hacia_j * r[:, eje], minlength=numero_cuerpos))
+    return aceleraciones
+
+
+# Aceleraciones evaluando cada par una sola vez, versión escalar (sin vectorizar, para N pequeño o referencia)
+def aceleraciones_pares_escalar(posiciones, masas, distancia_minima=DISTANCIA_MINIMA):
+    posiciones = np.asarray(posiciones, dtype=float)
+    numero_cuerpos = len(masas)
+    x, y, z = posiciones[:, 0].tolist(), posiciones[:, 1].tolist(), posiciones[:, 2].tolist()
+    m = np.asarray(masas, dtype=float).tolist()
+    ax, ay, az = [0.0] * numero_cuerpos, [0.0] * numero_cuerpos, [0.0] * numero_cuerpos
+    for i in range(numero_cuerpos):
+        for j in range(i + 1, numero_cuerpos):
+            rx, ry, rz = x[j] - x[i], y[j] - y[i], z[j] - z[i]
+            distancia_cuadrada = rx * rx + ry * ry + rz * rz
+            distancia = distancia_cuadrada ** 0.5
+            if distancia < distancia_minima:  # Evitar división por cero
+                continue
+            inverso_cubo = G / (distancia_cuadrada * distancia)
+            ax[i] += inverso_cubo * m[j] * rx
+            ay[i] += inverso_cubo * m[j] * ry
+            az[i] += inverso_cubo * m[j] * rz
+            ax[j] -= inverso_cubo * m[i] * rx
+            ay[j] -= inverso_cubo * m[i] * ry
+            az[j] -= inverso_cubo * m[i] * rz
+    return np.column_stack((ax, ay, az))
+
+
+# Barnes-Hut con theta = 0.5 (para otro ángulo pasar nucleo=BarnesHut(theta)); se importa al usarlo porque
+# barnes_hut depende de este módulo
+def aceleraciones_barnes_hut(posiciones, masas):
+    from .barnes_hut import BarnesHut
+    return BarnesHut()(posiciones, masas)
+
+
+# Núcleos de fuerza disponibles por nombre: todos los pares ordenados, cada par no ordenado una vez o el árbol
+# de Barnes-Hut (aproximado)
+NUCLEOS = {
+    "directo": aceleraciones_sistema,
+    "pares": aceleraciones_pares,
+    "pares_escalar": aceleraciones_pares_escalar,
+    "barnes_hut": aceleraciones_barnes_hut,
+}
+
+
+# Envolver un núcleo para un sistema con partículas de prueba (prueba: máscara (N,) de cuerpos sin masa activa)
+# Los cuerpos masivos se evalúan entre sí con el núcleo y las partículas solo sienten su campo: O(N² + N·M)
+def con_particulas_prueba(nucleo, prueba):
+    masivos = np.flatnonzero(~prueba)
+    particulas = np.flatnonzero(prueba)
+
+    def aceleraciones(posiciones, masas):
+        resultado = np.empty((len(posiciones), 3))
+        posiciones_masivas, masas_masivas = posiciones[masivos], masas[masivos]
+        resultado[masivos] = nucleo(posiciones_masivas, masas_masivas)
+        resultado[particulas] = campo_gravitatorio(posiciones[particulas], posiciones_masivas, masas_masivas)
+        return resultado
+
+    return aceleraciones
+
+
+# Buscar el núcleo de fuerza por nombre (o devolver la función si ya es invocable)
+# prueba: máscara de partículas de prueba del sistema; si hay alguna, el núcleo se envuelve con con_particulas_prueba
+def obtener_nucleo(nucleo, prueba=None):
+    if not callable(nucleo):
+        try:
+            nucleo = NUCLEOS[nucleo]
+        except KeyError:
+            raise ValueError(f"Núcleo de fuerza desconocido: {nucleo!r} (disponibles: {', '.join(NUCLEOS)})") from None
+    if prueba is not None and prueba.any():
+        return con_particulas_prueba(nucleo, prueba.copy())
+    return nucleo
@@ -0,0 +1,187 @@
+# Integrador IAS15 (Rein y Spiegel 2015): Gauss-Radau de orden 15 con paso adaptativo, para trayectorias de referencia
+
+from math import comb
+
+import numpy as np
+
+from .fuerzas import obtener_nucleo
+
+# Espaciado de Gauss-Radau dentro del paso (fracciones de dt) y número de coeficientes de la aceleración
+NODOS = np.array([0.0, 0.0562625605369221464656521910318, 0.180240691736892364987579942780,
+                  0.352624717113169637373907769648, 0.547153626330555383001448554766,
+                  0.734210177215410531523210605558, 0.885320946839095768090359771030,
+                  0.977520613561287501891174488626])
+ORDEN = 7
+PRECISION = 1e-9  # Precisión relativa por paso (epsilon de IAS15)
+FACTOR_SEGURIDAD = 0.25  # Un paso se repite si el nuevo dt es menor que esto por el dt dado; dt crece como máximo 1/esto
+ITERACIONES_MAXIMAS = 12
+
+
+# La aceleración dentro del paso es a(h) = a0 + sum_k b_k h^(k+1) con h en [0, 1]. Las diferencias divididas g_k
+# sobre los nodos (forma de Newton: g_k h (h - h1) ... (h - hk)) se pasan a b con b = NEWTON_A_B^T g
+def _matriz_newton_a_monomios():
+    matriz = np.zeros((ORDEN, ORDEN))
+    for k in range(ORDEN):
+        polinomio = np.polynomial.polynomial.polyfromroots(NODOS[1:k + 1])  # (h - h1) ... (h - hk), de menor a mayor
+        matriz[k, :k + 1] = polinomio  # Multiplicado por h: el coeficiente de h^j va a b_{j-1}
+    return matriz
+
+
+NEWTON_A_B = _matriz_newton_a_monomios()
+B_A_NEWTON = np.linalg.inv(NEWTON_A_B)
+_ENTEROS = np.arange(ORDEN)
+COEFICIENTES_POSICION = 1.0 / ((_ENTEROS + 2) * (_ENTEROS + 3))  # Doble integral de h^(k+1)
+COEFICIENTES_VELOCIDAD = 1.0 / (_ENTEROS + 2)  # Integral de h^(k+1)
+BINOMIALES = np.array([[comb(k + 1, m + 1) for k in range(ORDEN)] for m in range(ORDEN)], dtype=float)
+
+
+# Sumar incremento a valores con suma compensada de Kahan (compensacion guarda el error de redondeo acumulado)
+def _suma_compensada(valores, compensacion, incremento):
+    corregido = incremento - compensacion
+    nuevo = valores + corregido
+    compensacion[:] = (nuevo - valores) - corregido
+    valores[:] = nuevo
+
+
+# Motor IAS15: elige su propio paso para que el error por paso quede por debajo de la precisión de máquina
+# El paso dt de la simulación solo fija los instantes de salida: el motor llega exactamente a cada muestra registrada
+# (cada `cada` pasos) y al tiempo final. El método de integración es siempre IAS15; metodo se ignora.
+# Las estadísticas se acumulan en todos los avances del motor hasta reiniciar_estadisticas().
+class MotorIAS15:
+    nombre = "ias15"
+
+    def __init__(self, precision=PRECISION, dt_inicial=None):
+        self.precision = precision
+        self.dt_inicial = dt_inicial  # Primer paso interno (por defecto, el dt de salida)
+        self.contadores = None  # Contadores acumulados (serializables en JSON) de los que salen las estadísticas
+
+    def reiniciar_estadisticas(self):
+        self.contadores = None
+
+    @property
+    def estadisticas(self):
+        contadores = self.contadores
+        if contadores is None:
+            return None
+        return {
+            "pasos": contadores["pasos"],
+            "rechazados": contadores["rechazados"],
+            "evaluaciones": contadores["evaluaciones"],
+            "iteraciones_medias": contadores["iteraciones"] / max(contadores["pasos"] + contadores["rechazados"], 1),
+            "paso_final": contadores["paso_final"],
+        }
+
+    def admite(self, metodo, nucleo):
+        return True
+
+    def avanzar(self, sistema, num_pasos, dt, metodo=None, nucleo="directo", trayectoria=None):
+        if num_pasos <= 0:  # Nada que avanzar (como los motores de paso fijo)
+            return
+        aceleraciones = obtener_nucleo(nucleo, sistema.prueba)
+        masas = sistema.masas
+        posiciones = sistema.posiciones.copy()
+        velocidades = sistema.velocidades.copy()
+        compensacion_x = np.zeros_like(posiciones)
+        compensacion_v = np.zeros_like(velocidades)
+        b = np.zeros((ORDEN,) + posiciones.shape)
+        g = np.zeros_like(b)
+        paso_interno = self.dt_inicial or dt
+        pasos = rechazados = evaluaciones = iteraciones_totales = 0
+        ultimo_paso = paso_interno
+
+        cada = trayectoria.cada if trayectoria is not None else num_pasos
+        tiempo_inicial, paso_inicial = sistema.tiempo, sistema.numero_paso
+        relativo = paso_inicial - (trayectoria.paso_inicial if trayectoria is not None else paso_inicial)
+        paradas = list(range(cada - relativo % cada, num_pasos, cada)) + [num_pasos]  # Pasos de salida a alcanzar
+        tiempo = tiempo_inicial
+        for parada in paradas:
+            tiempo_parada = tiempo_inicial + parada * dt
+            while tiempo < tiempo_parada:
+                duracion = min(paso_interno, tiempo_parada - tiempo)
+                if pasos:  # Extrapolar b del paso anterior al nuevo intervalo
+                    self._escalar_prediccion(b, g, duracion / ultimo_paso, extrapolar=True)
+                a0 = aceleraciones(posiciones, masas)
+                evaluaciones += 1
+                while True:
+                    # Predictor-corrector: aceleraciones en los nodos con las posiciones que predice b
+                    anterior = np.inf
+                    for iteracion in range(ITERACIONES_MAXIMAS):
+                        b6_previo = b[-1].copy()
+                        for n in range(1, ORDEN + 1):
+                            h = NODOS[n]
+                            potencias = h ** (_ENTEROS + 1)
+                            x = posiciones + (h * duracion) * velocidades + (h * duracion) ** 2 * (
+                                0.5 * a0 + np.tensordot(COEFICIENTES_POSICION * potencias, b, axes=1))
+                            a = aceleraciones(x, masas)
+                            diferencia = (a - a0) / h  # Nueva diferencia dividida g_{n-1}
+                            for j in range(1, n):
+                                diferencia = (diferencia - g[j - 1]) / (h - NODOS[j])
+                            cambio = diferencia - g[n - 1]
+                            g[n - 1] = diferencia
+                            b[:n] += NEWTON_A_B[n - 1, :n, np.newaxis, np.newaxis] * cambio
+                        evaluaciones += ORDEN
+                        iteraciones_totales += 1
+                        escala = np.abs(a).max()
+                        error = np.abs(b[-1] - b6_previo).max() / escala if escala > 0 else 0.0
+                        if error < 1e-16 or (iteracion > 1 and error >= anterior):
+                            break
+                        anterior = error
+
+                    # Nuevo paso a partir del último coeficiente: error estimado ~ |b6| / |a|
+                    escala = np.abs(a).max()
+                    error_paso = np.abs(b[-1]).max() / escala if escala > 0 else 0.0
+                    if not np.isfinite(error_paso):
+                        raise FloatingPointError("IAS15: aceleraciones no finitas")
+                    if error_paso > 0:
+                        nuevo = duracion * (self.precision / error_paso) ** (1 / 7)
+                    else:
+                        nuevo = duracion / FACTOR_SEGURIDAD
+                    if nuevo < FACTOR_SEGURIDAD * duracion:  # Paso rechazado: repetir más corto
+                        rechazados += 1
+                        self._escalar_prediccion(b, g, nuevo / duracion, extrapolar=False)
+                        duracion = nuevo
+                        continue
+                    break
+
+                # Paso aceptado: posiciones y velocidades al final del paso con suma compensada
+                _suma_compensada(posiciones, compensacion_x, duracion * velocidades + duracion ** 2 * (
+                    0.5 * a0 + np.tensordot(COEFICIENTES_POSICION, b, axes=1)))
+                _suma_compensada(velocidades, compensacion_v, duracion * (
+                    a0 + np.tensordot(COEFICIENTES_VELOCIDAD, b, axes=1)))
+                tiempo += duracion
+                pasos += 1
+                ultimo_paso = duracion
+                if duracion == paso_interno:
+                    paso_interno = min(nuevo, duracion / FACTOR_SEGURIDAD)
+                else:  # Paso recortado para llegar a una parada: solo puede acortar el paso natural
+                    paso_interno = min(paso_interno, nuevo)
+
+            sistema.tiempo = tiempo_parada
+            sistema.numero_paso = paso_inicial + parada
+            sistema.posiciones = posiciones  # Invalida las aceleraciones guardadas
+            sistema.velocidades = velocidades
+            if trayectoria is not None:
+                trayectoria.registrar(sistema.numero_paso, sistema.tiempo, sistema, ultimo_paso)
+            tiempo = tiempo_parada
+
+        anteriores = self.contadores or {"pasos": 0, "rechazados": 0, "evaluaciones": 0, "iteraciones": 0}
+        self.contadores = {
+            "pasos": anteriores["pasos"] + pasos,
+            "rechazados": anteriores["rechazados"] + rechazados,
+            "evaluaciones": anteriores["evaluaciones"] + evaluaciones,
+            "iteraciones": anteriores["iteraciones"] + iteraciones_totales,
+            "paso_final": float(paso_interno),
+        }
+        if trayectoria is not None:
+            trayectoria.estadisticas = self.estadisticas
+
+    # Estimación de b y g para el siguiente intento con un paso q veces el actual
+    # extrapolar: el nuevo paso empieza donde terminó el anterior (a(1 + q s)); si no, se repite desde el mismo inicio
+    @staticmethod
+    def _escalar_prediccion(b, g, q, extrapolar):
+        potencias = q ** (_ENTEROS + 1)
+        if extrapolar:
+            b[:] = np.tensordot(BINOMIALES * potencias[:, np.newaxis], b, axes=1)
+        else:
+            b *= potencias[:, np.newaxis, np.newaxis]
+        g[:] = np.tensordot(B_A_NEWTON.T, b, axes=1)
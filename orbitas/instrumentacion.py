@@ -0,0 +1,169 @@
+# Instrumentación del bucle de simulación: tiempo por fase y perfiles de cProfile
+#
+# Desactivada no cuesta nada: las fases se miden envolviendo el núcleo de fuerza, el registro de la trayectoria
+# y los diagnósticos solo cuando se pide, sin comprobaciones en el bucle de pasos.
+
+import cProfile
+import os
+import pstats
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from .fuerzas import NUCLEOS
+
+# Fases que se miden directamente; "actualizaciones" (deriva e impulsos del integrador) es el resto de
+# "integracion" y "otros" (preparación, puntos de control, volcados a disco) el resto de "total"
+FASES = ("total", "integracion", "fuerzas", "registro", "diagnosticos", "graficas")
+EXTENSIONES_COLAPSADAS = (".folded", ".txt")  # Perfil como pilas colapsadas (flamegraph.pl, speedscope)
+
+
+# Tiempo de reloj y número de llamadas acumulados por fase
+class Fases:
+    def __init__(self):
+        self.segundos = defaultdict(float)
+        self.llamadas = defaultdict(int)
+
+    def anotar(self, fase, segundos, llamadas=1):
+        self.segundos[fase] += segundos
+        self.llamadas[fase] += llamadas
+
+    @contextmanager
+    def medir(self, fase):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.anotar(fase, time.perf_counter() - inicio)
+
+    # Función que hace lo mismo que `funcion` y anota en `fase` el tiempo de cada llamada
+    def envolver(self, fase, funcion):
+        segundos, llamadas = self.segundos, self.llamadas
+        reloj = time.perf_counter
+
+        def medida(*argumentos, **opciones):
+            inicio = reloj()
+            try:
+                return funcion(*argumentos, **opciones)
+            finally:
+                segundos[fase] += reloj() - inicio
+                llamadas[fase] += 1
+
+        medida.__name__ = getattr(funcion, "__name__", type(funcion).__name__)
+        medida.__wrapped__ = funcion
+        return medida
+
+    # {fase: {"segundos", "llamadas"}} con las fases medidas y los restos derivados (llamadas None)
+    def resumen(self):
+        resumen = {fase: {"segundos": self.segundos[fase], "llamadas": self.llamadas[fase]}
+                   for fase in FASES + tuple(sorted(set(self.segundos) - set(FASES))) if fase in self.segundos}
+        if "fuerzas" in self.segundos:  # Sin fuerzas medidas (motor compilado) el resto no separa nada
+            resto = self.segundos["integracion"] - sum(self.segundos[fase] for fase in ("fuerzas", "registro",
+                                                                                         "diagnosticos"))
+            resumen["actualizaciones"] = {"segundos": max(resto, 0.0), "llamadas": None}
+        if "total" in self.segundos:
+            resumen["otros"] = {"segundos": max(self.segundos["total"] - self.segundos["integracion"], 0.0),
+                                "llamadas": None}
+        return resumen
+
+    # Tabla de texto con segundos, llamadas, microsegundos por llamada y fracción del tiempo de simulación
+    # (la fase "graficas" queda fuera de "total": puede superar el 100 %)
+    def informe(self):
+        resumen = self.resumen()
+        total = self.segundos.get("total") or sum(self.segundos.values()) or 1.0
+        lineas = [f"{'fase':<16} {'s':>9} {'llamadas':>10} {'µs/llamada':>11} {'% simulación':>13}"]
+        for fase, datos in resumen.items():
+            llamadas = datos["llamadas"]
+            por_llamada = f"{datos['segundos'] / llamadas * 1e6:>11.1f}" if llamadas else f"{'':>11}"
+            lineas.append(f"{fase:<16} {datos['segundos']:>9.4f} {llamadas if llamadas is not None else '':>10} "
+                          f"{por_llamada} {100 * datos['segundos'] / total:>13.1f}")
+        return "\n".join(lineas)
+
+
+# Motor que envuelve a otro y anota el tiempo de cada avance, de las evaluaciones de fuerza (si el motor acepta
+# un núcleo como función: el compilado no), del registro de la trayectoria y de los diagnósticos
+class MotorInstrumentado:
+    def __init__(self, motor, fases):
+        self.motor = motor
+        self.fases = fases
+        self.nombre = getattr(motor, "nombre", None) or type(motor).__name__
+        self.pasos_variables = getattr(motor, "pasos_variables", False)
+        self.diagnosticos = getattr(motor, "diagnosticos", None)
+        self._nucleos = {}  # Núcleo envuelto por núcleo original, para no envolver en cada avance
+
+    def admite(self, metodo, nucleo):
+        return self.motor.admite(metodo, nucleo)
+
+    def avanzar(self, sistema, num_pasos, dt, metodo="leapfrog", nucleo="directo", trayectoria=None):
+        fases = self.fases
+        clave = nucleo if isinstance(nucleo, str) else id(nucleo)
+        if clave not in self._nucleos:
+            funcion = NUCLEOS.get(nucleo) if isinstance(nucleo, str) else nucleo
+            envuelto = None if funcion is None else fases.envolver("fuerzas", funcion)
+            self._nucleos[clave] = envuelto if envuelto is not None and self.admite(metodo, envuelto) else nucleo
+        if trayectoria is not None and "registrar" not in vars(trayectoria):
+            trayectoria.registrar = fases.envolver("registro", trayectoria.registrar)
+        if self.diagnosticos is not None and "medir" not in vars(self.diagnosticos):
+            self.diagnosticos.medir = fases.envolver("diagnosticos", self.diagnosticos.medir)
+        inicio = time.perf_counter()
+        try:
+            self.motor.avanzar(sistema, num_pasos, dt, metodo=metodo, nucleo=self._nucleos[clave],
+                               trayectoria=trayectoria)
+        finally:
+            fases.anotar("integracion", time.perf_counter() - inicio)
+        if hasattr(self.motor, "estadisticas"):
+            self.estadisticas = self.motor.estadisticas
+
+    # Quitar los envoltorios de la trayectoria y los diagnósticos al terminar
+    def retirar(self, trayectoria):
+        if trayectoria is not None:
+            vars(trayectoria).pop("registrar", None)
+        if self.diagnosticos is not None:
+            vars(self.diagnosticos).pop("medir", None)
+
+
+# Etiqueta de una función de pstats para una pila colapsada: "nombre (archivo:línea)", sin ';'
+def _etiqueta(funcion):
+    archivo, linea, nombre = funcion
+    etiqueta = nombre if archivo == "~" else f"{nombre} ({os.path.basename(archivo)}:{linea})"
+    return etiqueta.replace(";", ",")
+
+
+# Pilas colapsadas ("raíz;...;función microsegundos") reconstruidas del grafo de llamadas de cProfile
+# cProfile solo guarda pares llamador-llamado: el tiempo de cada función se reparte entre sus llamadores en
+# proporción al tiempo acumulado de cada arista (la aproximación habitual de las herramientas de flamegraph)
+def pilas_colapsadas(estadisticas):
+    datos = estadisticas.stats  # funcion -> (llamadas primitivas, llamadas, tiempo propio, acumulado, llamadores)
+    llamados = defaultdict(dict)
+    for funcion, (_, _, _, _, llamadores) in datos.items():
+        for llamador, arista in llamadores.items():
+            llamados[llamador][funcion] = arista[3]
+    pilas = defaultdict(float)
+
+    def recorrer(funcion, pila, vistas, fraccion):
+        pila = pila + (_etiqueta(funcion),)
+        pilas[";".join(pila)] += datos[funcion][2] * fraccion
+        for hijo, acumulado in llamados[funcion].items():
+            if hijo not in vistas and datos[hijo][3] > 0:  # Las recursiones se cortan en la primera repetición
+                recorrer(hijo, pila, vistas | {hijo}, fraccion * min(acumulado / datos[hijo][3], 1.0))
+
+    for raiz in (funcion for funcion, valores in datos.items() if not valores[4]):
+        recorrer(raiz, (), {raiz}, 1.0)
+    return [f"{pila} {round(segundos * 1e6)}" for pila, segundos in pilas.items() if round(segundos * 1e6) > 0]
+
+
+# Ejecutar el bloque bajo cProfile y guardar el perfil en ruta: pilas colapsadas si la extensión es .folded o
+# .txt (para flamegraph.pl o speedscope), si no el archivo de pstats (python -m pstats ruta, snakeviz)
+@contextmanager
+def perfilar(ruta):
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        yield perfil
+    finally:
+        perfil.disable()
+        if os.path.splitext(ruta)[1] in EXTENSIONES_COLAPSADAS:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write("\n".join(pilas_colapsadas(pstats.Stats(perfil))) + "\n")
+        else:
+            perfil.dump_stats(ruta)
@@ -0,0 +1,100 @@
+# Métodos de integración (Leapfrog, Euler-Cromer y composiciones simplécticas de orden 4 y 6)
+
+import numpy as np
+
+from .fuerzas import aceleraciones_sistema
+from .wisdom_holman import avanzar_wisdom_holman, paso_wisdom_holman
+
+
+# Paso Leapfrog kick-drift-kick para todo el sistema: todas las aceleraciones se evalúan al mismo tiempo
+# Una sola evaluación de fuerza por paso: la aceleración al final del paso se guarda en el sistema y el
+# impulso de cierre se aplica junto con el de apertura del paso siguiente. Las velocidades a tiempo
+# completo solo se reconstruyen cuando alguien las pide (sistema.velocidades).
+def paso_leapfrog(sistema, dt, aceleraciones=aceleraciones_sistema):
+    if sistema.aceleraciones is None:  # Primera evaluación: aceleraciones en las posiciones iniciales
+        sistema.aceleraciones = aceleraciones(sistema.posiciones, sistema.masas)
+
+    velocidades_medias = sistema.velocidades_medias
+    if sistema.medio_impulso is None:  # Impulso de apertura desde las velocidades sincronizadas
+        np.add(sistema.velocidades, 0.5 * dt * sistema.aceleraciones, out=velocidades_medias)
+    elif sistema.medio_impulso != 0.5 * dt:  # El paso anterior abrió con otro dt: completar el impulso
+        velocidades_medias += (0.5 * dt - sistema.medio_impulso) * sistema.aceleraciones
+
+    posiciones = sistema.posiciones
+    posiciones += dt * velocidades_medias  # Deriva
+    sistema.aceleraciones = aceleraciones(posiciones, sistema.masas)
+    velocidades_medias += dt * sistema.aceleraciones  # Impulso de cierre y apertura del siguiente paso
+    sistema.medio_impulso = 0.5 * dt
+    sistema.velocidades_desfasadas = True
+
+
+# Paso Euler-Cromer para todo el sistema
+def paso_euler_cromer(sistema, dt, aceleraciones=aceleraciones_sistema):
+    aceleraciones_actuales = aceleraciones(sistema.posiciones, sistema.masas)  # Calcular las aceleraciones
+    sistema.velocidades += dt * aceleraciones_actuales  # Actualizar las velocidades
+    sistema.posiciones += dt * sistema.velocidades  # Actualizar las posiciones
+
+
+# Pesos de composición (Yoshida 1990): una secuencia simétrica de pasos Leapfrog de duración w * dt
+# que cancela los términos de error de orden bajo. Los pasos negativos son parte del método.
+_RAIZ_CUBICA_2 = 2 ** (1 / 3)
+PESOS_YOSHIDA4 = (1 / (2 - _RAIZ_CUBICA_2), -_RAIZ_CUBICA_2 / (2 - _RAIZ_CUBICA_2), 1 / (2 - _RAIZ_CUBICA_2))
+_W1, _W2, _W3 = -1.17767998417887, 0.235573213359357, 0.784513610477560  # Solución A de orden 6
+PESOS_YOSHIDA6 = (_W3, _W2, _W1, 1 - 2 * (_W1 + _W2 + _W3), _W1, _W2, _W3)
+
+
+# Paso compuesto: pasos Leapfrog con los pesos dados; cada impulso de cierre se funde con el de apertura
+# del subpaso siguiente (paso_leapfrog completa el medio impulso cuando cambia dt), una fuerza por subpaso
+def paso_compuesto(sistema, dt, aceleraciones=aceleraciones_sistema, pesos=PESOS_YOSHIDA4):
+    for peso in pesos:
+        paso_leapfrog(sistema, peso * dt, aceleraciones)
+
+
+# Paso Yoshida de orden 4 (triple salto): 3 evaluaciones de fuerza por paso
+def paso_yoshida4(sistema, dt, aceleraciones=aceleraciones_sistema):
+    paso_compuesto(sistema, dt, aceleraciones, PESOS_YOSHIDA4)
+
+
+# Paso Yoshida de orden 6: 7 evaluaciones de fuerza por paso
+def paso_yoshida6(sistema, dt, aceleraciones=aceleraciones_sistema):
+    paso_compuesto(sistema, dt, aceleraciones, PESOS_YOSHIDA6)
+
+
+# Paso Forest-Ruth de orden 4 en su forma original deriva-impulso-deriva (empieza y termina derivando)
+def paso_forest_ruth(sistema, dt, aceleraciones=aceleraciones_sistema):
+    theta = PESOS_YOSHIDA4[0]
+    velocidades = sistema.velocidades.copy()  # Velocidades sincronizadas: aquí no hay medio impulso pendiente
+    posiciones = sistema.posiciones
+    for deriva, impulso in ((0.5 * theta, theta), (0.5 * (1 - theta), 1 - 2 * theta), (0.5 * (1 - theta), theta)):
+        posiciones += deriva * dt * velocidades
+        velocidades += impulso * dt * aceleraciones(posiciones, sistema.masas)
+    posiciones += 0.5 * theta * dt * velocidades
+    sistema.velocidades = velocidades  # Deja el sistema sin medio impulso del Leapfrog
+    sistema.aceleraciones = None  # Las posiciones cambiaron después de la última evaluación
+
+
+# Métodos disponibles por nombre
+METODOS = {
+    "leapfrog": paso_leapfrog,
+    "euler_cromer": paso_euler_cromer,
+    "yoshida4": paso_yoshida4,
+    "yoshida6": paso_yoshida6,
+    "forest_ruth": paso_forest_ruth,
+    "wisdom_holman": paso_wisdom_holman,
+}
+
+
+# Métodos que conservan su propio estado entre pasos: el motor NumPy les pasa todo el tramo de una vez en lugar de
+# llamar al paso uno a uno (Wisdom-Holman se queda en coordenadas heliocéntricas hasta que hay que registrar)
+AVANCES = {
+    "wisdom_holman": avanzar_wisdom_holman,
+}
+
+
+# Buscar el paso de integración por nombre
+def obtener_metodo(metodo):
+    try:
+        return METODOS[metodo]
+    except KeyError:
+        raise ValueError(f"Método de integración desconocido: {metodo!r} (disponibles: {', '.join(METODOS)})") from None
+
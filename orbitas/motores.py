@@ -0,0 +1,252 @@
+# Motores del bucle de pasos: NumPy (siempre disponible) y Numba (opcional, compila el bucle completo)
+
+import importlib.util
+import warnings
+
+import numpy as np
+
+from .fuerzas import DISTANCIA_MINIMA, G, obtener_nucleo
+from .integradores import AVANCES, obtener_metodo
+
+# Numba es opcional: sin él se usa el motor NumPy. Solo se comprueba que esté instalado; importarlo cuesta
+# varias décimas de segundo, así que se importa la primera vez que se usa el motor compilado
+NUMBA_DISPONIBLE = importlib.util.find_spec("numba") is not None
+
+
+# Motor NumPy: un paso de integración por iteración de Python, con cualquier método y núcleo de fuerza
+class MotorNumpy:
+    nombre = "numpy"
+
+    def admite(self, metodo, nucleo):
+        return True
+
+    # Avanzar num_pasos pasos de duración dt, registrando en la trayectoria si se indica
+    def avanzar(self, sistema, num_pasos, dt, metodo="leapfrog", nucleo="directo", trayectoria=None):
+        paso = obtener_metodo(metodo)
+        aceleraciones = obtener_nucleo(nucleo, sistema.prueba)
+        if metodo in AVANCES:
+            AVANCES[metodo](sistema, num_pasos, dt, aceleraciones, trayectoria)
+            return
+        for _ in range(num_pasos):
+            paso(sistema, dt, aceleraciones)
+            sistema.tiempo += dt
+            sistema.numero_paso += 1
+            if trayectoria is not None:
+                trayectoria.registrar(sistema.numero_paso, sistema.tiempo, sistema, dt)
+
+
+# Aceleraciones por pares (tercera ley de Newton) con bucles explícitos, para compilar con Numba
+# masivos / particulas: índices de los cuerpos que ejercen fuerza y de las partículas de prueba
+def _aceleraciones_compiladas(posiciones, masas, masivos, particulas, distancia_minima, constante, aceleraciones):
+    aceleraciones[:, :] = 0.0
+    numero_masivos = masivos.shape[0]
+    for a in range(numero_masivos):
+        i = masivos[a]
+        for b in range(a + 1, numero_masivos):
+            j = masivos[b]
+            rx = posiciones[j, 0] - posiciones[i, 0]
+            ry = posiciones[j, 1] - posiciones[i, 1]
+            rz = posiciones[j, 2] - posiciones[i, 2]
+            distancia_cuadrada = rx * rx + ry * ry + rz * rz
+            distancia = np.sqrt(distancia_cuadrada)
+            if distancia < distancia_minima:  # Evitar división por cero
+                continue
+            inverso_cubo = constante / (distancia_cuadrada * distancia)
+            hacia_i = inverso_cubo * masas[j]
+            hacia_j = inverso_cubo * masas[i]
+            aceleraciones[i, 0] += hacia_i * rx
+            aceleraciones[i, 1] += hacia_i * ry
+            aceleraciones[i, 2] += hacia_i * rz
+            aceleraciones[j, 0] -= hacia_j * rx
+            aceleraciones[j, 1] -= hacia_j * ry
+            aceleraciones[j, 2] -= hacia_j * rz
+    for p in range(particulas.shape[0]):  # Las partículas de prueba solo sienten a los masivos
+        i = particulas[p]
+        for b in range(numero_masivos):
+            j = masivos[b]
+            rx = posiciones[j, 0] - posiciones[i, 0]
+            ry = posiciones[j, 1] - posiciones[i, 1]
+            rz = posiciones[j, 2] - posiciones[i, 2]
+            distancia_cuadrada = rx * rx + ry * ry + rz * rz
+            distancia = np.sqrt(distancia_cuadrada)
+            if distancia < distancia_minima:
+                continue
+            hacia_i = constante * masas[j] / (distancia_cuadrada * distancia)
+            aceleraciones[i, 0] += hacia_i * rx
+            aceleraciones[i, 1] += hacia_i * ry
+            aceleraciones[i, 2] += hacia_i * rz
+
+
+# Bucle Leapfrog kick-drift-kick completo; devuelve el índice de la siguiente muestra libre
+# velocidades_medias llega ya abierta con medio impulso y sale igual (mismo convenio que paso_leapfrog)
+def _leapfrog_compilado(posiciones, velocidades_medias, aceleraciones, masas, masivos, particulas, dt, num_pasos, cada, paso_relativo,
+                        registro_posiciones, registro_velocidades, guardar_velocidades, muestra,
+                        distancia_minima, constante):
+    numero_cuerpos = posiciones.shape[0]
+    capacidad = registro_posiciones.shape[0]
+    for _ in range(num_pasos):
+        for i in range(numero_cuerpos):
+            for eje in range(3):
+                posiciones[i, eje] += dt * velocidades_medias[i, eje]
+        _aceleraciones_compiladas(posiciones, masas, masivos, particulas, distancia_minima, constante, aceleraciones)
+        for i in range(numero_cuerpos):
+            for eje in range(3):
+                velocidades_medias[i, eje] += dt * aceleraciones[i, eje]
+        paso_relativo += 1
+        if paso_relativo % cada == 0 and muestra < capacidad:
+            registro_posiciones[muestra, :, :] = posiciones
+            if guardar_velocidades:
+                for i in range(numero_cuerpos):
+                    for eje in range(3):
+                        registro_velocidades[muestra, i, eje] = velocidades_medias[i, eje] - 0.5 * dt * aceleraciones[i, eje]
+            muestra += 1
+    return muestra
+
+
+# Bucle Euler-Cromer completo; devuelve el índice de la siguiente muestra libre
+def _euler_cromer_compilado(posiciones, velocidades, aceleraciones, masas, masivos, particulas, dt, num_pasos, cada, paso_relativo,
+                            registro_posiciones, registro_velocidades, guardar_velocidades, muestra,
+                            distancia_minima, constante):
+    numero_cuerpos = posiciones.shape[0]
+    capacidad = registro_posiciones.shape[0]
+    for _ in range(num_pasos):
+        _aceleraciones_compiladas(posiciones, masas, masivos, particulas, distancia_minima, constante, aceleraciones)
+        for i in range(numero_cuerpos):
+            for eje in range(3):
+                velocidades[i, eje] += dt * aceleraciones[i, eje]
+                posiciones[i, eje] += dt * velocidades[i, eje]
+        paso_relativo += 1
+        if paso_relativo % cada == 0 and muestra < capacidad:
+            registro_posiciones[muestra, :, :] = posiciones
+            if guardar_velocidades:
+                registro_velocidades[muestra, :, :] = velocidades
+            muestra += 1
+    return muestra
+
+
+_COMPILADO = False
+
+
+# Sustituir los bucles por sus versiones compiladas con Numba (una sola vez, en el primer uso)
+# cache=True guarda el código compilado en __pycache__ para que las siguientes ejecuciones no paguen el JIT
+def _compilar():
+    global _aceleraciones_compiladas, _leapfrog_compilado, _euler_cromer_compilado, _COMPILADO
+    if _COMPILADO:
+        return
+    import numba
+    _aceleraciones_compiladas = numba.njit(cache=True)(_aceleraciones_compiladas)
+    _leapfrog_compilado = numba.njit(cache=True)(_leapfrog_compilado)
+    _euler_cromer_compilado = numba.njit(cache=True)(_euler_cromer_compilado)
+    _COMPILADO = True
+
+
+# Aceleraciones (N, 3) con el núcleo compilado del motor Numba, fuera del bucle de pasos (p. ej. para medirlo)
+# Compila en el primer uso; sin Numba ejecuta el mismo bucle en Python. prueba: máscara de partículas de prueba;
+# salida: arreglo (N, 3) en el que escribirlas para no reservar memoria en cada llamada
+def aceleraciones_numba(posiciones, masas, prueba=None, salida=None):
+    if NUMBA_DISPONIBLE:
+        _compilar()
+    prueba = np.zeros(len(masas), dtype=bool) if prueba is None else np.asarray(prueba, dtype=bool)
+    if salida is None:
+        salida = np.empty((len(masas), 3))
+    _aceleraciones_compiladas(posiciones, masas, np.flatnonzero(~prueba), np.flatnonzero(prueba), DISTANCIA_MINIMA, G,
+                              salida)
+    return salida
+
+
+# Motor Numba: compila el bucle de pasos entero (Leapfrog o Euler-Cromer con suma directa por pares)
+# Las partículas de prueba del sistema solo se evalúan frente a los cuerpos masivos
+class MotorNumba:
+    nombre = "numba"
+    NUCLEOS_ADMITIDOS = ("directo", "pares", "pares_escalar")  # Todos calculan la misma suma directa
+
+    def admite(self, metodo, nucleo):
+        return metodo in ("leapfrog", "euler_cromer") and nucleo in self.NUCLEOS_ADMITIDOS
+
+    def avanzar(self, sistema, num_pasos, dt, metodo="leapfrog", nucleo="directo", trayectoria=None):
+        if not self.admite(metodo, nucleo):
+            raise ValueError(f"El motor numba no admite metodo={metodo!r} con nucleo={nucleo!r}")
+        if NUMBA_DISPONIBLE:
+            _compilar()
+        numero_cuerpos = sistema.numero_cuerpos
+        posiciones = sistema.posiciones
+        masas = sistema.masas
+        if trayectoria is not None:
+            paso_relativo = sistema.numero_paso - trayectoria.paso_inicial
+            cada = trayectoria.cada
+            # El bucle compilado no puede ampliar los búferes: se reserva antes sitio para todo el bloque
+            trayectoria.reservar((paso_relativo + num_pasos) // cada - paso_relativo // cada)
+            registro_posiciones = trayectoria._posiciones
+            registro_velocidades = trayectoria._velocidades
+            muestra = trayectoria.numero_muestras
+        else:
+            registro_posiciones = np.empty((0, numero_cuerpos, 3))
+            registro_velocidades = None
+            muestra, paso_relativo, cada = 0, 0, 1
+        guardar_velocidades = registro_velocidades is not None
+        if not guardar_velocidades:
+            registro_velocidades = np.empty((0, numero_cuerpos, 3))
+        paso_inicial, tiempo_inicial = sistema.numero_paso, sistema.tiempo
+        masivos = np.flatnonzero(~sistema.prueba)
+        particulas = np.flatnonzero(sistema.prueba)
+
+        if metodo == "leapfrog":
+            if sistema.aceleraciones is None:
+                sistema.aceleraciones = np.empty((numero_cuerpos, 3))
+                _aceleraciones_compiladas(posiciones, masas, masivos, particulas, DISTANCIA_MINIMA, G,
+                                          sistema.aceleraciones)
+            velocidades_medias = sistema.velocidades_medias
+            if sistema.medio_impulso is None:  # Impulso de apertura desde las velocidades sincronizadas
+                np.add(sistema.velocidades, 0.5 * dt * sistema.aceleraciones, out=velocidades_medias)
+            elif sistema.medio_impulso != 0.5 * dt:
+                velocidades_medias += (0.5 * dt - sistema.medio_impulso) * sistema.aceleraciones
+            muestra = _leapfrog_compilado(posiciones, velocidades_medias, sistema.aceleraciones, masas, masivos,
+                                          particulas, dt, num_pasos, cada, paso_relativo, registro_posiciones,
+                                          registro_velocidades, guardar_velocidades, muestra, DISTANCIA_MINIMA, G)
+            sistema.medio_impulso = 0.5 * dt
+            sistema.velocidades_desfasadas = True
+        else:
+            velocidades = sistema.velocidades
+            aceleraciones = np.empty((numero_cuerpos, 3))
+            muestra = _euler_cromer_compilado(posiciones, velocidades, aceleraciones, masas, masivos, particulas, dt,
+                                              num_pasos, cada, paso_relativo, registro_posiciones,
+                                              registro_velocidades, guardar_velocidades, muestra, DISTANCIA_MINIMA, G)
+            sistema.medio_impulso = None
+            sistema.aceleraciones = None
+
+        sistema.numero_paso += num_pasos
+        sistema.tiempo += num_pasos * dt
+        if trayectoria is not None:
+            trayectoria.anotar_bloque(muestra, paso_inicial, tiempo_inicial, dt)
+
+
+# IAS15 se importa al pedirlo (como el núcleo de Barnes-Hut en fuerzas.NUCLEOS)
+def _motor_ias15():
+    from .ias15 import MotorIAS15
+    return MotorIAS15()
+
+
+# Motores disponibles por nombre: cada valor crea un motor nuevo
+MOTORES = {
+    "numpy": MotorNumpy,
+    "numba": MotorNumba,
+    "ias15": _motor_ias15,
+}
+
+
+# Elegir el motor: "auto" usa Numba si está instalado y admite el método y el núcleo, si no NumPy
+# Pedir "numba" sin tenerlo instalado avisa y continúa con NumPy
+def obtener_motor(motor="numpy", metodo="leapfrog", nucleo="directo"):
+    if not isinstance(motor, str):
+        return motor
+    if motor == "auto":
+        if NUMBA_DISPONIBLE and MotorNumba().admite(metodo, nucleo):
+            return MotorNumba()
+        return MotorNumpy()
+    if motor == "numba" and not NUMBA_DISPONIBLE:
+        warnings.warn("Numba no está instalado; se usa el motor NumPy", RuntimeWarning, stacklevel=3)
+        return MotorNumpy()
+    try:
+        return MOTORES[motor]()
+    except KeyError:
+        raise ValueError(f"Motor desconocido: {motor!r} (disponibles: auto, {', '.join(MOTORES)})") from None
@@ -0,0 +1,190 @@
+# Puntos de control: estado completo del integrador en un archivo binario (.npz) escrito de forma atómica
+
+import json
+import os
+import time
+
+import numpy as np
+
+from .diagnosticos import Diagnosticos
+from .disco import TrayectoriaDisco, abrir_trayectoria, anexar_trayectoria
+from .sistema import SistemaCeleste
+from .trayectoria import Trayectoria
+from .wisdom_holman import _Heliocentricas
+
+FORMATO = 1  # Versión del formato de los puntos de control
+
+
+# Nombre con el que se identifica un núcleo o motor: el propio texto, su atributo nombre, el nombre de la función
+# o el de su clase
+def identidad(objeto):
+    if isinstance(objeto, str):
+        return objeto
+    return getattr(objeto, "nombre", None) or getattr(objeto, "__name__", None) or type(objeto).__name__
+
+
+# Motor más interno bajo los envoltorios (diagnósticos, instrumentación): el que guarda los contadores de estadísticas
+def motor_base(motor):
+    while hasattr(motor, "motor"):
+        motor = motor.motor
+    return motor
+
+
+# Sufijo del directorio junto al punto de control en el que se guarda la historia de una trayectoria en memoria
+SUFIJO_HISTORIA = ".trayectoria"
+
+
+# Guardar el estado del sistema (y la trayectoria registrada hasta ahora) en ruta
+# El punto de control solo guarda el estado del integrador y cuántas muestras de la trayectoria son válidas; la
+# historia va aparte y solo crece: una TrayectoriaDisco se vuelca y se anota su directorio, y una Trayectoria en
+# memoria añade sus muestras nuevas al directorio ruta + SUFIJO_HISTORIA (formato de TrayectoriaDisco), así que cada
+# punto de control escribe lo que ha crecido la historia y no la historia entera.
+# Los diagnósticos de conservación de la trayectoria se guardan con sus series.
+# Se guarda el estado interno tal cual (velocidades medias, aceleraciones y medio impulso del Leapfrog, coordenadas
+# heliocéntricas de Wisdom-Holman) para que al reanudar los pasos sean idénticos bit a bit. El archivo se escribe
+# aparte y se renombra: un proceso que muere a mitad de escritura deja intacto el punto de control anterior.
+# configuracion: diccionario serializable en JSON con la identidad del integrador y los parámetros de la simulación
+def guardar_punto_control(ruta, sistema, configuracion, trayectoria=None):
+    numero = sistema.numero_cuerpos
+    metadatos = {
+        "formato": FORMATO,
+        "nombres": sistema.nombres,
+        "tiempo": sistema.tiempo,
+        "numero_paso": sistema.numero_paso,
+        "medio_impulso": sistema.medio_impulso,
+        "velocidades_desfasadas": sistema.velocidades_desfasadas,
+        "configuracion": configuracion,
+    }
+    arreglos = {
+        "masas": sistema._masas[:numero],
+        "posiciones": sistema._posiciones[:numero],
+        "velocidades": sistema._velocidades[:numero],  # Sin sincronizar: se restaura el estado exacto
+        "velocidades_medias": sistema._velocidades_medias[:numero],
+        "prueba": sistema._prueba[:numero],
+    }
+    if sistema.aceleraciones is not None:
+        arreglos["aceleraciones"] = sistema.aceleraciones
+    estado = sistema.heliocentricas
+    if estado is not None:
+        metadatos["heliocentricas"] = {"central": estado.central, "transcurrido": estado.transcurrido}
+        arreglos.update(heliocentricas=estado.heliocentricas, baricentricas=estado.baricentricas,
+                        centro_masas=estado.centro_masas, velocidad_centro=estado.velocidad_centro)
+        if estado.fuerza is not None:
+            arreglos["fuerza_heliocentricas"] = estado.fuerza
+    if isinstance(trayectoria, TrayectoriaDisco):  # Ya está en disco: basta volcarla y anotar cuántas muestras vale
+        trayectoria.volcar()
+        metadatos["trayectoria"] = {"archivo": trayectoria.ruta, "numero_muestras": trayectoria.numero_muestras,
+                                    "ampliable": trayectoria.ampliable}
+    elif trayectoria is not None:
+        # Muestras ya guardadas por el punto de control anterior (o leídas de él al reanudar)
+        guardadas = getattr(trayectoria, "_muestras_punto_control", 0)
+        historia = os.fspath(ruta) + SUFIJO_HISTORIA
+        numero_muestras = anexar_trayectoria(historia, trayectoria, guardadas, sistema.masas, sistema.prueba)
+        metadatos["trayectoria"] = {"historia": os.path.basename(historia), "numero_muestras": numero_muestras,
+                                    "ampliable": trayectoria.ampliable}
+    diagnosticos = getattr(trayectoria, "diagnosticos", None)
+    if diagnosticos is not None:
+        metadatos["diagnosticos"] = {"cada": diagnosticos.cada, "umbral": diagnosticos.umbral,
+                                     "pasos_hechos": diagnosticos.pasos_hechos, "escalas": diagnosticos.escalas,
+                                     "alarmas": diagnosticos.alarmas}
+        arreglos.update(diagnosticos_tiempos=diagnosticos.tiempos, diagnosticos_pasos=diagnosticos.pasos,
+                        diagnosticos_energias=diagnosticos.energias, diagnosticos_momentos=diagnosticos.momentos,
+                        diagnosticos_momentos_angulares=diagnosticos.momentos_angulares)
+    arreglos["metadatos"] = np.frombuffer(json.dumps(metadatos, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        np.savez(archivo, **arreglos)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+    if isinstance(trayectoria, Trayectoria) and not isinstance(trayectoria, TrayectoriaDisco):
+        trayectoria._muestras_punto_control = metadatos["trayectoria"]["numero_muestras"]
+
+
+# Leer un punto de control: devuelve (sistema, trayectoria o None, configuracion)
+# num_pasos: capacidad de la trayectoria reconstruida en pasos (por defecto, la de la simulación original)
+def cargar_punto_control(ruta, num_pasos=None):
+    with np.load(ruta, allow_pickle=False) as datos:
+        metadatos = json.loads(datos["metadatos"].tobytes().decode("utf-8"))
+        if metadatos.get("formato") != FORMATO:
+            raise ValueError(f"Formato de punto de control no admitido: {metadatos.get('formato')!r} "
+                             f"(se esperaba {FORMATO})")
+        sistema = SistemaCeleste.desde_arreglos(metadatos["nombres"], datos["masas"], datos["posiciones"],
+                                                datos["velocidades"], datos["prueba"])
+        sistema.velocidades_medias = datos["velocidades_medias"]
+        sistema.aceleraciones = datos["aceleraciones"].copy() if "aceleraciones" in datos else None
+        sistema.medio_impulso = metadatos["medio_impulso"]
+        sistema.velocidades_desfasadas = metadatos["velocidades_desfasadas"]
+        sistema.tiempo = metadatos["tiempo"]
+        sistema.numero_paso = metadatos["numero_paso"]
+        if "heliocentricas" in metadatos:  # El núcleo de fuerza se fija al volver a avanzar
+            estado = _Heliocentricas(sistema, None, metadatos["heliocentricas"]["central"])
+            estado.transcurrido = metadatos["heliocentricas"]["transcurrido"]
+            estado.heliocentricas = datos["heliocentricas"].copy()
+            estado.baricentricas = datos["baricentricas"].copy()
+            estado.centro_masas = datos["centro_masas"].copy()
+            estado.velocidad_centro = datos["velocidad_centro"].copy()
+            if "fuerza_heliocentricas" in datos:
+                estado.fuerza = datos["fuerza_heliocentricas"].copy()
+            sistema.heliocentricas = estado
+        configuracion = metadatos["configuracion"]
+
+        trayectoria = None
+        if num_pasos is None:
+            num_pasos = configuracion.get("num_pasos", 0)
+        registro = metadatos.get("trayectoria")
+        if registro is not None and "archivo" in registro:
+            trayectoria = TrayectoriaDisco.reabrir(registro["archivo"], registro["numero_muestras"], num_pasos,
+                                                   ampliable=registro["ampliable"])
+            sistema.trayectoria = trayectoria
+        elif registro is not None:  # Historia en memoria: se leen de su directorio las muestras válidas
+            historia = abrir_trayectoria(os.path.join(os.path.dirname(os.fspath(ruta)), registro["historia"]))
+            numero_muestras = registro["numero_muestras"]
+            trayectoria = Trayectoria(sistema.nombres, num_pasos, cada=historia.cada,
+                                      guardar_velocidades=historia.velocidades is not None,
+                                      paso_inicial=historia.paso_inicial, ampliable=registro["ampliable"])
+            if numero_muestras > len(trayectoria._tiempos):
+                trayectoria._ampliar(numero_muestras)
+            for atributo in ("_posiciones", "_velocidades", "_tiempos", "_pasos", "_duraciones"):
+                if getattr(trayectoria, atributo) is not None:
+                    getattr(trayectoria, atributo)[:numero_muestras] = getattr(historia, atributo)[:numero_muestras]
+            trayectoria.numero_muestras = numero_muestras
+            trayectoria._muestras_punto_control = numero_muestras
+            sistema.trayectoria = trayectoria
+        if trayectoria is not None and "diagnosticos" in metadatos:
+            registro = metadatos["diagnosticos"]
+            diagnosticos = Diagnosticos(cada=registro["cada"], umbral=registro["umbral"])
+            diagnosticos.pasos_hechos = registro["pasos_hechos"]
+            diagnosticos.escalas = registro["escalas"]
+            diagnosticos.alarmas = registro["alarmas"]
+            diagnosticos._tiempos = datos["diagnosticos_tiempos"].tolist()
+            diagnosticos._pasos = datos["diagnosticos_pasos"].tolist()
+            diagnosticos._energias = datos["diagnosticos_energias"].tolist()
+            diagnosticos._momentos = list(datos["diagnosticos_momentos"])
+            diagnosticos._momentos_angulares = list(datos["diagnosticos_momentos_angulares"])
+            trayectoria.diagnosticos = diagnosticos
+    return sistema, trayectoria, configuracion
+
+
+# Avanzar con el motor hasta completar configuracion["num_pasos"] pasos, guardando puntos de control en ruta
+# El trabajo se divide en bloques alineados con múltiplos de `pasos` desde el inicio de la simulación, así que
+# una ejecución reanudada cruza exactamente las mismas fronteras que una sin interrumpir. Tras cada bloque se
+# guarda un punto de control (si se indica `segundos`, solo cuando han pasado al menos esos segundos desde el
+# anterior: el reloj solo se consulta en esas fronteras de `pasos`, nunca a mitad de un bloque); al terminar se
+# guarda siempre. Los contadores de estadísticas del motor (bloques, IAS15) van en la configuración del punto de
+# control para que una ejecución reanudada siga acumulando sobre ellos.
+def avanzar_con_puntos_control(motor, sistema, dt, metodo, nucleo, trayectoria, ruta, configuracion, pasos=1000,
+                               segundos=None):
+    hechos = configuracion.setdefault("pasos_hechos", 0)
+    total = configuracion["num_pasos"]
+    ultimo = time.monotonic()
+    while hechos < total:
+        bloque = min(pasos - hechos % pasos, total - hechos)
+        motor.avanzar(sistema, bloque, dt, metodo=metodo, nucleo=nucleo, trayectoria=trayectoria)
+        hechos += bloque
+        configuracion["pasos_hechos"] = hechos
+        configuracion["contadores_motor"] = getattr(motor_base(motor), "contadores", None)
+        if hechos == total or segundos is None or time.monotonic() - ultimo >= segundos:
+            guardar_punto_control(ruta, sistema, configuracion, trayectoria)
+            ultimo = time.monotonic()
@@ -0,0 +1,233 @@
+# Bucle de simulación: elige el motor y registra la trayectoria
+
+from contextlib import contextmanager, nullcontext
+
+from .adaptativo import MotorAdaptativo
+from .bloques import MotorBloques
+from .diagnosticos import Diagnosticos, MotorDiagnosticado
+from .disco import TrayectoriaDisco
+from .instrumentacion import Fases, MotorInstrumentado, perfilar
+from .motores import obtener_motor
+from .puntos_control import avanzar_con_puntos_control, cargar_punto_control, identidad, motor_base
+from .sistema import SistemaCeleste
+from .trayectoria import Trayectoria
+from .wisdom_holman import comprobar_central
+
+
+# Al terminar: medir el estado final en los diagnósticos, quitar la instrumentación y dejar en disco una
+# trayectoria mapeada
+def _terminar(sistema, trayectoria, motor):
+    if trayectoria.diagnosticos is not None:
+        trayectoria.diagnosticos.medir(sistema)
+    if isinstance(motor, MotorInstrumentado):
+        motor.retirar(trayectoria)
+    if isinstance(trayectoria, TrayectoriaDisco):
+        trayectoria.cerrar()
+
+
+# Motor para la combinación de opciones de simular_sistema_solar
+# tolerancia y bloques eligen ellos el motor: con otro motor explícito que no sea "numpy" o "auto" es un error
+def _elegir_motor(motor, metodo, nucleo, tolerancia, criterio, bloques, diagnosticos=None, fases=None,
+                  dt_maximo=None):
+    if (bloques or tolerancia is not None) and motor not in ("numpy", "auto"):
+        opcion = "bloques" if bloques else "tolerancia"
+        raise ValueError(f"{opcion} usa su propio motor y no se puede combinar con motor={motor!r} "
+                         f"(use motor='numpy' o 'auto')")
+    if bloques:
+        motor = MotorBloques(0.02 if tolerancia is None else tolerancia, criterio)
+    elif tolerancia is not None:
+        motor = MotorAdaptativo(tolerancia, criterio, dt_maximo=dt_maximo)
+    motor = obtener_motor(motor, metodo, nucleo)
+    if diagnosticos is not None:
+        motor = MotorDiagnosticado(motor, diagnosticos)
+    return motor if fases is None else MotorInstrumentado(motor, fases)
+
+
+# Perfil de cProfile guardado en `perfil` y tiempo total en las fases, cuando se piden
+@contextmanager
+def _medir_ejecucion(perfil, fases):
+    with perfilar(perfil) if perfil is not None else nullcontext():
+        with fases.medir("total") if fases is not None else nullcontext():
+            yield
+
+
+# Fijar el cuerpo central de Wisdom-Holman y avisar si con ese método no domina al resto
+def _fijar_central(sistema, metodo, central):
+    if central is not None:
+        sistema.central = central if isinstance(central, str) else int(central)  # Serializable en el punto de control
+    if metodo == "wisdom_holman":
+        comprobar_central(sistema)
+
+
+# Diagnósticos a partir de la opción `diagnosticos`: un número de pasos entre medidas o un objeto Diagnosticos
+def _diagnosticos(diagnosticos):
+    if diagnosticos is None or isinstance(diagnosticos, Diagnosticos):
+        return diagnosticos
+    return Diagnosticos(cada=diagnosticos)
+
+
+# Simular el sistema solar durante un número de pasos y devolver la trayectoria registrada
+# metodo: "leapfrog", "euler_cromer", "yoshida4", "yoshida6", "forest_ruth" o "wisdom_holman" (ver integradores.METODOS)
+# central: cuerpo central de Wisdom-Holman por nombre o índice (por defecto el "Sol" si existe, si no la fila 0);
+#          se avisa si no domina al resto de cuerpos
+# cada: registrar una muestra cada `cada` pasos; guardar_velocidades: registrar también las velocidades
+# nucleo: núcleo de fuerza por nombre ("directo", "pares", "barnes_hut", ...) o una función (posiciones, masas) -> aceleraciones
+#         (p. ej. BarnesHut(theta=0.3) para elegir el ángulo de apertura)
+# motor: "numpy", "numba" (bucle compilado, si está instalado), "auto" o "ias15" (Gauss-Radau de orden 15 con paso
+#        propio, para trayectorias de referencia; dt solo fija los instantes de salida y metodo se ignora)
+# tolerancia: activa el paso de tiempo adaptativo (MotorAdaptativo); se integra hasta num_pasos * dt con dt como
+#             paso máximo y dt = tolerancia * escala de tiempo más corta según el criterio ("encuentros" o "aceleracion");
+#             con tolerancia o bloques el motor solo puede ser "numpy" o "auto" (otro motor es un ValueError)
+# dt_maximo: con tolerancia, paso máximo independiente de dt; dt pasa a ser solo la rejilla de salida (las muestras
+#            se registran cada `cada` pasos de dt exactos y los tramos tranquilos usan pasos de hasta dt_maximo)
+# bloques: pasos individuales por cuerpo en potencias de dos de dt (MotorBloques, solo Leapfrog); tolerancia y
+#          criterio eligen el nivel de cada cuerpo y las estadísticas por nivel quedan en trayectoria.estadisticas
+# punto_control: ruta de un archivo de punto de control que se reescribe cada pasos_punto_control pasos (o, con
+#                segundos_punto_control, solo cuando ha pasado ese tiempo); se continúa con reanudar_simulacion
+# archivo_trayectoria: directorio donde escribir la trayectoria mapeada en disco (TrayectoriaDisco) en lugar de en
+#                      memoria; se vuelve a abrir sin cargarla con abrir_trayectoria
+# diagnosticos: medir energía, momento lineal y momento angular cada k pasos (un entero k o un objeto Diagnosticos
+#               con umbral de alarma); las series de deriva quedan en trayectoria.diagnosticos
+# instrumentar: acumular tiempo y llamadas por fase (fuerzas, registro, diagnósticos, ...) en trayectoria.fases
+#               (Fases: resumen() e informe()); sin ella el bucle no mide nada
+# perfil: ejecutar bajo cProfile y guardar el perfil en esa ruta (pilas colapsadas para flamegraph si termina en
+#         .folded o .txt, si no un archivo de pstats)
+def simular_sistema_solar(cuerpos_celestes, num_pasos, dt, metodo="leapfrog", cada=1, guardar_velocidades=False,
+                          nucleo="directo", motor="numpy", tolerancia=None, criterio="encuentros", bloques=False,
+                          punto_control=None, pasos_punto_control=1000, segundos_punto_control=None,
+                          archivo_trayectoria=None, diagnosticos=None, instrumentar=False, perfil=None, central=None,
+                          dt_maximo=None):
+    sistema = SistemaCeleste.desde_cuerpos(cuerpos_celestes)  # Estado contiguo: los cuerpos pasan a ser vistas de sus filas
+    _fijar_central(sistema, metodo, central)
+    diagnosticos = _diagnosticos(diagnosticos)
+    fases = Fases() if instrumentar else None
+    motor_elegido = _elegir_motor(motor, metodo, nucleo, tolerancia, criterio, bloques, diagnosticos, fases, dt_maximo)
+    ampliable = getattr(motor_elegido, "pasos_variables", False)
+    if archivo_trayectoria is None:
+        trayectoria = Trayectoria(sistema.nombres, num_pasos, cada=cada, guardar_velocidades=guardar_velocidades,
+                                  paso_inicial=sistema.numero_paso, ampliable=ampliable)
+    else:
+        trayectoria = TrayectoriaDisco(archivo_trayectoria, sistema.nombres, num_pasos, cada=cada,
+                                       guardar_velocidades=guardar_velocidades, paso_inicial=sistema.numero_paso,
+                                       ampliable=ampliable, masas=sistema.masas, prueba=sistema.prueba)
+    trayectoria.diagnosticos = diagnosticos
+    trayectoria.fases = fases
+    sistema.trayectoria = trayectoria
+
+    # Identidad del integrador y parámetros necesarios para reanudar; núcleos y motores pasados como objetos
+    # se anotan por su nombre y hay que volver a pasarlos a reanudar_simulacion
+    configuracion = None if punto_control is None else {
+        "metodo": metodo, "central": sistema.central, "dt": dt, "num_pasos": num_pasos, "cada": cada, "guardar_velocidades": guardar_velocidades,
+        "nucleo": nucleo if isinstance(nucleo, str) else None, "identidad_nucleo": identidad(nucleo),
+        "motor": motor if isinstance(motor, str) else None, "identidad_motor": identidad(motor_elegido),
+        "tolerancia": tolerancia, "criterio": criterio, "bloques": bloques, "dt_maximo": dt_maximo,
+        "pasos_punto_control": pasos_punto_control, "segundos_punto_control": segundos_punto_control,
+        "diagnosticos": None if diagnosticos is None else {"cada": diagnosticos.cada, "umbral": diagnosticos.umbral},
+    }
+    with _medir_ejecucion(perfil, fases):
+        if configuracion is None:
+            motor_elegido.avanzar(sistema, num_pasos, dt, metodo=metodo, nucleo=nucleo, trayectoria=trayectoria)
+        else:
+            avanzar_con_puntos_control(motor_elegido, sistema, dt, metodo, nucleo, trayectoria, punto_control,
+                                       configuracion, pasos_punto_control, segundos_punto_control)
+        _terminar(sistema, trayectoria, motor_elegido)
+    return trayectoria
+
+
+# Simulación incremental: cada iteración avanza `cada` pasos y entrega el sistema, sin guardar la historia
+# Lo entregado es el propio SistemaCeleste (posiciones, velocidades, tiempo y numero_paso son vistas del estado vivo:
+# copiarlas si se quieren conservar). El motor avanza bloques completos de `cada` pasos, así que el rendimiento es
+# el de simular_sistema_solar. Se puede dejar de iterar en cualquier momento y continuar después:
+#     simulacion = Simulacion(cuerpos, dt, cada=100)
+#     for sistema in simulacion.pasos(pasos_en_10_anios): ...
+#     for sistema in simulacion.pasos(pasos_en_10_anios): ...   # Sigue donde se quedó
+# num_pasos: límite de pasos de la iteración directa (None: sin límite); el resto de opciones como en
+# simular_sistema_solar (los diagnósticos y las fases quedan en simulacion.diagnosticos y simulacion.fases, y las
+# estadísticas del motor, acumuladas desde la creación, en simulacion.estadisticas)
+class Simulacion:
+    def __init__(self, cuerpos_celestes, dt, cada=1, metodo="leapfrog", nucleo="directo", motor="numpy",
+                 tolerancia=None, criterio="encuentros", bloques=False, num_pasos=None, diagnosticos=None,
+                 instrumentar=False, central=None, dt_maximo=None):
+        if cada < 1:
+            raise ValueError(f"cada debe ser al menos 1 (recibido {cada!r})")
+        self.sistema = SistemaCeleste.desde_cuerpos(cuerpos_celestes)
+        _fijar_central(self.sistema, metodo, central)
+        self.dt = dt
+        self.cada = cada
+        self.metodo = metodo
+        self.nucleo = nucleo
+        self.num_pasos = num_pasos
+        self.diagnosticos = _diagnosticos(diagnosticos)
+        self.fases = Fases() if instrumentar else None
+        self.motor = _elegir_motor(motor, metodo, nucleo, tolerancia, criterio, bloques, self.diagnosticos,
+                                   self.fases, dt_maximo)
+        self.pasos_hechos = 0  # Pasos avanzados desde la creación
+
+    # Estadísticas del motor (bloques, IAS15) acumuladas en todos los bloques avanzados; None si no tiene
+    @property
+    def estadisticas(self):
+        return getattr(motor_base(self.motor), "estadisticas", None)
+
+    # Avanzar num_pasos pasos de una vez, sin entregar estados intermedios
+    def avanzar(self, num_pasos):
+        if num_pasos > 0:
+            self.motor.avanzar(self.sistema, num_pasos, self.dt, metodo=self.metodo, nucleo=self.nucleo)
+            self.pasos_hechos += num_pasos
+        return self.sistema
+
+    # Generador de los estados de los próximos num_pasos pasos, cada `cada` pasos (y al final si no es múltiplo)
+    def pasos(self, num_pasos):
+        restantes = num_pasos
+        while restantes > 0:
+            bloque = min(self.cada, restantes)
+            yield self.avanzar(bloque)
+            restantes -= bloque
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        bloque = self.cada
+        if self.num_pasos is not None:
+            bloque = min(bloque, self.num_pasos - self.pasos_hechos)
+            if bloque <= 0:
+                raise StopIteration
+        return self.avanzar(bloque)
+
+
+# Continuar una simulación interrumpida desde su punto de control hasta completar sus num_pasos
+# El resultado es idéntico bit a bit al de la simulación sin interrumpir. nucleo y motor solo hacen falta si la
+# simulación original los recibió como objetos (deben ser del mismo tipo). Devuelve la trayectoria completa.
+# alarma: función de alarma de los diagnósticos (no se guarda en el punto de control); instrumentar y perfil
+# como en simular_sistema_solar, para la parte reanudada
+def reanudar_simulacion(punto_control, nucleo=None, motor=None, alarma=None, instrumentar=False, perfil=None):
+    sistema, trayectoria, configuracion = cargar_punto_control(punto_control)
+    diagnosticos = trayectoria.diagnosticos
+    if diagnosticos is not None:
+        diagnosticos.alarma = alarma
+    for nombre, valor in (("nucleo", nucleo), ("motor", motor)):
+        if valor is None and configuracion[nombre] is None:
+            raise ValueError(f"La simulación usó un {nombre} sin nombre ({configuracion['identidad_' + nombre]}); "
+                             f"páselo a reanudar_simulacion")
+    nucleo = configuracion["nucleo"] if nucleo is None else nucleo
+    metodo = configuracion["metodo"]
+    sistema.central = configuracion.get("central")
+    fases = Fases() if instrumentar else None
+    trayectoria.fases = fases
+    motor_elegido = _elegir_motor(configuracion["motor"] if motor is None else motor, metodo, nucleo,
+                                  configuracion["tolerancia"], configuracion["criterio"], configuracion["bloques"],
+                                  diagnosticos, fases, configuracion.get("dt_maximo"))
+    for nombre, objeto in (("nucleo", nucleo), ("motor", motor_elegido)):
+        if identidad(objeto) != configuracion["identidad_" + nombre]:
+            raise ValueError(f"El {nombre} {identidad(objeto)!r} no coincide con el del punto de control "
+                             f"({configuracion['identidad_' + nombre]!r})")
+    if configuracion.get("contadores_motor") is not None:  # Estadísticas acumuladas antes de la interrupción
+        motor_base(motor_elegido).contadores = configuracion["contadores_motor"]
+        if trayectoria is not None:
+            trayectoria.estadisticas = motor_base(motor_elegido).estadisticas
+    with _medir_ejecucion(perfil, fases):
+        avanzar_con_puntos_control(motor_elegido, sistema, configuracion["dt"], metodo, nucleo, trayectoria,
+                                   punto_control, configuracion, configuracion["pasos_punto_control"],
+                                   configuracion["segundos_punto_control"])
+        _terminar(sistema, trayectoria, motor_elegido)
+    return trayectoria
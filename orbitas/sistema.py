@@ -0,0 +1,322 @@
+# Estado del sistema como estructura de arreglos (masas, posiciones y velocidades contiguas)
+
+import numpy as np
+
+
+# Contenedor del sistema: arreglos (N,) y (N, 3) en float64, una fila por cuerpo
+class SistemaCeleste:
+    def __init__(self, capacidad=8):
+        capacidad = max(int(capacidad), 1)
+        self.numero_cuerpos = 0  # Cuerpos en uso (filas válidas de los arreglos)
+        self.nombres = []  # Nombre de cada cuerpo, en el mismo orden que las filas
+        self.cuerpos = []  # Vistas CuerpoCeleste asociadas a cada fila
+        self._masas = np.zeros(capacidad, dtype=float)
+        self._posiciones = np.zeros((capacidad, 3), dtype=float)
+        self._velocidades = np.zeros((capacidad, 3), dtype=float)
+        self._velocidades_medias = np.zeros((capacidad, 3), dtype=float)
+        self._prueba = np.zeros(capacidad, dtype=bool)  # Partículas de prueba: sienten la gravedad pero no la ejercen
+        self.tiempo = 0.0  # Tiempo simulado en segundos
+        self.numero_paso = 0  # Pasos de integración dados desde el estado inicial
+        self.trayectoria = None  # Última Trayectoria registrada por simular_sistema_solar
+        self.central = None  # Cuerpo central de Wisdom-Holman (nombre o índice; None: el "Sol" o la fila 0)
+        # Estado del Leapfrog entre pasos: aceleraciones en las posiciones actuales y medio impulso
+        # ya aplicado a velocidades_medias por delante de la velocidad sincronizada (None si no hay)
+        self.aceleraciones = None
+        self.medio_impulso = None
+        self.velocidades_desfasadas = False  # velocidades debe reconstruirse desde velocidades_medias
+        # Estado de Wisdom-Holman entre llamadas (coordenadas heliocéntricas y fuerzas en ellas), válido mientras
+        # posiciones, velocidades y masas no se cambien desde fuera; None si no hay
+        self.heliocentricas = None
+
+    # Vistas de las filas en uso (sin copiar); asignar escribe en el lugar
+    @property
+    def masas(self):
+        return self._masas[:self.numero_cuerpos]
+
+    @masas.setter
+    def masas(self, valor):
+        self._masas[:self.numero_cuerpos] = valor
+        self.invalidar_aceleraciones()
+
+    @property
+    def posiciones(self):
+        return self._posiciones[:self.numero_cuerpos]
+
+    @posiciones.setter
+    def posiciones(self, valor):
+        self._posiciones[:self.numero_cuerpos] = valor
+        self.invalidar_aceleraciones()
+
+    # Máscara de partículas de prueba (vista de solo lectura: el tipo de un cuerpo se fija al añadirlo)
+    @property
+    def prueba(self):
+        vista = self._prueba[:self.numero_cuerpos]
+        vista.flags.writeable = False
+        return vista
+
+    @property
+    def numero_particulas_prueba(self):
+        return int(np.count_nonzero(self.prueba))
+
+    # Velocidades sincronizadas con las posiciones; tras pasos Leapfrog se materializan solo al pedirlas
+    @property
+    def velocidades(self):
+        if self.velocidades_desfasadas:
+            self.sincronizar_velocidades()
+        return self._velocidades[:self.numero_cuerpos]
+
+    @velocidades.setter
+    def velocidades(self, valor):
+        self._velocidades[:self.numero_cuerpos] = valor
+        self.medio_impulso = None  # Las velocidades nuevas mandan: el Leapfrog reabre desde ellas
+        self.heliocentricas = None
+
+    @property
+    def velocidades_medias(self):
+        return self._velocidades_medias[:self.numero_cuerpos]
+
+    @velocidades_medias.setter
+    def velocidades_medias(self, valor):
+        self._velocidades_medias[:self.numero_cuerpos] = valor
+
+    # Reconstruir las velocidades a tiempo completo: v = v_media - medio_impulso * a
+    def sincronizar_velocidades(self):
+        self.velocidades_desfasadas = False
+        if self.medio_impulso is not None:
+            numero = self.numero_cuerpos
+            np.subtract(self._velocidades_medias[:numero], self.medio_impulso * self.aceleraciones,
+                        out=self._velocidades[:numero])
+
+    # Descartar las aceleraciones guardadas tras cambiar posiciones o masas desde fuera del integrador
+    def invalidar_aceleraciones(self):
+        if self.medio_impulso is not None:
+            self.sincronizar_velocidades()  # Con las aceleraciones con las que se aplicó el medio impulso
+            self.medio_impulso = None
+        self.aceleraciones = None
+        self.heliocentricas = None
+
+    def __len__(self):
+        return self.numero_cuerpos
+
+    def __iter__(self):
+        return iter(self.cuerpos)
+
+    def __getitem__(self, indice):
+        return self.cuerpos[indice]
+
+    # Duplicar la capacidad de los arreglos cuando se llenan
+    def _reservar(self, capacidad):
+        if capacidad <= len(self._masas):
+            return
+        capacidad = max(capacidad, 2 * len(self._masas))
+        for nombre in ('_masas', '_posiciones', '_velocidades', '_velocidades_medias', '_prueba'):
+            viejo = getattr(self, nombre)
+            nuevo = np.zeros((capacidad,) + viejo.shape[1:], dtype=viejo.dtype)
+            nuevo[:self.numero_cuerpos] = viejo[:self.numero_cuerpos]
+            setattr(self, nombre, nuevo)
+
+    # Añadir un cuerpo al final del sistema y devolver su vista
+    def agregar(self, nombre, masa, posicion, velocidad, prueba=False):
+        if self.velocidades_desfasadas:
+            self.sincronizar_velocidades()
+        self._reservar(self.numero_cuerpos + 1)
+        indice = self.numero_cuerpos
+        self._masas[indice] = masa
+        self._posiciones[indice] = posicion
+        self._velocidades[indice] = velocidad
+        self._velocidades_medias[indice] = 0.0
+        self._prueba[indice] = prueba
+        self.numero_cuerpos += 1
+        self.aceleraciones = None
+        self.medio_impulso = None
+        self.heliocentricas = None
+        self.nombres.append(nombre)
+        cuerpo = CuerpoCeleste.__new__(CuerpoCeleste)
+        cuerpo._enlazar(self, indice)
+        self.cuerpos.append(cuerpo)
+        return cuerpo
+
+    # Añadir de una vez un lote de partículas de prueba sin masa: posiciones y velocidades (M, 3)
+    # Devuelve las vistas de los cuerpos añadidos; por defecto se llaman "Partícula 0", "Partícula 1", ...
+    def agregar_particulas(self, posiciones, velocidades, nombres=None):
+        posiciones = np.asarray(posiciones, dtype=float).reshape(-1, 3)
+        numero = len(posiciones)
+        if nombres is None:
+            nombres = [f"Partícula {k}" for k in range(numero)]
+        if self.velocidades_desfasadas:
+            self.sincronizar_velocidades()
+        self._reservar(self.numero_cuerpos + numero)
+        inicio, fin = self.numero_cuerpos, self.numero_cuerpos + numero
+        self._masas[inicio:fin] = 0.0
+        self._posiciones[inicio:fin] = posiciones
+        self._velocidades[inicio:fin] = velocidades
+        self._velocidades_medias[inicio:fin] = 0.0
+        self._prueba[inicio:fin] = True
+        self.numero_cuerpos = fin
+        self.aceleraciones = None
+        self.medio_impulso = None
+        self.heliocentricas = None
+        self.nombres.extend(nombres)
+        nuevos = []
+        for indice in range(inicio, fin):
+            cuerpo = CuerpoCeleste.__new__(CuerpoCeleste)
+            cuerpo._enlazar(self, indice)
+            nuevos.append(cuerpo)
+        self.cuerpos.extend(nuevos)
+        return nuevos
+
+    # Construir el sistema directamente desde arreglos (carga de miles de cuerpos sin objetos intermedios)
+    @classmethod
+    def desde_arreglos(cls, nombres, masas, posiciones, velocidades, prueba=None):
+        masas = np.asarray(masas, dtype=float)
+        sistema = cls(capacidad=len(masas))
+        numero = len(masas)
+        sistema._masas[:numero] = masas
+        sistema._posiciones[:numero] = posiciones
+        sistema._velocidades[:numero] = velocidades
+        if prueba is not None:
+            sistema._prueba[:numero] = prueba
+        sistema.numero_cuerpos = numero
+        sistema.nombres = list(nombres)
+        for indice in range(numero):
+            cuerpo = CuerpoCeleste.__new__(CuerpoCeleste)
+            cuerpo._enlazar(sistema, indice)
+            sistema.cuerpos.append(cuerpo)
+        return sistema
+
+    # Reunir una lista de cuerpos en un único sistema contiguo; los cuerpos pasan a ser vistas de sus filas
+    @classmethod
+    def desde_cuerpos(cls, cuerpos_celestes):
+        cuerpos_celestes = list(cuerpos_celestes)
+        sistema = cls.comun(cuerpos_celestes)
+        if sistema is not None:
+            return sistema
+        sistema = cls(capacidad=len(cuerpos_celestes))
+        numero = len(cuerpos_celestes)
+        for indice, cuerpo in enumerate(cuerpos_celestes):
+            sistema._masas[indice] = cuerpo.masa
+            sistema._posiciones[indice] = cuerpo.posicion
+            sistema._velocidades[indice] = cuerpo.velocidad
+            sistema._prueba[indice] = cuerpo.prueba
+        sistema.numero_cuerpos = numero
+        for indice, cuerpo in enumerate(cuerpos_celestes):
+            sistema.nombres.append(cuerpo.nombre)
+            cuerpo._enlazar(sistema, indice)
+            sistema.cuerpos.append(cuerpo)
+        return sistema
+
+    # Sistema compartido por la lista si sus cuerpos son exactamente sus filas en orden, si no None
+    @staticmethod
+    def comun(cuerpos_celestes):
+        if not cuerpos_celestes:
+            return None
+        sistema = getattr(cuerpos_celestes[0], '_sistema', None)
+        if sistema is None or len(cuerpos_celestes) != sistema.numero_cuerpos:
+            return None
+        for indice, cuerpo in enumerate(cuerpos_celestes):
+            if cuerpo._sistema is not sistema or cuerpo._indice != indice:
+                return None
+        return sistema
+
+
+# Vista de solo lectura de una fila del sistema
+def _solo_lectura(vista):
+    vista.flags.writeable = False
+    return vista
+
+
+# Clase para representar un cuerpo celeste: vista con nombre de una fila de un SistemaCeleste
+# posicion, velocidad y velocidad_media son vistas de solo lectura: una edición en el lugar (cuerpo.posicion[0] = x)
+# dejaría obsoletas las aceleraciones guardadas y el medio impulso del Leapfrog, así que los cambios se asignan
+# (cuerpo.posicion = x) y el setter invalida ese estado
+class CuerpoCeleste:
+    # Acepta el eje semi-mayor y la velocidad orbital como escalares o la posición y velocidad como vectores
+    # prueba: partícula de prueba que siente la gravedad de los cuerpos masivos pero no ejerce fuerza
+    def __init__(self, nombre, masa, posicion, velocidad, prueba=False):
+        if np.ndim(posicion) == 0:
+            posicion = [posicion, 0.0, 0.0]  # Eje semi-mayor sobre el eje X
+        if np.ndim(velocidad) == 0:
+            velocidad = [0.0, velocidad, 0.0]  # Velocidad orbital sobre el eje Y
+        sistema = SistemaCeleste(capacidad=1)  # Fila propia hasta que se una a un sistema
+        sistema._masas[0] = masa
+        sistema._posiciones[0] = posicion
+        sistema._velocidades[0] = velocidad
+        sistema._prueba[0] = prueba
+        sistema.numero_cuerpos = 1
+        sistema.nombres.append(nombre)
+        sistema.cuerpos.append(self)
+        self._enlazar(sistema, 0)
+
+    # Partícula de prueba sin masa (asteroides, cometas)
+    @classmethod
+    def particula_prueba(cls, nombre, posicion, velocidad):
+        return cls(nombre, 0.0, posicion, velocidad, prueba=True)
+
+    def _enlazar(self, sistema, indice):
+        self._sistema = sistema
+        self._indice = indice
+
+    @property
+    def sistema(self):
+        return self._sistema
+
+    @property
+    def nombre(self):
+        return self._sistema.nombres[self._indice]
+
+    @nombre.setter
+    def nombre(self, valor):
+        self._sistema.nombres[self._indice] = valor
+
+    # Posiciones registradas del cuerpo (num_muestras, 3), leídas de la trayectoria del sistema
+    @property
+    def posiciones(self):
+        if self._sistema.trayectoria is None:
+            return np.empty((0, 3))
+        return self._sistema.trayectoria[self.nombre]
+
+    @property
+    def prueba(self):
+        return bool(self._sistema._prueba[self._indice])
+
+    @property
+    def masa(self):
+        return self._sistema._masas[self._indice]
+
+    @masa.setter
+    def masa(self, valor):
+        self._sistema._masas[self._indice] = valor
+        self._sistema.invalidar_aceleraciones()
+
+    @property
+    def posicion(self):
+        return _solo_lectura(self._sistema._posiciones[self._indice])
+
+    @posicion.setter
+    def posicion(self, valor):
+        self._sistema._posiciones[self._indice] = valor
+        self._sistema.invalidar_aceleraciones()
+
+    @property
+    def velocidad(self):
+        return _solo_lectura(self._sistema.velocidades[self._indice])
+
+    @velocidad.setter
+    def velocidad(self, valor):
+        self._sistema.velocidades[self._indice] = valor
+        self._sistema.medio_impulso = None
+        self._sistema.heliocentricas = None
+
+    # Velocidad en el punto medio del paso (Leapfrog); None mientras el Leapfrog no esté en marcha
+    @property
+    def velocidad_media(self):
+        if self._sistema.medio_impulso is None:
+            return None
+        return _solo_lectura(self._sistema._velocidades_medias[self._indice])
+
+    @velocidad_media.setter
+    def velocidad_media(self, valor):
+        self._sistema._velocidades_medias[self._indice] = valor
+
+    def __repr__(self):
+        return f"CuerpoCeleste({self.nombre!r}, masa={self.masa:.4g})"
@@ -0,0 +1,128 @@
+# Registro de trayectorias en un único arreglo preasignado
+
+import numpy as np
+
+
+# Historial de la simulación: posiciones (num_muestras, N, 3) y opcionalmente velocidades
+# Se guarda una muestra cada `cada` pasos; se indexa por nombre como el antiguo diccionario todas_posiciones
+# ampliable: los búferes crecen al llenarse (pasos de tiempo variables, número de pasos desconocido); sin ella,
+# registrar más muestras que la capacidad es un error
+class Trayectoria:
+    def __init__(self, nombres, num_pasos, cada=1, guardar_velocidades=False, paso_inicial=0, ampliable=False):
+        if cada < 1:
+            raise ValueError("cada debe ser un entero positivo")
+        self.nombres = list(nombres)
+        self.cada = int(cada)
+        self.paso_inicial = paso_inicial  # Paso del sistema en el que empieza el registro
+        self.ampliable = ampliable
+        self.estadisticas = None  # Estadísticas del motor que la produjo (p. ej. niveles de pasos por bloques)
+        self.diagnosticos = None  # Diagnósticos de conservación medidos durante la simulación, si se pidieron
+        self.fases = None  # Tiempo por fase de la simulación (instrumentar=True)
+        self._indices = {nombre: indice for indice, nombre in enumerate(self.nombres)}
+        capacidad = num_pasos // self.cada
+        numero_cuerpos = len(self.nombres)
+        self.numero_muestras = 0  # Muestras registradas hasta ahora
+        self._posiciones = np.empty((capacidad, numero_cuerpos, 3), dtype=float)
+        self._velocidades = np.empty((capacidad, numero_cuerpos, 3), dtype=float) if guardar_velocidades else None
+        self._tiempos = np.empty(capacidad, dtype=float)
+        self._pasos = np.empty(capacidad, dtype=np.int64)
+        self._duraciones = np.empty(capacidad, dtype=float)  # dt del paso que produjo cada muestra
+
+    # Trayectoria sobre búferes ya existentes (p. ej. un miembro de una TrayectoriaConjunto), sin copiar
+    @classmethod
+    def desde_buferes(cls, nombres, posiciones, velocidades, tiempos, pasos, numero_muestras, cada=1, paso_inicial=0,
+                      duraciones=None):
+        trayectoria = cls(nombres, 0, cada=cada, paso_inicial=paso_inicial)
+        trayectoria._posiciones = posiciones
+        trayectoria._velocidades = velocidades
+        trayectoria._tiempos = tiempos
+        trayectoria._pasos = pasos
+        trayectoria._duraciones = np.full(len(tiempos), np.nan) if duraciones is None else duraciones
+        trayectoria.numero_muestras = numero_muestras
+        return trayectoria
+
+    # Guardar el estado del sistema si el paso coincide con el intervalo de registro
+    # dt: duración del paso que acaba de darse (se guarda junto al tiempo de la muestra)
+    def registrar(self, paso, tiempo, sistema, dt=np.nan):
+        if (paso - self.paso_inicial) % self.cada != 0:
+            return
+        self.reservar(1)
+        muestra = self.numero_muestras
+        self._posiciones[muestra] = sistema.posiciones
+        if self._velocidades is not None:
+            self._velocidades[muestra] = sistema.velocidades
+        self._tiempos[muestra] = tiempo
+        self._pasos[muestra] = paso
+        self._duraciones[muestra] = dt
+        self.numero_muestras += 1
+
+    # Asegurar sitio para `nuevas` muestras más: amplía los búferes si la trayectoria es ampliable y si no, cuando
+    # no caben, lanza ValueError (los motores compilados reservan antes de escribir todo un bloque)
+    def reservar(self, nuevas):
+        capacidad = len(self._tiempos)
+        necesarias = self.numero_muestras + nuevas
+        if necesarias <= capacidad:
+            return
+        if not self.ampliable:
+            raise ValueError(f"La trayectoria está llena ({capacidad} muestras): créela con más pasos o con "
+                             f"ampliable=True")
+        self._ampliar(max(2 * capacidad, necesarias, 16))
+
+    # Copiar las muestras a búferes de mayor capacidad
+    def _ampliar(self, capacidad):
+        for nombre in ('_posiciones', '_velocidades', '_tiempos', '_pasos', '_duraciones'):
+            viejo = getattr(self, nombre)
+            if viejo is None:
+                continue
+            nuevo = np.empty((capacidad,) + viejo.shape[1:], dtype=viejo.dtype)
+            nuevo[:self.numero_muestras] = viejo[:self.numero_muestras]
+            setattr(self, nombre, nuevo)
+
+    # Anotar pasos y tiempos de las muestras que un motor compilado escribió directamente en los búferes
+    # (hasta `muestra_final`), para un bloque de pasos de duración dt que empezó en `paso` y `tiempo`
+    def anotar_bloque(self, muestra_final, paso, tiempo, dt):
+        nuevas = muestra_final - self.numero_muestras
+        relativo = paso - self.paso_inicial
+        primero = (relativo // self.cada + 1) * self.cada
+        relativos = primero + self.cada * np.arange(nuevas)
+        self._pasos[self.numero_muestras:muestra_final] = self.paso_inicial + relativos
+        self._tiempos[self.numero_muestras:muestra_final] = tiempo + (relativos - relativo) * dt
+        self._duraciones[self.numero_muestras:muestra_final] = dt
+        self.numero_muestras = muestra_final
+
+    # Vistas de las muestras registradas (sin copiar)
+    @property
+    def posiciones(self):
+        return self._posiciones[:self.numero_muestras]
+
+    @property
+    def velocidades(self):
+        if self._velocidades is None:
+            return None
+        return self._velocidades[:self.numero_muestras]
+
+    @property
+    def tiempos(self):
+        return self._tiempos[:self.numero_muestras]
+
+    @property
+    def pasos(self):
+        return self._pasos[:self.numero_muestras]
+
+    # Duración real del paso que produjo cada muestra (varía con paso de tiempo adaptativo)
+    @property
+    def duraciones(self):
+        return self._duraciones[:self.numero_muestras]
+
+    # Posiciones de un cuerpo (num_muestras, 3) por nombre
+    def __getitem__(self, nombre):
+        return self.posiciones[:, self._indices[nombre]]
+
+    def __contains__(self, nombre):
+        return nombre in self._indices
+
+    def __len__(self):
+        return self.numero_muestras
+
+    def indice(self, nombre):
+        return self._indices[nombre]
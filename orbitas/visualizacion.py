@@ -0,0 +1,100 @@
+# Visualización de las órbitas a partir de la trayectoria registrada
+# matplotlib solo se importa al dibujar: simular (p. ej. en los procesos de un barrido) no paga su importación
+
+import os
+import re
+import time
+
+COLORES_SISTEMA_INTERNO = ['yellow', 'grey', 'orange', 'blue', 'red', 'brown', 'pink', 'lightblue', 'green']
+COLORES_SISTEMA_EXTERNO = ['yellow', 'orange', 'brown', 'blue', 'grey']
+
+# Modo sin ventanas: con un directorio, las figuras se guardan en archivos con el backend Agg en lugar de mostrarse
+# Se activa con modo_sin_ventanas() o con la variable de entorno ORBITAS_FIGURAS=directorio
+VARIABLE_ENTORNO = "ORBITAS_FIGURAS"
+_salida = {"directorio": os.environ.get(VARIABLE_ENTORNO) or None, "formato": "png", "numero": 0}
+
+
+# Guardar las figuras siguientes en directorio (numeradas y nombradas según su título) sin abrir ventanas
+# directorio=None vuelve a mostrar las figuras en pantalla
+def modo_sin_ventanas(directorio="figuras", formato="png"):
+    _salida.update(directorio=directorio, formato=formato)
+    if directorio is not None:
+        import matplotlib
+        matplotlib.use("Agg")  # Si pyplot ya estaba cargado cambia de backend y cierra las figuras abiertas
+
+
+# pyplot cargado la primera vez que se dibuja (con Agg si el modo sin ventanas está activo)
+def _pyplot():
+    import matplotlib
+    if _salida["directorio"] is not None:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d import Axes3D  # Registra la proyección '3d' en versiones antiguas de matplotlib
+    return plt
+
+
+# Nombre de archivo para una figura en el modo sin ventanas: número de orden y título sin caracteres especiales
+def _archivo_figura(titulo):
+    _salida["numero"] += 1
+    nombre = re.sub(r"[^\w]+", "_", titulo.lower()).strip("_") or "figura"
+    os.makedirs(_salida["directorio"], exist_ok=True)
+    return os.path.join(_salida["directorio"], f"{_salida['numero']:03d}_{nombre}.{_salida['formato']}")
+
+
+# Visualizar las órbitas de los cuerpos celestes
+# trayectoria: resultado de simular_sistema_solar (por defecto, la última registrada en el sistema de los cuerpos) o
+#              el directorio de una trayectoria en disco, que se abre sin cargarla; entonces cuerpos_celestes puede
+#              ser None y los nombres y las partículas de prueba se leen de su cabecera
+# archivo: guardar la figura ahí en lugar de mostrarla; en el modo sin ventanas se elige un nombre automáticamente.
+# Devuelve la ruta del archivo guardado (o None si la figura se mostró). Si la trayectoria se simuló con
+# instrumentar=True, el tiempo de dibujo (sin la ventana abierta) se anota en la fase "graficas".
+def visualizar_orbitas(cuerpos_celestes, trayectoria=None, titulo='Órbitas del Sistema Solar', colores=None, marcar_sol=False,
+                       archivo=None):
+    if trayectoria is None:
+        trayectoria = cuerpos_celestes[0].sistema.trayectoria
+    elif isinstance(trayectoria, (str, os.PathLike)):
+        from .disco import abrir_trayectoria
+        trayectoria = abrir_trayectoria(trayectoria)
+    if cuerpos_celestes is None:
+        cuerpos = list(zip(trayectoria.nombres, getattr(trayectoria, "prueba", [False] * len(trayectoria.nombres))))
+    else:
+        cuerpos = [(cuerpo.nombre, cuerpo.prueba) for cuerpo in cuerpos_celestes]
+    inicio = time.perf_counter()
+    plt = _pyplot()
+    figura = plt.figure(figsize=(12, 10))
+    eje = figura.add_subplot(111, projection='3d')
+
+    if marcar_sol:
+        eje.scatter([0], [0], [0], color='yellow', label='Sol', marker='o', s=300)  # Representar el Sol
+
+    posiciones = trayectoria.posiciones  # (num_muestras, N, 3), leído directamente del búfer
+    masivos = [nombre for nombre, prueba in cuerpos if not prueba]
+    for i, nombre in enumerate(masivos):
+        orbita = posiciones[:, trayectoria.indice(nombre)]
+        color = colores[i % len(colores)] if colores else None
+        eje.plot(orbita[:, 0], orbita[:, 1], orbita[:, 2], label=f'Órbita de {nombre}', color=color)
+
+    # Las partículas de prueba se dibujan como una nube de puntos en su última posición registrada
+    particulas = [trayectoria.indice(nombre) for nombre, prueba in cuerpos if prueba]
+    if particulas and len(posiciones):
+        finales = posiciones[-1, particulas]
+        eje.scatter(finales[:, 0], finales[:, 1], finales[:, 2], s=1, color='black', alpha=0.3,
+                    label=f'Partículas de prueba ({len(particulas)})')
+
+    eje.set_xlabel("Posición en el eje x (m)")
+    eje.set_ylabel("Posición en el eje y (m)")
+    eje.set_zlabel("Posición en el eje z (m)")
+    eje.set_title(titulo)
+    eje.legend()
+
+    if archivo is None and _salida["directorio"] is not None:
+        archivo = _archivo_figura(titulo)
+    if archivo is not None:
+        figura.savefig(archivo)
+        plt.close(figura)  # En lotes largos las figuras guardadas no se acumulan en memoria
+    fases = getattr(trayectoria, "fases", None)
+    if fases is not None:
+        fases.anotar("graficas", time.perf_counter() - inicio)
+    if archivo is None:
+        plt.show()
+    return archivo
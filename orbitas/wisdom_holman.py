@@ -0,0 +1,199 @@
+# Integrador de Wisdom-Holman en coordenadas heliocéntricas democráticas (Duncan, Levison y Lee 1998)
+# El movimiento kepleriano alrededor del cuerpo central se resuelve analíticamente; las interacciones
+# entre los demás cuerpos se aplican como impulsos. Solo tiene sentido si el cuerpo central domina: con otro cuerpo
+# de masa comparable (una estrella pasajera) sus impulsos no son una perturbación y el método pierde su ventaja.
+
+import warnings
+
+import numpy as np
+
+from .fuerzas import G, aceleraciones_sistema
+
+TOLERANCIA_KEPLER = 1e-14  # Error relativo admitido en la ecuación de Kepler universal
+ITERACIONES_KEPLER = 50
+COCIENTE_DOMINIO = 0.1  # Masa de otro cuerpo frente a la del central a partir de la cual el central no domina
+
+
+# Funciones de Stumpff c2(z) y c3(z) para z de cualquier signo (serie de Taylor cerca de cero)
+# Las ramas se evalúan sobre todo el arreglo y se eligen con np.where: con pocos cuerpos es mucho más barato que
+# indexar con máscaras. Cerca de cero el divisor se cambia por 1 para no dividir por cero (esa rama no se usa).
+def _stumpff(z):
+    positivo, negativo = z > 1e-6, z < -1e-6
+    cero = ~(positivo | negativo)
+    modulo = np.where(cero, 1.0, np.abs(z))
+    raiz = np.sqrt(modulo)
+    c2 = np.where(positivo, 1 - np.cos(raiz), np.cosh(raiz) - 1) / modulo
+    c3 = np.where(positivo, raiz - np.sin(raiz), np.sinh(raiz) - raiz) / (modulo * raiz)
+    if cero.any():
+        c2 = np.where(cero, 1 / 2 - z / 24 + z ** 2 / 720, c2)
+        c3 = np.where(cero, 1 / 6 - z / 120 + z ** 2 / 5040, c3)
+    return c2, c3
+
+
+# Avanzar órbitas keplerianas (elípticas o hiperbólicas) un tiempo dt con variables universales y f, g
+# posiciones, velocidades: (N, 3) relativas al cuerpo central; mu = G * masa central. Devuelve las nuevas (N, 3).
+def deriva_kepler(posiciones, velocidades, mu, dt):
+    r0 = np.sqrt(np.einsum('nk,nk->n', posiciones, posiciones))
+    v0_cuadrado = np.einsum('nk,nk->n', velocidades, velocidades)
+    raiz_mu = np.sqrt(mu)
+    radial = np.einsum('nk,nk->n', posiciones, velocidades) / raiz_mu  # r0 · v0 / sqrt(mu)
+    alfa = 2 / r0 - v0_cuadrado / mu  # Inverso del semieje mayor (negativo si la órbita es hiperbólica)
+
+    # En órbitas elípticas basta avanzar dt módulo el periodo
+    eliptica = alfa > 0
+    periodo = 2 * np.pi / np.sqrt(mu * np.where(eliptica, alfa, 1.0) ** 3)
+    tiempo = np.where(eliptica, np.fmod(float(dt), periodo), float(dt))
+
+    chi = np.where(eliptica, raiz_mu * tiempo * alfa, raiz_mu * tiempo / r0)  # Estimación inicial
+    uno_menos_alfa_r0 = 1 - alfa * r0
+    for _ in range(ITERACIONES_KEPLER):  # Newton sobre la ecuación de Kepler universal
+        chi_cuadrado = chi * chi
+        z = alfa * chi_cuadrado
+        c2, c3 = _stumpff(z)
+        radio = chi_cuadrado * c2 + radial * chi * (1 - z * c3) + r0 * (1 - z * c2)
+        residuo = radial * chi_cuadrado * c2 + uno_menos_alfa_r0 * chi_cuadrado * chi * c3 + r0 * chi - raiz_mu * tiempo
+        correccion = residuo / radio
+        chi -= correccion
+        if (np.abs(correccion) <= TOLERANCIA_KEPLER * np.maximum(np.abs(chi), 1e-300)).all():
+            break
+
+    # La última corrección ya está por debajo de la tolerancia: c2 y c3 de esa iteración sirven para f y g
+    z = alfa * chi * chi
+    f = 1 - chi * chi / r0 * c2
+    g = tiempo - chi ** 3 / raiz_mu * c3
+    nuevas_posiciones = f[:, np.newaxis] * posiciones + g[:, np.newaxis] * velocidades
+    r = np.sqrt(np.einsum('nk,nk->n', nuevas_posiciones, nuevas_posiciones))
+    f_punto = raiz_mu / (r * r0) * chi * (z * c3 - 1)
+    g_punto = 1 - chi * chi / r * c2
+    nuevas_velocidades = f_punto[:, np.newaxis] * posiciones + g_punto[:, np.newaxis] * velocidades
+    return nuevas_posiciones, nuevas_velocidades
+
+
+# Fila del cuerpo central: por nombre o por índice; None usa sistema.central y, si tampoco está fijado, el "Sol"
+# si el sistema tiene uno o la fila 0
+def indice_central(sistema, central=None):
+    if central is None:
+        central = sistema.central
+    if central is None:
+        central = "Sol" if "Sol" in sistema.nombres else 0
+    if isinstance(central, str):
+        try:
+            return sistema.nombres.index(central)
+        except ValueError:
+            raise ValueError(f"Cuerpo central desconocido: {central!r}") from None
+    numero = sistema.numero_cuerpos
+    if not -numero <= central < numero:
+        raise ValueError(f"Índice de cuerpo central fuera del sistema: {central!r} ({numero} cuerpos)")
+    return int(central) % numero
+
+
+# Nombres de los cuerpos que el central no domina: masa mayor que COCIENTE_DOMINIO veces la suya
+def rivales_central(sistema, central=None):
+    indice = indice_central(sistema, central)
+    masas = sistema.masas
+    return [sistema.nombres[k] for k in np.flatnonzero(masas > COCIENTE_DOMINIO * masas[indice]) if k != indice]
+
+
+# Comprobar que el cuerpo central domina al resto y avisar si no; devuelve los rivales (lista vacía si domina)
+def comprobar_central(sistema, central=None):
+    rivales = rivales_central(sistema, central)
+    if rivales:
+        indice = indice_central(sistema, central)
+        warnings.warn(f"Wisdom-Holman: el cuerpo central {sistema.nombres[indice]!r} no domina a "
+                      f"{', '.join(rivales)}; sus impulsos no son una perturbación y el método pierde precisión "
+                      f"(use otro método o elija otro cuerpo central)", RuntimeWarning, stacklevel=2)
+    return rivales
+
+
+# Estado de Wisdom-Holman alrededor del cuerpo central (ver indice_central): posiciones heliocéntricas Q y
+# velocidades baricéntricas V. Se puede mantener durante varios pasos y escribir en el sistema solo cuando hace falta;
+# entre llamadas queda en sistema.heliocentricas para no volver a convertir (la conversión no es exacta bit a bit).
+class _Heliocentricas:
+    def __init__(self, sistema, aceleraciones, central=None):
+        masas = sistema.masas
+        self.central = indice_central(sistema, central)
+        self.masa_central = masas[self.central]
+        self.masa_total = masas.sum()
+        self.aceleraciones = aceleraciones
+        posiciones, velocidades = sistema.posiciones, sistema.velocidades
+        self.centro_masas = masas @ posiciones / self.masa_total
+        self.velocidad_centro = masas @ velocidades / self.masa_total  # Constante: el centro de masas no acelera
+        self.transcurrido = 0.0  # Tiempo avanzado desde la conversión
+
+        self.heliocentricas = posiciones - posiciones[self.central]  # Q (el cuerpo central queda en el origen)
+        self.baricentricas = velocidades - self.velocidad_centro  # V
+        self.masas_interaccion = masas.copy()
+        self.masas_interaccion[self.central] = 0.0  # Las interacciones no incluyen al cuerpo central
+        self.mu = G * self.masa_central
+        self.otros = np.flatnonzero(np.arange(len(masas)) != self.central)
+        self.fuerza = None  # Aceleraciones en las Q actuales, si ya se evaluaron
+
+    # Impulso de las interacciones; devuelve las aceleraciones para reutilizarlas si se pasan de nuevo
+    def impulso(self, duracion, aceleraciones=None):
+        if aceleraciones is None:
+            aceleraciones = self.aceleraciones(self.heliocentricas, self.masas_interaccion)
+        self.baricentricas += duracion * aceleraciones
+        self.fuerza = aceleraciones
+        return aceleraciones
+
+    # Salto-Kepler-salto: el salto es el movimiento del cuerpo central, que desplaza todas las Q por el momento
+    # total / masa central
+    def deriva(self, dt):
+        heliocentricas, baricentricas = self.heliocentricas, self.baricentricas
+        heliocentricas += 0.5 * dt * (self.masas_interaccion @ baricentricas) / self.masa_central
+        otros = self.otros
+        heliocentricas[otros], baricentricas[otros] = deriva_kepler(heliocentricas[otros], baricentricas[otros],
+                                                                    self.mu, dt)
+        heliocentricas += 0.5 * dt * (self.masas_interaccion @ baricentricas) / self.masa_central
+        self.transcurrido += dt
+        self.fuerza = None
+
+    # Escribir el estado en coordenadas inerciales en el sistema (Q y V no cambian: se puede seguir avanzando)
+    def escribir(self, sistema):
+        central = self.central
+        centro_masas = self.centro_masas + self.transcurrido * self.velocidad_centro
+        posicion_central = centro_masas - self.masas_interaccion @ self.heliocentricas / self.masa_total
+        posiciones = self.heliocentricas + posicion_central
+        posiciones[central] = posicion_central
+        velocidades = self.baricentricas + self.velocidad_centro
+        velocidades[central] = self.velocidad_centro - self.masas_interaccion @ self.baricentricas / self.masa_central
+        sistema.posiciones = posiciones  # Invalida las aceleraciones guardadas
+        sistema.velocidades = velocidades
+
+
+# Paso de Wisdom-Holman (impulso-salto-Kepler-salto-impulso) alrededor del cuerpo central (ver indice_central)
+# El sistema queda en coordenadas inerciales tras el paso; los motores usan avanzar_wisdom_holman con todo el bloque
+def paso_wisdom_holman(sistema, dt, aceleraciones=aceleraciones_sistema, central=None):
+    avanzar_wisdom_holman(sistema, 1, dt, aceleraciones, central=central)
+
+
+# Avanzar num_pasos pasos de Wisdom-Holman registrando en la trayectoria si se indica
+# Q y V se mantienen de un paso al siguiente: el sistema solo vuelve a coordenadas inerciales en los pasos que la
+# trayectoria registra y al terminar. El impulso de cierre de cada paso se funde con el de apertura del siguiente
+# (una evaluación de fuerza por paso, dos medios impulsos con la misma fuerza en los pasos registrados). Q, V y la
+# última fuerza se guardan en el sistema: avanzar por tramos da el mismo resultado bit a bit que de una vez.
+def avanzar_wisdom_holman(sistema, num_pasos, dt, aceleraciones=aceleraciones_sistema, trayectoria=None,
+                          central=None):
+    if num_pasos <= 0:
+        return
+    estado = sistema.heliocentricas
+    if estado is None or estado.central != indice_central(sistema, central):
+        estado = _Heliocentricas(sistema, aceleraciones, central)
+    estado.aceleraciones = aceleraciones
+    estado.impulso(0.5 * dt, estado.fuerza)
+    for indice in range(num_pasos):
+        estado.deriva(dt)
+        sistema.tiempo += dt
+        sistema.numero_paso += 1
+        ultimo = indice == num_pasos - 1
+        muestra = trayectoria is not None and (sistema.numero_paso - trayectoria.paso_inicial) % trayectoria.cada == 0
+        if not (ultimo or muestra):
+            estado.impulso(dt)
+            continue
+        fuerza = estado.impulso(0.5 * dt)
+        estado.escribir(sistema)
+        if muestra:
+            trayectoria.registrar(sistema.numero_paso, sistema.tiempo, sistema, dt)
+        if not ultimo:
+            estado.impulso(0.5 * dt, fuerza)
+    sistema.heliocentricas = estado  # Después de escribir, que descarta el estado guardado
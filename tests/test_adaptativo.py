@@ -0,0 +1,74 @@
+# Regresión del motor adaptativo con dt_maximo: pasos más largos que la cadencia de salida, muestras en la rejilla
+
+import numpy as np
+import pytest
+
+from orbitas import MotorAdaptativo, Trayectoria, simular_sistema_solar
+from orbitas.escenarios import sistema_solar_externo
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+NUM_PASOS = 3650
+
+
+def test_muestras_en_la_rejilla_de_salida():
+    rejilla = simular_sistema_solar(sistema_solar_externo(), NUM_PASOS, DIA, cada=100)
+    adaptativa = simular_sistema_solar(sistema_solar_externo(), NUM_PASOS, DIA, cada=100, tolerancia=0.02,
+                                       dt_maximo=30 * DIA)
+    assert np.array_equal(adaptativa.pasos, rejilla.pasos)
+    np.testing.assert_allclose(adaptativa.tiempos, rejilla.tiempos, rtol=1e-12)
+
+    referencia = simular_sistema_solar(sistema_solar_externo(), NUM_PASOS, DIA, cada=100, motor="ias15")
+    escala = np.abs(referencia.posiciones).max()
+    np.testing.assert_allclose(adaptativa.posiciones, referencia.posiciones, rtol=0, atol=1e-3 * escala)
+
+
+def test_pasos_mas_largos_que_la_salida():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_externo())
+    trayectoria = Trayectoria(sistema.nombres, NUM_PASOS, cada=100, ampliable=True)
+    motor = MotorAdaptativo(0.02, dt_maximo=30 * DIA)
+    motor.avanzar(sistema, NUM_PASOS, DIA, trayectoria=trayectoria)
+    assert motor.pasos_dados < NUM_PASOS / 10
+    assert sistema.numero_paso == NUM_PASOS
+    assert sistema.tiempo == pytest.approx(NUM_PASOS * DIA, rel=1e-12)
+
+    # Sin dt_maximo el paso de salida es también el máximo: al menos un paso por día
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_externo())
+    motor = MotorAdaptativo(0.02)
+    motor.avanzar(sistema, NUM_PASOS, DIA)
+    assert motor.pasos_dados >= NUM_PASOS
+
+
+# Avanzar por tramos que no caen en la rejilla mantiene las muestras en múltiplos de `cada`
+def test_tramos_desalineados():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_externo())
+    trayectoria = Trayectoria(sistema.nombres, 1000, cada=100, ampliable=True)
+    motor = MotorAdaptativo(0.02, dt_maximo=30 * DIA)
+    for tramo in (130, 270, 45, 555):
+        motor.avanzar(sistema, tramo, DIA, trayectoria=trayectoria)
+    assert np.array_equal(trayectoria.pasos, np.arange(100, 1001, 100))
+    np.testing.assert_allclose(trayectoria.tiempos, np.arange(100, 1001, 100) * DIA, rtol=1e-12)
+
+
+# tolerancia y bloques traen su propio motor: pedir otro a la vez es un error, no se ignora en silencio
+def test_tolerancia_con_otro_motor():
+    for opciones in ({"tolerancia": 0.1}, {"bloques": True}):
+        for motor in ("ias15", "numba"):
+            with pytest.raises(ValueError, match="motor"):
+                simular_sistema_solar(sistema_solar_externo(), 10, DIA, motor=motor, **opciones)
+        simular_sistema_solar(sistema_solar_externo(), 10, DIA, motor="auto", **opciones)
+
+
+# Las estadísticas cuentan los pasos internos de todos los avances; pasos_dados, solo los del último
+def test_estadisticas_acumuladas():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_externo())
+    motor = MotorAdaptativo(0.02, dt_maximo=30 * DIA)
+    total = 0
+    for tramo in (130, 270, 45):
+        motor.avanzar(sistema, tramo, DIA)
+        total += motor.pasos_dados
+    assert motor.estadisticas["pasos"] == total > motor.pasos_dados
+    assert motor.estadisticas["paso_minimo"] <= motor.estadisticas["paso_maximo"] <= 30 * DIA
+    trayectoria = simular_sistema_solar(sistema_solar_externo(), NUM_PASOS, DIA, cada=100, tolerancia=0.02,
+                                        dt_maximo=30 * DIA, diagnosticos=50)
+    assert trayectoria.estadisticas["pasos"] < NUM_PASOS / 10
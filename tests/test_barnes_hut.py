@@ -0,0 +1,42 @@
+# Regresión de Barnes-Hut: el error cae al cerrar el ángulo de apertura y con theta = 0 es la suma directa
+
+import numpy as np
+
+from orbitas import BarnesHut, NUCLEOS, aceleraciones_sistema, error_frente_a_theta, simular_sistema_solar
+from orbitas.escenarios import sistema_solar_completo
+from orbitas.fuerzas import obtener_nucleo
+
+
+# Cúmulo sin cuerpo dominante (masas parecidas, posiciones al azar con semilla fija): el árbol sí aproxima
+def _cumulo(numero=600, semilla=2):
+    generador = np.random.default_rng(semilla)
+    posiciones = generador.normal(0.0, 1e12, (numero, 3))
+    masas = generador.uniform(1e29, 1e30, numero)
+    return posiciones, masas
+
+
+def test_error_cae_con_theta():
+    posiciones, masas = _cumulo()
+    filas = error_frente_a_theta(posiciones, masas, [1.0, 0.7, 0.5, 0.3, 0.1])
+    medianos = [mediano for _, mediano, _, _, _ in filas]
+    maximos = [maximo for _, _, _, maximo, _ in filas]
+    assert all(a > b for a, b in zip(medianos, medianos[1:]))
+    assert all(a > b for a, b in zip(maximos, maximos[1:]))
+    assert medianos[0] < 0.05 and medianos[-1] < 1e-4
+
+
+def test_theta_cero_es_la_suma_directa():
+    posiciones, masas = _cumulo(300)
+    referencia = aceleraciones_sistema(posiciones, masas)
+    np.testing.assert_allclose(BarnesHut(0.0)(posiciones, masas), referencia, rtol=1e-10,
+                               atol=1e-12 * np.abs(referencia).max())
+
+
+# "barnes_hut" está en el registro de núcleos y sirve en una simulación como cualquier otro
+def test_registrado_en_nucleos():
+    assert obtener_nucleo("barnes_hut") is NUCLEOS["barnes_hut"]
+    posiciones, masas = _cumulo(200)
+    np.testing.assert_allclose(NUCLEOS["barnes_hut"](posiciones, masas), BarnesHut(0.5)(posiciones, masas))
+    directa = simular_sistema_solar(sistema_solar_completo(), 50, 86400.0, cada=50)
+    arbol = simular_sistema_solar(sistema_solar_completo(), 50, 86400.0, cada=50, nucleo="barnes_hut")
+    np.testing.assert_allclose(arbol.posiciones, directa.posiciones, rtol=0, atol=1e-6 * 1.496e11)
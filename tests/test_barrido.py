@@ -0,0 +1,36 @@
+# Regresión del barrido en procesos: cada combinación entrega su resumen y un fallo no detiene el resto
+
+from orbitas.barrido import barrido, combinaciones, ejecutar_caso
+
+DIA = 86400.0
+
+
+def test_combinaciones():
+    rejilla = list(combinaciones({"masa": [1e30, 2e30], "posicion_z": [0.0, 1e12, 2e12]}))
+    assert len(rejilla) == 6
+    assert {"masa": 2e30, "posicion_z": 1e12} in rejilla
+
+
+# Un error dentro del proceso (aquí un método que no existe) se devuelve como resumen con estado "error"
+def test_error_del_proceso_se_captura():
+    resumenes = list(barrido("alpha_centauri_A", {"masa": [1e30, 2e30]}, 20, DIA, metodo="inexistente",
+                             procesos=2))
+    assert len(resumenes) == 2
+    for resumen in resumenes:
+        assert resumen["estado"] == "error"
+        assert "ValueError" in resumen["mensaje"] and "inexistente" in resumen["mensaje"]
+    assert sorted(resumen["parametros"]["masa"] for resumen in resumenes) == [1e30, 2e30]
+
+    resumen = ejecutar_caso("alpha_centauri_A", {"temperatura": 1.0}, 20, DIA)
+    assert resumen["estado"] == "error" and "temperatura" in resumen["mensaje"]
+
+
+def test_barrido_entrega_todos_los_casos():
+    rangos = {"masa": [1e30, 2e30], "posicion_z": [0.0, 1e12]}
+    resumenes = list(barrido("alpha_centauri_A", rangos, 30, DIA, procesos=2))
+    hechos = sorted((resumen["parametros"]["masa"], resumen["parametros"]["posicion_z"]) for resumen in resumenes)
+    assert hechos == sorted((parametros["masa"], parametros["posicion_z"]) for parametros in combinaciones(rangos))
+    for resumen in resumenes:
+        assert resumen["estado"] == "ok" and resumen["error_energia"] < 1e-2
+        assert set(resumen["distancias_finales_ua"]) == {"Mercurio", "Venus", "Tierra", "Marte", "Júpiter",
+                                                         "Saturno", "Urano", "Neptuno"}
@@ -0,0 +1,44 @@
+# Regresión del motor de pasos por bloques: niveles que cambian a mitad de paso y partículas de prueba
+
+import numpy as np
+
+from orbitas import CuerpoCeleste, simular_sistema_solar
+from orbitas.escenarios import sistema_solar_externo
+from orbitas.fuerzas import G
+
+DIA = 86400.0
+UA = 1.496e11
+MASA_SOL = 1.989e30
+
+
+# Sistema solar externo con un cometa de prueba en el perihelio (0.3 UA, excentricidad 0.9)
+def _con_cometa(cometa=True):
+    cuerpos_celestes = sistema_solar_externo()
+    if cometa:
+        perihelio = 0.3 * UA
+        rapidez = np.sqrt(G * MASA_SOL * 1.9 / perihelio)
+        cuerpos_celestes.append(CuerpoCeleste.particula_prueba("Cometa", [perihelio, 0.0, 0.0], [0.0, rapidez, 0.0]))
+    return cuerpos_celestes
+
+
+# Con todos los cuerpos en el nivel 0 los bloques son un Leapfrog uniforme con el mismo dt
+def test_un_solo_nivel_es_leapfrog():
+    bloques = simular_sistema_solar(sistema_solar_externo(), 200, 10 * DIA, bloques=True, tolerancia=100.0)
+    assert [bloque["nivel"] for bloque in bloques.estadisticas["bloques"]] == [0]
+    uniforme = simular_sistema_solar(sistema_solar_externo(), 200, 10 * DIA)
+    np.testing.assert_allclose(bloques.posiciones, uniforme.posiciones, rtol=0, atol=1e-9 * UA)
+
+
+# El cometa baja y sube de nivel a mitad de paso alrededor del perihelio y sigue a IAS15; los cuerpos masivos no
+# lo notan (solo cambia cuánto se trocea su deriva)
+def test_cometa_cambia_de_nivel():
+    bloques = simular_sistema_solar(_con_cometa(), 60, 16 * DIA, bloques=True, tolerancia=0.02, cada=60)
+    niveles = [bloque["nivel"] for bloque in bloques.estadisticas["bloques"]]
+    assert max(niveles) >= 6 and len(niveles) >= 6
+
+    referencia = simular_sistema_solar(_con_cometa(), 60 * 16, DIA, motor="ias15", cada=60 * 16)
+    error = np.linalg.norm(bloques.posiciones[-1] - referencia.posiciones[-1], axis=1) / UA
+    assert error.max() < 0.01
+
+    sin_cometa = simular_sistema_solar(_con_cometa(False), 60, 16 * DIA, bloques=True, tolerancia=0.02, cada=60)
+    np.testing.assert_allclose(bloques.posiciones[:, :-1], sin_cometa.posiciones, rtol=0, atol=1e-9 * UA)
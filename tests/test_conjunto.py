@@ -0,0 +1,90 @@
+# Regresión de la integración por conjuntos: matrices de pares, reparto por índices y partículas de prueba
+
+import numpy as np
+import pytest
+
+from orbitas import (DISTANCIA_MINIMA, ConjuntoSistemas, MotorNumpy, aceleraciones_conjunto, aceleraciones_sistema,
+                     simular_conjunto)
+from orbitas.conjunto import ELEMENTOS_MATRICES_PARES, _aceleraciones_conjunto_indices
+from orbitas.escenarios import cinturon_particulas_prueba, disco_planetesimales, sistema_solar_completo
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+UA = 1.496e11
+
+
+# Sistema solar con un cinturón de partículas de prueba entre Marte y Júpiter
+def _sistema_con_prueba(numero=20):
+    solar = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    posiciones, velocidades = cinturon_particulas_prueba(numero, 2.2 * UA, 3.2 * UA)
+    return SistemaCeleste.desde_arreglos(
+        solar.nombres + [f"Asteroide {indice}" for indice in range(numero)],
+        np.concatenate([solar.masas, np.full(numero, 1e20)]),
+        np.vstack([solar.posiciones, posiciones]), np.vstack([solar.velocidades, velocidades]),
+        np.concatenate([np.zeros(solar.numero_cuerpos, dtype=bool), np.ones(numero, dtype=bool)]))
+
+
+def _miembros(sistema, numero_miembros, semilla=0):
+    generador = np.random.default_rng(semilla)
+    posiciones = sistema.posiciones * (1 + 1e-3 * generador.standard_normal((numero_miembros, 1, 1)))
+    return posiciones, np.tile(sistema.masas, (numero_miembros, 1))
+
+
+def test_reparto_por_indices_coincide_con_las_matrices():
+    posiciones, masas = _miembros(SistemaCeleste.desde_cuerpos(sistema_solar_completo()), 4)
+    matrices = aceleraciones_conjunto(posiciones, masas)
+    indices = _aceleraciones_conjunto_indices(posiciones, masas, DISTANCIA_MINIMA)
+    np.testing.assert_allclose(indices, matrices, rtol=1e-12, atol=1e-12 * np.abs(matrices).max())
+
+
+# Por encima del límite de las matrices de pares se usa el reparto por índices: cada miembro como el núcleo directo
+def test_conjunto_grande_coincide_con_el_nucleo_directo():
+    sistema = disco_planetesimales(200)
+    numero = sistema.numero_cuerpos
+    assert numero * (numero - 1) // 2 * numero > ELEMENTOS_MATRICES_PARES
+    posiciones, masas = _miembros(sistema, 2)
+    aceleraciones = aceleraciones_conjunto(posiciones, masas)
+    for miembro in range(2):
+        referencia = aceleraciones_sistema(posiciones[miembro], masas[miembro])
+        np.testing.assert_allclose(aceleraciones[miembro], referencia, rtol=1e-9,
+                                   atol=1e-12 * np.abs(referencia).max())
+
+
+# Las partículas de prueba sienten la gravedad pero no la ejercen, igual que en la simulación de un solo sistema
+@pytest.mark.parametrize("metodo", ["leapfrog", "euler_cromer"])
+def test_particulas_de_prueba(metodo):
+    sistema = _sistema_con_prueba()
+    conjunto = ConjuntoSistemas(sistema.nombres, sistema.masas, np.tile(sistema.posiciones, (3, 1, 1)),
+                                np.tile(sistema.velocidades, (3, 1, 1)), sistema.prueba)
+    trayectoria = simular_conjunto(conjunto, 200, DIA, metodo=metodo, cada=10)
+    MotorNumpy().avanzar(sistema, 200, DIA, metodo=metodo)
+    escala = np.abs(sistema.posiciones).max()
+    for miembro in range(3):
+        np.testing.assert_allclose(conjunto.posiciones[miembro], sistema.posiciones, rtol=0, atol=1e-9 * escala)
+        np.testing.assert_allclose(trayectoria.posiciones[-1, miembro], sistema.posiciones, rtol=0,
+                                   atol=1e-9 * escala)
+    assert np.array_equal(conjunto.miembro(0).prueba, sistema.prueba)
+
+
+# Con partículas de prueba se separan masivos y partículas: mismo resultado que tratarlas como masas nulas
+def test_particulas_separadas_coinciden_con_masas_nulas():
+    sistema = _sistema_con_prueba(60)
+    posiciones, masas = _miembros(sistema, 3)
+    separadas = aceleraciones_conjunto(posiciones, masas, prueba=sistema.prueba)
+    nulas = aceleraciones_conjunto(posiciones, np.where(sistema.prueba, 0.0, masas))
+    np.testing.assert_allclose(separadas, nulas, rtol=1e-12, atol=1e-12 * np.abs(nulas).max())
+    sin_particulas = aceleraciones_conjunto(posiciones[:, ~sistema.prueba], masas[:, ~sistema.prueba])
+    assert np.array_equal(separadas[:, ~sistema.prueba], sin_particulas)
+
+
+# Avanzar cero pasos no toca el estado (ni el medio impulso del Leapfrog)
+@pytest.mark.parametrize("metodo", ["leapfrog", "euler_cromer"])
+def test_cero_pasos(metodo):
+    sistema = _sistema_con_prueba()
+    conjunto = ConjuntoSistemas(sistema.nombres, sistema.masas, np.tile(sistema.posiciones, (2, 1, 1)),
+                                np.tile(sistema.velocidades, (2, 1, 1)), sistema.prueba)
+    posiciones, velocidades = conjunto.posiciones.copy(), conjunto.velocidades.copy()
+    trayectoria = simular_conjunto(conjunto, 0, DIA, metodo=metodo)
+    assert len(trayectoria) == 0
+    assert np.array_equal(conjunto.posiciones, posiciones)
+    assert np.array_equal(conjunto.velocidades, velocidades)
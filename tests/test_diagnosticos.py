@@ -0,0 +1,70 @@
+# Regresión de los diagnósticos de conservación: medir no cambia la integración y la alarma salta una vez por cantidad
+
+import numpy as np
+import pytest
+
+from orbitas import simular_sistema_solar
+from orbitas.diagnosticos import Diagnosticos, energia_potencial
+from orbitas.escenarios import sistema_solar_completo
+from orbitas.fuerzas import G
+
+DIA = 86400.0
+
+
+class Detener(Exception):
+    pass
+
+
+def test_energia_potencial_por_pares():
+    generador = np.random.default_rng(3)
+    masas = generador.uniform(1e24, 1e30, 7)
+    posiciones = generador.normal(0.0, 1e11, (7, 3))
+    esperada = -G * sum(masas[i] * masas[j] / np.linalg.norm(posiciones[i] - posiciones[j])
+                        for i in range(7) for j in range(i + 1, 7))
+    assert energia_potencial(masas, posiciones) == pytest.approx(esperada, rel=1e-13)
+
+
+# Medir cada 10 pasos (y al terminar) deja la trayectoria idéntica bit a bit y la deriva del Leapfrog acotada
+def test_medir_no_cambia_la_integracion():
+    referencia = simular_sistema_solar(sistema_solar_completo(), 365, DIA, cada=5)
+    trayectoria = simular_sistema_solar(sistema_solar_completo(), 365, DIA, cada=5, diagnosticos=10)
+    assert np.array_equal(trayectoria.posiciones, referencia.posiciones)
+    diagnosticos = trayectoria.diagnosticos
+    assert np.array_equal(diagnosticos.pasos, list(range(0, 361, 10)) + [365])
+    resumen = diagnosticos.resumen()
+    assert 0 < resumen["energia"] < 1e-5 and resumen["momento"] < 1e-12
+
+
+# Con un umbral por debajo de la deriva de energía del Leapfrog la alarma salta en la primera medida que lo supera,
+# una sola vez, con un RuntimeWarning o con la función indicada
+def test_alarma():
+    with pytest.warns(RuntimeWarning, match="energia"):
+        trayectoria = simular_sistema_solar(sistema_solar_completo(), 200, DIA,
+                                            diagnosticos=Diagnosticos(cada=20, umbral=1e-9))
+    diagnosticos = trayectoria.diagnosticos
+    alarmas = [alarma for alarma in diagnosticos.alarmas if alarma["cantidad"] == "energia"]
+    assert len(alarmas) == 1
+    primera = np.flatnonzero(np.abs(diagnosticos.deriva_energia) > 1e-9)[0]
+    assert alarmas[0]["paso"] == diagnosticos.pasos[primera]
+    assert alarmas[0]["deriva"] == pytest.approx(abs(diagnosticos.deriva_energia[primera]))
+
+    avisos = []
+    simular_sistema_solar(sistema_solar_completo(), 200, DIA, diagnosticos=Diagnosticos(
+        cada=20, umbral=1e-9, alarma=lambda diagnosticos, cantidad, deriva: avisos.append((cantidad, deriva))))
+    assert ("energia", alarmas[0]["deriva"]) in avisos
+
+
+# La función de alarma puede detener la simulación lanzando una excepción
+def test_alarma_detiene_la_simulacion():
+    def detener(diagnosticos, cantidad, deriva):
+        raise Detener(cantidad)
+
+    diagnosticos = Diagnosticos(cada=20, umbral=1e-9, alarma=detener)
+    with pytest.raises(Detener):
+        simular_sistema_solar(sistema_solar_completo(), 2000, DIA, diagnosticos=diagnosticos)
+    assert diagnosticos.pasos[-1] < 2000
+
+
+def test_cada_invalido():
+    with pytest.raises(ValueError):
+        Diagnosticos(cada=0)
@@ -0,0 +1,74 @@
+# Regresión de TrayectoriaDisco: lo escrito en disco y vuelto a abrir es idéntico a la trayectoria en memoria
+
+import numpy as np
+
+from orbitas import MotorNumpy, SistemaCeleste, Trayectoria, TrayectoriaDisco, abrir_trayectoria, simular_sistema_solar
+from orbitas.disco import leer_cabecera
+from orbitas.escenarios import sistema_solar_completo
+
+DIA = 86400.0
+
+
+def _comparar(trayectoria, referencia):
+    assert trayectoria.nombres == referencia.nombres
+    assert trayectoria.cada == referencia.cada
+    assert trayectoria.paso_inicial == referencia.paso_inicial
+    assert trayectoria.numero_muestras == referencia.numero_muestras
+    assert np.array_equal(trayectoria.posiciones, referencia.posiciones)
+    assert np.array_equal(trayectoria.velocidades, referencia.velocidades)
+    assert np.array_equal(trayectoria.tiempos, referencia.tiempos)
+    assert np.array_equal(trayectoria.pasos, referencia.pasos)
+    assert np.array_equal(trayectoria.duraciones, referencia.duraciones, equal_nan=True)
+
+
+def test_ida_y_vuelta(tmp_path):
+    referencia = simular_sistema_solar(sistema_solar_completo(), 500, DIA, cada=3, guardar_velocidades=True)
+    ruta = tmp_path / "trayectoria"
+    simular_sistema_solar(sistema_solar_completo(), 500, DIA, cada=3, guardar_velocidades=True,
+                          archivo_trayectoria=str(ruta))
+
+    trayectoria = abrir_trayectoria(str(ruta))
+    _comparar(trayectoria, referencia)
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    assert np.array_equal(trayectoria.masas, sistema.masas)
+    assert np.array_equal(trayectoria.prueba, sistema.prueba)
+    assert leer_cabecera(str(ruta))["capacidad"] == referencia.numero_muestras  # cerrar() recorta los archivos
+
+
+# Volcados intermedios por bloques y trayectoria ampliable (más muestras que la capacidad inicial)
+def test_volcados_por_bloques_y_ampliacion(tmp_path):
+    ruta = tmp_path / "trayectoria"
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    referencia = Trayectoria(sistema.nombres, 10, guardar_velocidades=True, ampliable=True)
+    with TrayectoriaDisco(str(ruta), sistema.nombres, 10, guardar_velocidades=True, ampliable=True,
+                          masas=sistema.masas, muestras_por_bloque=16) as trayectoria:
+        for _ in range(100):
+            MotorNumpy().avanzar(sistema, 1, DIA)
+            referencia.registrar(sistema.numero_paso, sistema.tiempo, sistema, DIA)
+            trayectoria.registrar(sistema.numero_paso, sistema.tiempo, sistema, DIA)
+            if sistema.numero_paso == 40:  # A mitad de escritura la cabecera solo cuenta los bloques volcados
+                assert leer_cabecera(str(ruta))["numero_muestras"] == 32
+    _comparar(abrir_trayectoria(str(ruta)), referencia)
+
+
+# Reabrir con menos muestras válidas (como al reanudar un punto de control) sobrescribe lo escrito después
+def test_reabrir_sobrescribe(tmp_path):
+    ruta = tmp_path / "trayectoria"
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    with TrayectoriaDisco(str(ruta), sistema.nombres, 50) as trayectoria:
+        MotorNumpy().avanzar(sistema, 50, DIA, trayectoria=trayectoria)
+    guardada = abrir_trayectoria(str(ruta))
+    posiciones = np.array(guardada.posiciones[:20])
+    del guardada
+
+    trayectoria = TrayectoriaDisco.reabrir(str(ruta), 20, num_pasos=30)
+    sistema.posiciones[:] += 1.0
+    for paso in range(21, 31):
+        trayectoria.registrar(paso, paso * DIA, sistema, DIA)
+    trayectoria.cerrar()
+
+    reabierta = abrir_trayectoria(str(ruta))
+    assert reabierta.numero_muestras == 30
+    assert np.array_equal(reabierta.posiciones[:20], posiciones)
+    assert np.array_equal(reabierta.posiciones[20:], np.broadcast_to(sistema.posiciones, (10,) + posiciones.shape[1:]))
+    assert np.array_equal(reabierta.pasos, np.arange(1, 31))
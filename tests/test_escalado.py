@@ -0,0 +1,34 @@
+# Regresión del banco de escalado: medidas por solucionador y cruces interpolados en escala logarítmica
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import escalado
+from escalado import cruces, medir
+
+
+def _serie(solucionador, tiempos):
+    return [{"hilos": 1, "solucionador": solucionador, "cuerpos": cuerpos, "segundos_paso": segundos}
+            for cuerpos, segundos in tiempos.items()]
+
+
+# Directo ∝ N², árbol ∝ 10 N: se cruzan en N = 10, entre las medidas de 3 y 30 cuerpos
+def test_cruces():
+    resultados = (_serie("numpy/directo", {3: 9.0, 30: 900.0, 300: 90000.0})
+                  + _serie("numpy/barnes_hut", {3: 30.0, 30: 300.0, 300: 3000.0}))
+    encontrados = cruces(resultados)
+    assert len(encontrados) == 1
+    assert encontrados[0]["cuerpos"] == pytest.approx(10.0)
+    assert encontrados[0]["mas_rapido_despues"] == "numpy/barnes_hut"
+    assert cruces(_serie("numpy/directo", {3: 1.0, 30: 2.0})) == []
+
+
+def test_medir(monkeypatch):
+    monkeypatch.setattr(escalado, "SEGUNDOS_MINIMOS", 0.01)
+    resultado = medir("numpy/directo", 50)
+    assert resultado["cuerpos"] == 51 and resultado["solucionador"] == "numpy/directo"
+    assert resultado["segundos_fuerzas"] > 0 and resultado["segundos_paso"] > 0
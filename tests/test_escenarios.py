@@ -0,0 +1,35 @@
+# Regresión de los escenarios: disco sintético de planetesimales (estrella primero, órbitas circulares, semilla fija)
+
+import numpy as np
+
+from orbitas.escenarios import MASA_SOL, disco_planetesimales
+from orbitas.fuerzas import G
+
+UA = 1.496e11
+
+
+def test_disco_planetesimales():
+    disco = disco_planetesimales(500, semilla=4)
+    assert disco.numero_cuerpos == 501 and len(disco.cuerpos) == 501
+    assert disco.nombres[0] == "Estrella" and disco.nombres[-1] == "Planetesimal 500"
+    assert disco.masas[0] == MASA_SOL and np.all(disco.posiciones[0] == 0) and np.all(disco.velocidades[0] == 0)
+    assert np.all((disco.masas[1:] >= 1e18) & (disco.masas[1:] <= 1e21)) and not disco.prueba.any()
+
+    posiciones, velocidades = disco.posiciones[1:], disco.velocidades[1:]
+    radios = np.linalg.norm(posiciones[:, :2], axis=1)
+    assert radios.min() >= 0.5 * UA and radios.max() <= 5.0 * UA
+    assert np.all(np.abs(posiciones[:, 2]) < 0.05 * radios)  # Disco delgado (σ = 1 % del radio)
+    # Velocidad circular, perpendicular al radio y en el plano del disco
+    np.testing.assert_allclose(np.linalg.norm(velocidades, axis=1), np.sqrt(G * MASA_SOL / radios), rtol=1e-12)
+    np.testing.assert_allclose(np.einsum("nk,nk->n", posiciones[:, :2], velocidades[:, :2]), 0.0,
+                               atol=1e-9 * UA * 3e4)
+    assert np.all(velocidades[:, 2] == 0)
+
+
+def test_disco_reproducible():
+    uno, otro = disco_planetesimales(100, semilla=7), disco_planetesimales(100, semilla=7)
+    assert np.array_equal(uno.posiciones, otro.posiciones) and np.array_equal(uno.masas, otro.masas)
+    assert not np.array_equal(uno.posiciones, disco_planetesimales(100, semilla=8).posiciones)
+    estrella = disco_planetesimales(10, masa_estrella=2 * MASA_SOL)
+    np.testing.assert_allclose(np.linalg.norm(estrella.velocidades[1:], axis=1),
+                               np.sqrt(2) * np.linalg.norm(disco_planetesimales(10).velocidades[1:], axis=1))
@@ -0,0 +1,73 @@
+# Regresión de las estadísticas de los motores (bloques, IAS15): se acumulan en todos los avances, aunque la
+# simulación se trocee por diagnósticos, puntos de control o Simulacion
+
+import pytest
+
+from orbitas import MotorIAS15, Simulacion, simular_sistema_solar
+from orbitas.escenarios import sistema_solar_completo
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+NUM_PASOS = 700
+
+
+def _estadisticas_troceadas(tmp_path, opciones):
+    sin_trocear = simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA, **opciones).estadisticas
+    con_diagnosticos = simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA, diagnosticos=100,
+                                             **opciones).estadisticas
+    con_puntos_control = simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA,
+                                               punto_control=str(tmp_path / "punto_control.npz"),
+                                               pasos_punto_control=100, **opciones).estadisticas
+    return sin_trocear, con_diagnosticos, con_puntos_control
+
+
+def test_bloques(tmp_path):
+    sin_trocear, con_diagnosticos, con_puntos_control = _estadisticas_troceadas(tmp_path, {"bloques": True})
+    assert con_diagnosticos == sin_trocear
+    assert con_puntos_control == sin_trocear
+
+    simulacion = Simulacion(sistema_solar_completo(), DIA, cada=100, num_pasos=NUM_PASOS, bloques=True)
+    for _ in simulacion:
+        pass
+    assert simulacion.estadisticas == sin_trocear
+
+    # Cada paso dt empieza con todos los cuerpos en algún nivel: la ocupación media suma el número de cuerpos
+    assert sum(bloque["cuerpos_medios"] for bloque in sin_trocear["bloques"]) == pytest.approx(9)
+
+
+# IAS15 ajusta su paso a las fronteras de cada tramo, así que el trabajo depende del troceado; los pasos cuentan
+# todos los tramos (con una muestra por paso de salida, al menos uno por cada uno)
+def test_ias15(tmp_path):
+    sin_trocear, con_diagnosticos, con_puntos_control = _estadisticas_troceadas(tmp_path, {"motor": "ias15"})
+    for estadisticas in (sin_trocear, con_diagnosticos, con_puntos_control):
+        assert estadisticas["pasos"] == NUM_PASOS
+        assert estadisticas["evaluaciones"] > 7 * NUM_PASOS
+
+
+# Simulacion acumula lo mismo que sumar tramo a tramo las estadísticas de un motor reiniciado en cada tramo
+def test_simulacion_ias15():
+    simulacion = Simulacion(sistema_solar_completo(), DIA, cada=100, motor="ias15")
+    for _ in range(7):
+        next(simulacion)
+
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    motor = MotorIAS15()
+    pasos = evaluaciones = 0
+    for _ in range(7):
+        motor.reiniciar_estadisticas()
+        motor.avanzar(sistema, 100, DIA)
+        pasos += motor.estadisticas["pasos"]
+        evaluaciones += motor.estadisticas["evaluaciones"]
+    assert simulacion.estadisticas["pasos"] == pasos
+    assert simulacion.estadisticas["evaluaciones"] == evaluaciones
+    assert simulacion.estadisticas["pasos"] > motor.estadisticas["pasos"]
+
+
+def test_reiniciar_estadisticas():
+    simulacion = Simulacion(sistema_solar_completo(), DIA, cada=50, bloques=True)
+    assert simulacion.estadisticas is None
+    simulacion.avanzar(100)
+    simulacion.motor.reiniciar_estadisticas()
+    assert simulacion.estadisticas is None
+    simulacion.avanzar(50)
+    assert sum(bloque["cuerpos_medios"] for bloque in simulacion.estadisticas["bloques"]) == pytest.approx(9)
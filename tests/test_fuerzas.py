@@ -0,0 +1,63 @@
+# Regresión de los núcleos de fuerza: directo, pares y pares_escalar calculan la misma suma directa que la
+# versión escalar cuerpo a cuerpo
+
+import numpy as np
+import pytest
+
+import orbitas.fuerzas
+from orbitas import NUCLEOS, aceleraciones_sistema
+from orbitas.escenarios import disco_planetesimales, sistema_solar_completo
+from orbitas.fuerzas import aceleracion_gravitacional, aceleraciones_cuerpos
+from orbitas.sistema import SistemaCeleste
+
+
+def _sistemas():
+    yield SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    yield disco_planetesimales(200, semilla=3)
+
+
+@pytest.mark.parametrize("nucleo", ["pares", "pares_escalar"])
+def test_nucleos_por_pares_coinciden_con_el_directo(nucleo):
+    for sistema in _sistemas():
+        referencia = aceleraciones_sistema(sistema.posiciones, sistema.masas)
+        resultado = NUCLEOS[nucleo](sistema.posiciones, sistema.masas)
+        escala = np.abs(referencia).max(axis=1, keepdims=True)
+        np.testing.assert_allclose(resultado / escala, referencia / escala, rtol=0, atol=1e-12)
+
+
+# Tercera ley de Newton: la fuerza total sobre un sistema aislado es nula
+@pytest.mark.parametrize("nucleo", ["directo", "pares", "pares_escalar"])
+def test_fuerza_total_nula(nucleo):
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    aceleraciones = NUCLEOS[nucleo](sistema.posiciones, sistema.masas)
+    fuerza_total = sistema.masas @ aceleraciones
+    escala = np.abs(sistema.masas[:, np.newaxis] * aceleraciones).max()
+    assert np.abs(fuerza_total).max() <= 1e-12 * escala
+
+
+# Cuerpos coincidentes (distancia < DISTANCIA_MINIMA) no producen infinitos en ningún núcleo
+@pytest.mark.parametrize("nucleo", ["directo", "pares", "pares_escalar"])
+def test_cuerpos_coincidentes(nucleo):
+    posiciones = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1e11, 0.0, 0.0]])
+    masas = np.array([1e30, 1e24, 1e24])
+    aceleraciones = NUCLEOS[nucleo](posiciones, masas)
+    assert np.isfinite(aceleraciones).all()
+    np.testing.assert_allclose(aceleraciones, aceleraciones_sistema(posiciones, masas), rtol=1e-12)
+
+
+# El núcleo vectorizado reproduce la suma escalar cuerpo a cuerpo a la que sustituyó
+def test_directo_coincide_con_la_version_escalar():
+    cuerpos = sistema_solar_completo()
+    referencia = np.array([aceleracion_gravitacional(cuerpo, cuerpos) for cuerpo in cuerpos])
+    sistema = SistemaCeleste.desde_cuerpos(cuerpos)
+    for aceleraciones in (aceleraciones_sistema(sistema.posiciones, sistema.masas), aceleraciones_cuerpos(cuerpos)):
+        np.testing.assert_allclose(aceleraciones, referencia, rtol=1e-12)
+
+
+# Procesar los objetivos por bloques (para no crear el arreglo (N, N, 3) completo) no cambia el resultado
+def test_directo_por_bloques(monkeypatch):
+    sistema = disco_planetesimales(300, semilla=1)
+    referencia = aceleraciones_sistema(sistema.posiciones, sistema.masas)
+    monkeypatch.setattr(orbitas.fuerzas, "ELEMENTOS_POR_BLOQUE", 7 * sistema.numero_cuerpos)
+    por_bloques = aceleraciones_sistema(sistema.posiciones, sistema.masas)
+    np.testing.assert_allclose(por_bloques, referencia, rtol=1e-14)
@@ -0,0 +1,37 @@
+# Regresión del motor IAS15: avances vacíos y precisión de referencia
+
+import numpy as np
+import pytest
+
+from orbitas import MotorIAS15, Trayectoria, simular_sistema_solar
+from orbitas.diagnosticos import energia
+from orbitas.escenarios import sistema_solar_completo
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+
+
+# Cero pasos (o menos) no avanza nada, no registra nada y no divide por cero
+@pytest.mark.parametrize("num_pasos", [0, -3])
+def test_sin_pasos(num_pasos):
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    posiciones, velocidades = sistema.posiciones.copy(), sistema.velocidades.copy()
+    trayectoria = Trayectoria(sistema.nombres, 0)
+    motor = MotorIAS15()
+    motor.avanzar(sistema, num_pasos, DIA, trayectoria=trayectoria)
+    assert np.array_equal(sistema.posiciones, posiciones)
+    assert np.array_equal(sistema.velocidades, velocidades)
+    assert sistema.tiempo == 0.0 and sistema.numero_paso == 0
+    assert trayectoria.numero_muestras == 0
+    assert motor.estadisticas is None
+    assert len(simular_sistema_solar(sistema_solar_completo(), 0, DIA, motor="ias15")) == 0
+
+
+def test_conserva_la_energia():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    inicial = energia(sistema.masas, sistema.posiciones, sistema.velocidades)
+    MotorIAS15().avanzar(sistema, 3650, DIA)
+    final = energia(sistema.masas, sistema.posiciones, sistema.velocidades)
+    assert abs((final - inicial) / inicial) < 1e-12
+    assert sistema.tiempo == pytest.approx(3650 * DIA)
+    assert sistema.numero_paso == 3650
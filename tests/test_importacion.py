@@ -0,0 +1,48 @@
+# Regresión de la importación: importar FisicaComputacional u orbitas no simula nada ni carga dependencias pesadas
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Ejecutar programa en un intérprete nuevo con la raíz del repositorio en la ruta; devuelve su salida
+def _en_proceso_nuevo(programa):
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [RAIZ, os.environ.get("PYTHONPATH")])))
+    entorno.pop("ORBITAS_FIGURAS", None)
+    return subprocess.run([sys.executable, "-c", programa], cwd=RAIZ, env=entorno, capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+# Se sustituye simular_sistema_solar antes de importar el módulo: ninguna llamada significa ningún escenario ejecutado
+def test_importar_no_ejecuta_escenarios():
+    salida = _en_proceso_nuevo(
+        "import sys, orbitas\n"
+        "llamadas = []\n"
+        "orbitas.simular_sistema_solar = lambda *args, **kwargs: llamadas.append(args)\n"
+        "import FisicaComputacional\n"
+        "print(len(llamadas), len(FisicaComputacional.ESCENARIOS), 'numba' in sys.modules)\n")
+    assert salida == "0 12 False"
+
+
+def test_listar_y_escenario_desconocido(capsys):
+    import FisicaComputacional
+    FisicaComputacional.main(["--listar"])
+    lineas = capsys.readouterr().out.splitlines()
+    assert [linea.split()[0] for linea in lineas] == list(FisicaComputacional.ESCENARIOS)
+    with pytest.raises(ValueError):
+        FisicaComputacional.ejecutar_escenario("plutoniano")
+    with pytest.raises(SystemExit):
+        FisicaComputacional.main(["plutoniano"])
+
+
+# matplotlib se carga al dibujar la primera figura, no al importar ni al simular
+def test_matplotlib_solo_al_dibujar():
+    salida = _en_proceso_nuevo(
+        "import sys, orbitas, FisicaComputacional\n"
+        "orbitas.simular_sistema_solar(orbitas.escenarios.sistema_solar_completo(), 10, 86400.0)\n"
+        "print('matplotlib' in sys.modules)\n")
+    assert salida == "False"
@@ -0,0 +1,53 @@
+# Regresión de la instrumentación: llamadas por fase, integración sin cambios y perfiles de cProfile
+
+import numpy as np
+
+from orbitas import simular_sistema_solar
+from orbitas.escenarios import sistema_solar_completo
+from orbitas.instrumentacion import Fases
+
+DIA = 86400.0
+
+
+# Leapfrog: una evaluación de fuerza inicial y una por paso; registrar se llama en cada paso (la trayectoria diezma);
+# diagnósticos en el paso 0, cada 25 y al terminar (la última llamada no repite la medida del paso 100)
+def test_llamadas_por_fase():
+    referencia = simular_sistema_solar(sistema_solar_completo(), 100, DIA, cada=10, diagnosticos=25)
+    trayectoria = simular_sistema_solar(sistema_solar_completo(), 100, DIA, cada=10, diagnosticos=25,
+                                        instrumentar=True)
+    assert np.array_equal(trayectoria.posiciones, referencia.posiciones)
+    fases = trayectoria.fases
+    assert dict(fases.llamadas) == {"total": 1, "integracion": 1, "fuerzas": 101, "registro": 100,
+                                    "diagnosticos": 6}
+    resumen = fases.resumen()
+    assert set(resumen) == {"total", "integracion", "fuerzas", "registro", "diagnosticos", "actualizaciones", "otros"}
+    assert resumen["actualizaciones"]["llamadas"] is None
+    assert len(trayectoria.diagnosticos) == 5
+    assert fases.segundos["total"] >= fases.segundos["integracion"] >= fases.segundos["fuerzas"] > 0
+    assert "registrar" not in vars(trayectoria) and "medir" not in vars(trayectoria.diagnosticos)  # Sin envoltorios
+
+
+# Yoshida de orden 4: tres evaluaciones de fuerza por paso
+def test_llamadas_de_fuerza_por_metodo():
+    trayectoria = simular_sistema_solar(sistema_solar_completo(), 50, DIA, metodo="yoshida4", instrumentar=True)
+    assert trayectoria.fases.llamadas["fuerzas"] == 1 + 3 * 50
+
+
+def test_fases_envolver_y_resumen():
+    fases = Fases()
+    doble = fases.envolver("fuerzas", lambda x: 2 * x)
+    assert [doble(x) for x in range(4)] == [0, 2, 4, 6] and doble.__wrapped__(5) == 10
+    with fases.medir("integracion"):
+        doble(1)
+    assert fases.llamadas["fuerzas"] == 5 and fases.llamadas["integracion"] == 1
+    assert fases.informe().splitlines()[0].split()[0] == "fase"
+
+
+# El perfil en pilas colapsadas nombra el núcleo de fuerza dentro de la pila de la simulación
+def test_perfil_en_pilas_colapsadas(tmp_path):
+    ruta = str(tmp_path / "perfil.folded")
+    simular_sistema_solar(sistema_solar_completo(), 50, DIA, perfil=ruta)
+    with open(ruta, encoding="utf-8") as archivo:
+        pilas = archivo.read().splitlines()
+    assert pilas and all(int(linea.rsplit(" ", 1)[1]) > 0 for linea in pilas)
+    assert any("aceleraciones_sistema" in linea for linea in pilas)
@@ -0,0 +1,69 @@
+# Regresión de los métodos de integración: Leapfrog sincronizado frente a un paso calculado a mano y orden de
+# convergencia medido de los métodos de orden alto
+
+import numpy as np
+import pytest
+
+from orbitas import CuerpoCeleste, paso_leapfrog, simular_sistema_solar
+from orbitas.fuerzas import G
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+UA = 1.496e11
+
+
+def _dos_cuerpos():
+    masas = np.array([1.989e30, 5.972e24])
+    posiciones = np.array([[0.0, 0.0, 0.0], [1.496e11, 0.0, 0.0]])
+    velocidades = np.array([[0.0, 0.0, 0.0], [0.0, 29780.0, 0.0]])
+    return masas, posiciones, velocidades
+
+
+def _aceleraciones_a_mano(posiciones, masas):
+    r = posiciones[1] - posiciones[0]
+    inverso_cubo = 1 / np.linalg.norm(r) ** 3
+    return np.array([G * masas[1] * r * inverso_cubo, -G * masas[0] * r * inverso_cubo])
+
+
+# Impulso-deriva-impulso con las fuerzas de todos los cuerpos evaluadas a la vez; las velocidades que devuelve el
+# sistema están sincronizadas con las posiciones aunque el impulso de cierre se funda con el siguiente
+def test_leapfrog_dos_cuerpos_a_mano():
+    masas, posiciones, velocidades = _dos_cuerpos()
+    sistema = SistemaCeleste.desde_arreglos(["Sol", "Tierra"], masas, posiciones, velocidades)
+    llamadas = []
+
+    def contar(posiciones, masas):
+        llamadas.append(None)
+        return _aceleraciones_a_mano(posiciones, masas)
+
+    dt = 10 * DIA
+    for _ in range(3):
+        velocidades = velocidades + 0.5 * dt * _aceleraciones_a_mano(posiciones, masas)
+        posiciones = posiciones + dt * velocidades
+        velocidades = velocidades + 0.5 * dt * _aceleraciones_a_mano(posiciones, masas)
+        paso_leapfrog(sistema, dt, contar)
+        np.testing.assert_allclose(sistema.posiciones, posiciones, rtol=1e-14, atol=1e-3)
+        np.testing.assert_allclose(sistema.velocidades, velocidades, rtol=1e-13, atol=1e-9)
+    assert len(llamadas) == 4  # La evaluación inicial y una por paso
+
+
+# Cometa de excentricidad 0.5 alrededor del Sol, lanzado desde el perihelio
+def _cometa():
+    masa_sol = 1.989e30
+    perihelio = 0.5 * UA
+    velocidad = np.sqrt(G * masa_sol * 1.5 / perihelio)
+    return [CuerpoCeleste("Sol", masa_sol, [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]),
+            CuerpoCeleste("Cometa", 1e20, [perihelio, 0.0, 0.0], [0.0, velocidad, 0.0])]
+
+
+# Al partir el paso a la mitad el error final tras un año cae 2^orden veces; la referencia es IAS15
+@pytest.mark.parametrize("metodo, orden", [("leapfrog", 2), ("yoshida4", 4), ("forest_ruth", 4), ("yoshida6", 6)])
+def test_orden_de_convergencia(metodo, orden):
+    anio = 365.25 * DIA
+    referencia = simular_sistema_solar(_cometa(), 1, anio, motor="ias15", cada=1).posiciones[-1, 1]
+    errores = []
+    for num_pasos in (128, 256, 512):
+        final = simular_sistema_solar(_cometa(), num_pasos, anio / num_pasos, metodo=metodo, cada=num_pasos)
+        errores.append(np.linalg.norm(final.posiciones[-1, 1] - referencia))
+    medidos = np.log2(np.array(errores[:-1]) / errores[1:])
+    np.testing.assert_allclose(medidos, orden, atol=0.15)
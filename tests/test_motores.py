@@ -0,0 +1,101 @@
+# Regresión del motor Numba frente al motor NumPy (leapfrog y euler_cromer)
+# Los bucles compilados suman las fuerzas en otro orden: se comparan con tolerancia, no bit a bit
+
+import numpy as np
+import pytest
+
+from orbitas import NUMBA_DISPONIBLE, MotorNumba, MotorNumpy, Trayectoria, aceleraciones_numba
+from orbitas.escenarios import disco_planetesimales, sistema_solar_completo
+from orbitas.fuerzas import obtener_nucleo
+from orbitas.sistema import SistemaCeleste
+
+pytestmark = pytest.mark.skipif(not NUMBA_DISPONIBLE, reason="Numba no está instalado")
+
+DIA = 86400.0
+
+
+# Sistema solar y un disco con partículas de prueba (solo sienten a los cuerpos masivos)
+def _sistemas():
+    yield lambda: SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    disco = disco_planetesimales(40, semilla=1)
+    prueba = np.arange(disco.numero_cuerpos) % 2 == 0
+    prueba[0] = False
+    yield lambda: SistemaCeleste.desde_arreglos(disco.nombres, disco.masas, disco.posiciones, disco.velocidades,
+                                                prueba)
+
+
+def _avanzar(motor, construir, metodo, nucleo, num_pasos=400, cada=7):
+    sistema = construir()
+    trayectoria = Trayectoria(sistema.nombres, num_pasos, cada=cada, guardar_velocidades=True)
+    motor.avanzar(sistema, num_pasos, DIA, metodo=metodo, nucleo=nucleo, trayectoria=trayectoria)
+    return sistema, trayectoria
+
+
+@pytest.mark.parametrize("metodo", ["leapfrog", "euler_cromer"])
+@pytest.mark.parametrize("nucleo", ["directo", "pares"])
+def test_numba_coincide_con_numpy(metodo, nucleo):
+    for construir in _sistemas():
+        referencia, trayectoria_referencia = _avanzar(MotorNumpy(), construir, metodo, nucleo)
+        sistema, trayectoria = _avanzar(MotorNumba(), construir, metodo, nucleo)
+        escala = np.abs(referencia.posiciones).max()
+        np.testing.assert_allclose(sistema.posiciones, referencia.posiciones, rtol=0, atol=1e-9 * escala)
+        np.testing.assert_allclose(sistema.velocidades, referencia.velocidades, rtol=1e-8,
+                                   atol=1e-9 * np.abs(referencia.velocidades).max())
+        assert sistema.tiempo == referencia.tiempo
+        assert sistema.numero_paso == referencia.numero_paso
+        np.testing.assert_array_equal(trayectoria.pasos, trayectoria_referencia.pasos)
+        np.testing.assert_array_equal(trayectoria.tiempos, trayectoria_referencia.tiempos)
+        np.testing.assert_allclose(trayectoria.posiciones, trayectoria_referencia.posiciones, rtol=0,
+                                   atol=1e-9 * escala)
+
+
+# Avanzar en varios tramos con Numba equivale a avanzar de una vez (el medio impulso del Leapfrog se conserva)
+@pytest.mark.parametrize("metodo", ["leapfrog", "euler_cromer"])
+def test_numba_por_tramos(metodo):
+    construir = next(_sistemas())
+    referencia, _ = _avanzar(MotorNumba(), construir, metodo, "directo", num_pasos=300)
+    sistema = construir()
+    motor = MotorNumba()
+    for tramo in (100, 150, 50):
+        motor.avanzar(sistema, tramo, DIA, metodo=metodo)
+    np.testing.assert_allclose(sistema.posiciones, referencia.posiciones, rtol=1e-12)
+    np.testing.assert_allclose(sistema.velocidades, referencia.velocidades, rtol=1e-10)
+
+
+def test_numba_rechaza_metodos_no_compilados():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    with pytest.raises(ValueError):
+        MotorNumba().avanzar(sistema, 1, DIA, metodo="yoshida4")
+
+
+# Una trayectoria llena se amplía si es ampliable y si no es un error, igual en los dos motores
+@pytest.mark.parametrize("metodo", ["leapfrog", "euler_cromer"])
+def test_trayectoria_llena(metodo):
+    for motor in (MotorNumpy(), MotorNumba()):
+        sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+        trayectoria = Trayectoria(sistema.nombres, 10, cada=2)
+        with pytest.raises(ValueError, match="llena"):
+            motor.avanzar(sistema, 20, DIA, metodo=metodo, trayectoria=trayectoria)
+
+    construir = next(_sistemas())
+    referencia = construir()
+    trayectoria_referencia = Trayectoria(referencia.nombres, 10, cada=2, ampliable=True)
+    MotorNumpy().avanzar(referencia, 100, DIA, metodo=metodo, trayectoria=trayectoria_referencia)
+    sistema = construir()
+    trayectoria = Trayectoria(sistema.nombres, 10, cada=2, ampliable=True)
+    MotorNumba().avanzar(sistema, 100, DIA, metodo=metodo, trayectoria=trayectoria)
+    assert trayectoria.numero_muestras == trayectoria_referencia.numero_muestras == 50
+    np.testing.assert_array_equal(trayectoria.pasos, trayectoria_referencia.pasos)
+    np.testing.assert_allclose(trayectoria.posiciones, trayectoria_referencia.posiciones, rtol=0,
+                               atol=1e-9 * np.abs(referencia.posiciones).max())
+
+
+@pytest.mark.parametrize("prueba", [False, True])
+def test_aceleraciones_numba(prueba):
+    disco = disco_planetesimales(50, semilla=2)
+    mascara = (np.arange(disco.numero_cuerpos) % 3 == 1) & prueba
+    referencia = obtener_nucleo("directo", mascara)(disco.posiciones, disco.masas)
+    salida = np.empty((disco.numero_cuerpos, 3))
+    aceleraciones = aceleraciones_numba(disco.posiciones, disco.masas, mascara, salida)
+    assert aceleraciones is salida
+    np.testing.assert_allclose(aceleraciones, referencia, rtol=0, atol=1e-12 * np.abs(referencia).max())
@@ -0,0 +1,52 @@
+# Regresión de las partículas de prueba: sienten la gravedad de los cuerpos masivos pero no ejercen fuerza
+
+import numpy as np
+import pytest
+
+from orbitas import CuerpoCeleste, simular_sistema_solar
+from orbitas.escenarios import cinturon_particulas_prueba, sistema_solar_completo
+from orbitas.fuerzas import campo_gravitatorio, obtener_nucleo
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+UA = 1.496e11
+
+
+def _con_cinturon(numero=200):
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    sistema.agregar_particulas(*cinturon_particulas_prueba(numero, 2.2 * UA, 3.3 * UA))
+    return sistema
+
+
+# Los cuerpos masivos siguen exactamente la misma trayectoria con o sin el cinturón
+@pytest.mark.parametrize("nucleo", ["directo", "pares"])
+def test_no_ejercen_fuerza(nucleo):
+    solo_masivos = simular_sistema_solar(sistema_solar_completo(), 365, DIA, cada=5, nucleo=nucleo)
+    sistema = _con_cinturon()
+    assert sistema.numero_particulas_prueba == 200
+    con_cinturon = simular_sistema_solar(sistema.cuerpos, 365, DIA, cada=5, nucleo=nucleo)
+    assert np.array_equal(con_cinturon.posiciones[:, :9], solo_masivos.posiciones)
+
+
+# Aunque tenga masa, un cuerpo marcado como partícula de prueba no atrae a los demás
+def test_masa_de_una_particula_no_cuenta():
+    cuerpos = sistema_solar_completo()
+    cuerpos.append(CuerpoCeleste("Intruso", 1.989e30, [2 * UA, 0.0, 0.0], [0.0, 0.0, 0.0], prueba=True))
+    con_intruso = simular_sistema_solar(cuerpos, 100, DIA, cada=100)
+    solo_masivos = simular_sistema_solar(sistema_solar_completo(), 100, DIA, cada=100)
+    assert np.array_equal(con_intruso.posiciones[:, :9], solo_masivos.posiciones)
+
+
+# Las partículas sienten el campo de los cuerpos masivos y siguen en su órbita alrededor del Sol
+def test_sienten_la_gravedad():
+    sistema = _con_cinturon(50)
+    masivos = ~sistema.prueba
+    aceleraciones = obtener_nucleo("directo", sistema.prueba)(sistema.posiciones, sistema.masas)
+    esperadas = campo_gravitatorio(sistema.posiciones[sistema.prueba], sistema.posiciones[masivos],
+                                   sistema.masas[masivos])
+    np.testing.assert_allclose(aceleraciones[sistema.prueba], esperadas, rtol=1e-14)
+
+    radios = np.linalg.norm(sistema.posiciones[sistema.prueba], axis=1)
+    trayectoria = simular_sistema_solar(sistema.cuerpos, 365, DIA, cada=365)
+    finales = np.linalg.norm(trayectoria.posiciones[-1, sistema.prueba] - trayectoria.posiciones[-1, 0], axis=1)
+    np.testing.assert_allclose(finales, radios, rtol=0.02)
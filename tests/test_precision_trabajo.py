@@ -0,0 +1,52 @@
+# Regresión del banco de precisión frente a trabajo: errores frente a IAS15 y elección del dt más barato
+
+import csv
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from orbitas.escenarios import sistema_solar_interno
+from precision_trabajo import COLUMNAS, DIA, main, mas_baratos, medir, referencia
+
+
+def _resultado(metodo, segundos, error):
+    return {"metodo": metodo, "segundos": segundos, "error_posicion_ua": error}
+
+
+# Gana el más rápido que cumple la tolerancia; un error NaN (dt que diverge) no cumple nunca
+def test_mas_baratos():
+    resultados = [_resultado("leapfrog", 1.0, 1e-5), _resultado("leapfrog", 0.5, 1e-3),
+                  _resultado("leapfrog", 0.2, 1.0), _resultado("yoshida4", 0.1, float("nan")),
+                  _resultado("yoshida4", 0.3, 1e-6), _resultado("euler_cromer", 0.1, 1.0)]
+    elegidos = mas_baratos(resultados, 1e-3)
+    assert list(elegidos) == ["leapfrog", "yoshida4", "euler_cromer"]
+    assert elegidos["leapfrog"]["segundos"] == 0.5 and elegidos["yoshida4"]["segundos"] == 0.3
+    assert elegidos["euler_cromer"] is None
+
+
+# dt ajustado a un número entero de pasos hasta el tiempo final; el error de Leapfrog cae al reducir dt
+def test_medir_frente_a_referencia():
+    tiempo_final = 36.5 * DIA
+    posiciones = referencia(sistema_solar_interno, tiempo_final)
+    grueso = medir(sistema_solar_interno, "leapfrog", "numpy", 3.0, tiempo_final, posiciones)
+    fino = medir(sistema_solar_interno, "leapfrog", "numpy", 0.5, tiempo_final, posiciones)
+    assert grueso["pasos"] == 12 and grueso["dt_dias"] * grueso["pasos"] == 36.5
+    assert fino["error_posicion_ua"] < grueso["error_posicion_ua"] / 10
+    assert np.isfinite(fino["error_energia"]) and fino["error_energia"] < 1e-6
+
+
+def test_main(tmp_path, capsys):
+    archivo = str(tmp_path / "precision.csv")
+    grafica = str(tmp_path / "precision.png")
+    main(["--escenario", "sistema_interno", "--anios", "0.05", "--dts-dias", "1", "2", "--metodos", "leapfrog",
+          "yoshida4", "--csv", archivo, "--grafica", grafica, "--tolerancia-ua", "1e-2"])
+    with open(archivo, newline="", encoding="utf-8") as entrada:
+        filas = list(csv.DictReader(entrada))
+    assert [(fila["metodo"], float(fila["dt_dias"]) > 1.5) for fila in filas] == [
+        ("leapfrog", False), ("leapfrog", True), ("yoshida4", False), ("yoshida4", True)]
+    assert tuple(filas[0]) == COLUMNAS
+    assert os.path.getsize(grafica) > 0
+    assert "En conjunto:" in capsys.readouterr().out
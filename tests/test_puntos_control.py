@@ -0,0 +1,106 @@
+# Regresión de los puntos de control: una simulación interrumpida y reanudada es idéntica bit a bit a la original
+
+import numpy as np
+import pytest
+
+import orbitas.puntos_control
+from orbitas import reanudar_simulacion, simular_sistema_solar
+from orbitas.escenarios import sistema_solar_completo
+
+DIA = 86400.0
+NUM_PASOS = 700
+
+
+class Interrupcion(Exception):
+    pass
+
+
+# Hacer que el proceso "muera" justo antes de guardar el punto de control número `guardados` + 1: el sistema ya ha
+# avanzado ese bloque pero en disco queda el punto de control anterior
+def _interrumpir(monkeypatch, guardados):
+    guardar = orbitas.puntos_control.guardar_punto_control
+    llamadas = []
+
+    def guardar_e_interrumpir(*argumentos, **opciones):
+        if len(llamadas) == guardados:
+            raise Interrupcion
+        llamadas.append(None)
+        guardar(*argumentos, **opciones)
+
+    monkeypatch.setattr(orbitas.puntos_control, "guardar_punto_control", guardar_e_interrumpir)
+
+
+def _comparar(trayectoria, referencia):
+    assert trayectoria.numero_muestras == referencia.numero_muestras
+    assert np.array_equal(trayectoria.posiciones, referencia.posiciones)
+    assert np.array_equal(trayectoria.tiempos, referencia.tiempos)
+    assert np.array_equal(trayectoria.pasos, referencia.pasos)
+    if referencia.velocidades is not None:
+        assert np.array_equal(trayectoria.velocidades, referencia.velocidades)
+
+
+@pytest.mark.parametrize("opciones", [
+    {"metodo": "leapfrog", "guardar_velocidades": True},
+    {"metodo": "euler_cromer", "nucleo": "pares"},
+    {"metodo": "yoshida4"},
+    {"metodo": "wisdom_holman"},
+    {"metodo": "leapfrog", "tolerancia": 0.05},
+    {"metodo": "leapfrog", "bloques": True},
+    {"motor": "ias15"},
+], ids=lambda opciones: "-".join(str(valor) for valor in opciones.values()))
+def test_reanudar_es_identico_bit_a_bit(tmp_path, monkeypatch, opciones):
+    referencia = simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA, cada=3, diagnosticos=50,
+                                       **opciones)
+    ruta = str(tmp_path / "punto_control.npz")
+    _interrumpir(monkeypatch, guardados=3)
+    with pytest.raises(Interrupcion):
+        simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA, cada=3, diagnosticos=50,
+                              punto_control=ruta, pasos_punto_control=100, **opciones)
+    monkeypatch.undo()
+
+    trayectoria = reanudar_simulacion(ruta)
+    _comparar(trayectoria, referencia)
+    assert trayectoria.estadisticas == referencia.estadisticas
+    assert np.array_equal(trayectoria.diagnosticos.energias, referencia.diagnosticos.energias)
+    assert np.array_equal(trayectoria.diagnosticos.pasos, referencia.diagnosticos.pasos)
+
+
+# Con una trayectoria en disco el punto de control solo anota cuántas muestras son válidas
+def test_reanudar_con_trayectoria_en_disco(tmp_path, monkeypatch):
+    referencia = simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA, cada=4, guardar_velocidades=True)
+    ruta = str(tmp_path / "punto_control.npz")
+    _interrumpir(monkeypatch, guardados=2)
+    with pytest.raises(Interrupcion):
+        simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA, cada=4, guardar_velocidades=True,
+                              punto_control=ruta, pasos_punto_control=200,
+                              archivo_trayectoria=str(tmp_path / "trayectoria"))
+    monkeypatch.undo()
+
+    _comparar(reanudar_simulacion(ruta), referencia)
+
+
+# Reanudar una simulación ya terminada no avanza nada más
+def test_reanudar_simulacion_terminada(tmp_path):
+    ruta = str(tmp_path / "punto_control.npz")
+    referencia = simular_sistema_solar(sistema_solar_completo(), 250, DIA, punto_control=ruta,
+                                       pasos_punto_control=100)
+    _comparar(reanudar_simulacion(ruta), referencia)
+
+
+# El punto de control no crece con la historia: las muestras en memoria se añaden a su directorio al lado
+def test_historia_fuera_del_punto_control(tmp_path, monkeypatch):
+    ruta = tmp_path / "punto_control.npz"
+    guardar = orbitas.puntos_control.guardar_punto_control
+    tamanos = []
+
+    def guardar_y_medir(*argumentos, **opciones):
+        guardar(*argumentos, **opciones)
+        tamanos.append(ruta.stat().st_size)
+
+    monkeypatch.setattr(orbitas.puntos_control, "guardar_punto_control", guardar_y_medir)
+    referencia = simular_sistema_solar(sistema_solar_completo(), NUM_PASOS, DIA, punto_control=str(ruta),
+                                       pasos_punto_control=100, guardar_velocidades=True)
+    assert len(tamanos) == 7 and max(tamanos) - min(tamanos) < 64  # Solo cambian las cifras de los metadatos
+    historia = tmp_path / ("punto_control.npz" + orbitas.puntos_control.SUFIJO_HISTORIA)
+    assert (historia / "posiciones.bin").stat().st_size == referencia.posiciones.nbytes
+    _comparar(reanudar_simulacion(str(ruta)), referencia)
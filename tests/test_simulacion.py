@@ -0,0 +1,36 @@
+# Regresión de Simulacion: los estados que entrega cada `cada` pasos son bit a bit los de simular_sistema_solar
+
+import numpy as np
+import pytest
+
+from orbitas import Simulacion, simular_sistema_solar
+from orbitas.escenarios import sistema_solar_completo
+
+DIA = 86400.0
+
+
+@pytest.mark.parametrize("metodo", ["leapfrog", "euler_cromer", "yoshida4", "wisdom_holman"])
+def test_identica_a_simular_sistema_solar(metodo):
+    trayectoria = simular_sistema_solar(sistema_solar_completo(), 98, DIA, metodo=metodo, cada=7,
+                                        guardar_velocidades=True)
+    simulacion = Simulacion(sistema_solar_completo(), DIA, cada=7, metodo=metodo, num_pasos=98)
+    estados = [(sistema.posiciones.copy(), sistema.velocidades.copy()) for sistema in simulacion]
+    assert len(estados) == len(trayectoria) == 14 and simulacion.pasos_hechos == 98
+    assert np.array_equal([posiciones for posiciones, _ in estados], trayectoria.posiciones)
+    assert np.array_equal([velocidades for _, velocidades in estados], trayectoria.velocidades)
+
+
+# pasos() se puede llamar varias veces: seguir donde se quedó da el mismo estado que avanzar de una vez
+def test_pasos_por_tramos():
+    referencia = Simulacion(sistema_solar_completo(), DIA, cada=10)
+    final = list(referencia.pasos(100))[-1].posiciones.copy()
+    simulacion = Simulacion(sistema_solar_completo(), DIA, cada=10)
+    primeros = list(simulacion.pasos(45))
+    assert len(primeros) == 5 and simulacion.pasos_hechos == 45  # Cuatro bloques de 10 y uno final de 5
+    list(simulacion.pasos(30))
+    assert np.array_equal(simulacion.avanzar(25).posiciones, final)
+
+
+def test_cada_invalido():
+    with pytest.raises(ValueError):
+        Simulacion(sistema_solar_completo(), DIA, cada=0)
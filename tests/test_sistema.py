@@ -0,0 +1,55 @@
+# Regresión de las vistas CuerpoCeleste: editar una fila en el lugar no puede dejar obsoleto el estado del Leapfrog
+
+import numpy as np
+import pytest
+
+from orbitas import simular_sistema_solar
+from orbitas.escenarios import sistema_solar_externo
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+
+
+# Sistema a mitad de un Leapfrog: aceleraciones guardadas y medio impulso pendiente
+def _en_marcha():
+    cuerpos = sistema_solar_externo()
+    simular_sistema_solar(cuerpos, 10, DIA)
+    sistema = SistemaCeleste.comun(cuerpos)
+    assert sistema.aceleraciones is not None and sistema.medio_impulso is not None
+    return cuerpos, sistema
+
+
+def test_vistas_de_solo_lectura():
+    cuerpos, _ = _en_marcha()
+    for vista in (cuerpos[1].posicion, cuerpos[1].velocidad, cuerpos[1].velocidad_media):
+        with pytest.raises(ValueError):
+            vista[0] = 0.0
+    with pytest.raises(ValueError):
+        cuerpos[1].posicion += 1.0
+
+
+# Mover un cuerpo asignando la posición descarta las aceleraciones: seguir da lo mismo que empezar desde ahí
+def test_asignar_posicion():
+    cuerpos, sistema = _en_marcha()
+    posicion = cuerpos[1].posicion + [1e9, 0.0, 0.0]
+    cuerpos[1].posicion = posicion
+    assert sistema.aceleraciones is None and sistema.medio_impulso is None
+    nuevo = SistemaCeleste.desde_arreglos(sistema.nombres, sistema.masas, sistema.posiciones, sistema.velocidades)
+    simular_sistema_solar(cuerpos, 10, DIA)
+    simular_sistema_solar(nuevo.cuerpos, 10, DIA)
+    assert np.array_equal(sistema.posiciones, nuevo.posiciones)
+    assert np.array_equal(sistema.velocidades, nuevo.velocidades)
+
+
+# Cambiar una velocidad asignándola reabre el Leapfrog desde las velocidades nuevas
+def test_asignar_velocidad():
+    cuerpos, sistema = _en_marcha()
+    velocidad = 1.01 * cuerpos[1].velocidad
+    cuerpos[1].velocidad = velocidad
+    assert sistema.medio_impulso is None
+    assert np.array_equal(cuerpos[1].velocidad, velocidad)
+    nuevo = SistemaCeleste.desde_arreglos(sistema.nombres, sistema.masas, sistema.posiciones, sistema.velocidades)
+    simular_sistema_solar(cuerpos, 10, DIA)
+    simular_sistema_solar(nuevo.cuerpos, 10, DIA)
+    assert np.array_equal(sistema.posiciones, nuevo.posiciones)
+    assert np.array_equal(sistema.velocidades, nuevo.velocidades)
@@ -0,0 +1,59 @@
+# Regresión de la suite de rendimiento: casos medidos y comparación con una base que falla si se pierden pasos/s
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from suite_escenarios import casos, comparar, main, medir_caso
+
+
+def _resultados(**pasos_por_segundo):
+    return {"casos": [{"escenario": escenario, "metodo": "leapfrog", "motor": "numpy", "pasos_por_segundo": valor}
+                      for escenario, valor in pasos_por_segundo.items()]}
+
+
+# IAS15 una vez por escenario, Numba solo con los métodos que compila y Wisdom-Holman solo si el Sol domina
+def test_casos():
+    lista = list(casos(["sistema_solar_10", "alpha_centauri_A_10"], ["leapfrog", "yoshida4", "wisdom_holman"],
+                       ["numpy", "numba", "ias15"]))
+    assert ("sistema_solar_10", "wisdom_holman", "numpy") in lista
+    assert ("alpha_centauri_A_10", "wisdom_holman", "numpy") not in lista
+    assert ("sistema_solar_10", "leapfrog", "numba") in lista and ("sistema_solar_10", "yoshida4", "numba") not in lista
+    assert [caso for caso in lista if caso[2] == "ias15"] == [("sistema_solar_10", "ias15", "ias15"),
+                                                            ("alpha_centauri_A_10", "ias15", "ias15")]
+
+
+def test_comparar_marca_las_regresiones():
+    base = _resultados(sistema_solar_10=1000.0, sistema_interno_20=1000.0)
+    resultados = _resultados(sistema_solar_10=850.0, sistema_interno_20=950.0, sistema_externo_50=10.0)
+    lineas, regresiones = comparar(resultados, base, umbral=0.1)
+    assert regresiones == [("sistema_solar_10", "leapfrog", "numpy")]
+    assert "REGRESIÓN" in lineas[0] and "REGRESIÓN" not in lineas[1] and lineas[2].endswith("sin base")
+    assert comparar(resultados, base, umbral=0.2)[1] == []
+
+
+def test_medir_caso():
+    caso = medir_caso("sistema_interno_20", "leapfrog", "numpy", fraccion=0.01)
+    assert caso["pasos"] == 73 and caso["cuerpos"] == 5
+    assert caso["pasos_por_segundo"] > 0 and caso["error_energia"] < 1e-3
+
+
+# De principio a fin: la suite termina con código 1 frente a una base mucho más rápida y con 0 frente a sí misma
+def test_main_con_base(tmp_path, capsys):
+    salida = str(tmp_path / "suite.json")
+    opciones = ["--escenarios", "sistema_interno_20", "--metodos", "leapfrog", "--motores", "numpy",
+                "--fraccion", "0.01", "--salida", salida]
+    assert main(opciones) == 0
+    with open(salida, encoding="utf-8") as archivo:
+        resultados = json.load(archivo)
+    assert [caso["escenario"] for caso in resultados["casos"]] == ["sistema_interno_20"]
+
+    for caso in resultados["casos"]:
+        caso["pasos_por_segundo"] *= 1000
+    base = str(tmp_path / "base.json")
+    with open(base, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo)
+    assert main(opciones + ["--comparar", base]) == 1
+    assert "REGRESIÓN" in capsys.readouterr().out
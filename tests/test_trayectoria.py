@@ -0,0 +1,48 @@
+# Regresión de la trayectoria preasignada: una muestra cada `cada` pasos, sin cambiar la integración
+
+import numpy as np
+import pytest
+
+from orbitas import Trayectoria, simular_sistema_solar
+from orbitas.escenarios import sistema_solar_completo
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+
+
+# Registrar cada 5 pasos guarda exactamente las mismas muestras que registrar todos y quedarse con una de cada 5
+def test_muestras_cada_n_pasos():
+    completa = simular_sistema_solar(sistema_solar_completo(), 23, DIA, guardar_velocidades=True)
+    diezmada = simular_sistema_solar(sistema_solar_completo(), 23, DIA, cada=5, guardar_velocidades=True)
+    assert len(completa) == 23 and len(diezmada) == 4
+    assert np.array_equal(diezmada.pasos, [5, 10, 15, 20])
+    assert np.array_equal(diezmada.tiempos, completa.tiempos[4::5])
+    assert np.array_equal(diezmada.posiciones, completa.posiciones[4::5])
+    assert np.array_equal(diezmada.velocidades, completa.velocidades[4::5])
+    assert np.array_equal(diezmada.duraciones, np.full(4, DIA))
+    assert len(diezmada._tiempos) == 4  # Capacidad justa: num_pasos // cada
+
+
+def test_indexar_por_nombre():
+    trayectoria = simular_sistema_solar(sistema_solar_completo(), 10, DIA, cada=2)
+    assert "Tierra" in trayectoria and "Vulcano" not in trayectoria
+    indice = trayectoria.indice("Tierra")
+    assert np.array_equal(trayectoria["Tierra"], trayectoria.posiciones[:, indice])
+    assert trayectoria.velocidades is None
+
+
+# Una trayectoria ampliable crece al llenarse y conserva las muestras anteriores
+def test_ampliable():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    trayectoria = Trayectoria(sistema.nombres, 0, ampliable=True)
+    for paso in range(1, 41):
+        sistema.posiciones = sistema.posiciones + 1.0
+        trayectoria.registrar(paso, paso * DIA, sistema)
+    assert len(trayectoria) == 40 and len(trayectoria._tiempos) >= 40
+    assert np.array_equal(trayectoria.pasos, np.arange(1, 41))
+    np.testing.assert_array_equal(trayectoria.posiciones[1:] - trayectoria.posiciones[:-1], 1.0)
+
+
+def test_cada_invalido():
+    with pytest.raises(ValueError):
+        Trayectoria(["Sol"], 10, cada=0)
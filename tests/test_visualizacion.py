@@ -0,0 +1,49 @@
+# Regresión del modo sin ventanas: las figuras se guardan en archivos con el backend Agg en lugar de mostrarse
+
+import os
+import subprocess
+import sys
+
+from orbitas import modo_sin_ventanas, simular_sistema_solar, visualizar_orbitas
+from orbitas.escenarios import sistema_solar_interno
+
+DIA = 86400.0
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Cada figura recibe un nombre numerado a partir de su título; modo_sin_ventanas(None) vuelve a mostrarlas
+def test_modo_sin_ventanas(tmp_path):
+    directorio = tmp_path / "figuras"
+    modo_sin_ventanas(str(directorio), formato="svg")
+    try:
+        cuerpos = sistema_solar_interno()
+        trayectoria = simular_sistema_solar(cuerpos, 30, DIA)
+        primera = visualizar_orbitas(cuerpos, trayectoria, titulo="Sistema Solar Interno")
+        segunda = visualizar_orbitas(cuerpos, trayectoria, titulo="Sistema Solar Interno")
+        explicito = visualizar_orbitas(cuerpos, trayectoria, archivo=str(tmp_path / "orbitas.png"))
+    finally:
+        modo_sin_ventanas(None)
+    assert os.path.basename(primera).endswith("_sistema_solar_interno.svg")
+    assert primera != segunda and sorted(os.listdir(directorio)) == [os.path.basename(primera),
+                                                                     os.path.basename(segunda)]
+    assert explicito == str(tmp_path / "orbitas.png") and os.path.getsize(explicito) > 0
+
+    import matplotlib
+    assert matplotlib.get_backend().lower() == "agg"
+
+
+# Con ORBITAS_FIGURAS, un proceso nuevo guarda la figura sin abrir ninguna ventana
+def test_variable_de_entorno(tmp_path):
+    entorno = dict(os.environ, ORBITAS_FIGURAS=str(tmp_path),
+                   PYTHONPATH=os.pathsep.join(filter(None, [RAIZ, os.environ.get("PYTHONPATH")])))
+    entorno.pop("MPLBACKEND", None)
+    programa = ("import matplotlib\n"
+                "from orbitas import simular_sistema_solar, visualizar_orbitas\n"
+                "from orbitas.escenarios import sistema_solar_completo\n"
+                "cuerpos = sistema_solar_completo()\n"
+                "print(visualizar_orbitas(cuerpos, simular_sistema_solar(cuerpos, 10, 86400.0)))\n"
+                "print(matplotlib.get_backend().lower())\n")
+    salida = subprocess.run([sys.executable, "-c", programa], cwd=RAIZ, env=entorno, capture_output=True, text=True,
+                            check=True).stdout.split()
+    assert salida == [str(tmp_path / "001_órbitas_del_sistema_solar.png"), "agg"]
+    assert os.path.getsize(salida[0]) > 0
@@ -0,0 +1,102 @@
+# Regresión de Wisdom-Holman: cuerpo central explícito por nombre o índice y aviso si no domina, deriva kepleriana
+# y avance en coordenadas heliocéntricas
+
+import numpy as np
+import pytest
+
+from orbitas import (avanzar_wisdom_holman, deriva_kepler, indice_central, paso_wisdom_holman, rivales_central,
+                     simular_sistema_solar)
+from orbitas.escenarios import alpha_centauri_A, sistema_solar_completo, sistema_solar_externo
+from orbitas.fuerzas import G
+from orbitas.sistema import SistemaCeleste
+
+DIA = 86400.0
+
+
+def test_central_por_defecto_es_el_sol():
+    cuerpos = sistema_solar_completo()
+    sistema = SistemaCeleste.desde_cuerpos(list(reversed(cuerpos)))  # El Sol queda en la última fila
+    assert indice_central(sistema) == sistema.nombres.index("Sol")
+    assert indice_central(sistema, 0) == 0
+    assert indice_central(sistema, -1) == sistema.numero_cuerpos - 1
+    assert rivales_central(sistema) == []
+
+
+def test_central_desconocido():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_completo())
+    with pytest.raises(ValueError):
+        indice_central(sistema, "Vulcano")
+    with pytest.raises(ValueError):
+        indice_central(sistema, sistema.numero_cuerpos)
+    with pytest.raises(ValueError):
+        simular_sistema_solar(sistema_solar_completo(), 10, DIA, metodo="wisdom_holman", central="Vulcano")
+
+
+# Elegir el Sol por nombre, por índice o por defecto da exactamente la misma integración
+def test_central_explicito_coincide_con_el_defecto():
+    referencia = simular_sistema_solar(sistema_solar_completo(), 200, DIA, metodo="wisdom_holman")
+    for central in ("Sol", 0):
+        trayectoria = simular_sistema_solar(sistema_solar_completo(), 200, DIA, metodo="wisdom_holman",
+                                            central=central)
+        assert np.array_equal(trayectoria.posiciones, referencia.posiciones)
+
+
+def test_aviso_si_el_central_no_domina():
+    with pytest.warns(RuntimeWarning, match="no domina"):
+        simular_sistema_solar(alpha_centauri_A(), 10, DIA, metodo="wisdom_holman")
+    sistema = SistemaCeleste.desde_cuerpos(alpha_centauri_A())
+    assert "Sol" not in rivales_central(sistema)
+    assert rivales_central(sistema)
+
+
+# Avanzar en coordenadas heliocéntricas con los impulsos fundidos da lo mismo que convertir en cada paso: bit a bit
+# si se registra cada paso (dos medios impulsos en los dos casos) y salvo redondeo si se registra cada cien
+def test_avance_heliocentrico_coincide_con_paso_a_paso():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_externo())
+    for _ in range(1000):
+        paso_wisdom_holman(sistema, 10 * DIA)
+    escala = np.abs(sistema.posiciones).max()
+    trayectoria = simular_sistema_solar(sistema_solar_externo(), 1000, 10 * DIA, metodo="wisdom_holman")
+    assert np.array_equal(trayectoria.posiciones[-1], sistema.posiciones)
+    trayectoria = simular_sistema_solar(sistema_solar_externo(), 1000, 10 * DIA, metodo="wisdom_holman", cada=100)
+    np.testing.assert_allclose(trayectoria.posiciones[-1], sistema.posiciones, rtol=0, atol=1e-9 * escala)
+
+    otro = SistemaCeleste.desde_cuerpos(sistema_solar_externo())
+    avanzar_wisdom_holman(otro, 1000, 10 * DIA)
+    assert otro.numero_paso == 1000 and otro.tiempo == 1000 * 10 * DIA
+    np.testing.assert_allclose(otro.velocidades, sistema.velocidades, rtol=0,
+                               atol=1e-9 * np.abs(sistema.velocidades).max())
+
+
+# El estado heliocéntrico guardado entre llamadas se descarta al cambiar el sistema desde fuera: el paso siguiente
+# parte de la posición nueva, igual que un sistema recién creado con ella
+def test_estado_guardado_se_descarta():
+    sistema = SistemaCeleste.desde_cuerpos(sistema_solar_externo())
+    avanzar_wisdom_holman(sistema, 10, 10 * DIA)
+    assert sistema.heliocentricas is not None
+    sistema.cuerpos[1].posicion = sistema.cuerpos[1].posicion * 1.01
+    assert sistema.heliocentricas is None
+    nuevo = SistemaCeleste.desde_arreglos(sistema.nombres, sistema.masas, sistema.posiciones, sistema.velocidades)
+    avanzar_wisdom_holman(sistema, 5, 10 * DIA)
+    avanzar_wisdom_holman(nuevo, 5, 10 * DIA)
+    assert np.array_equal(sistema.posiciones, nuevo.posiciones)
+    sistema.velocidades = sistema.velocidades
+    assert sistema.heliocentricas is None
+
+
+# La deriva kepleriana conserva la energía específica y el momento angular en órbitas elípticas, casi parabólicas
+# e hiperbólicas a la vez (todas las ramas de las funciones de Stumpff en el mismo arreglo)
+def test_deriva_kepler_todas_las_ramas():
+    mu = G * 1.989e30
+    radio = 1.496e11
+    circular = np.sqrt(mu / radio)
+    posiciones = np.tile([radio, 0.0, 0.0], (4, 1))
+    velocidades = np.array([[0.0, factor * circular, 0.0] for factor in (0.5, 1.0, np.sqrt(2), 2.0)])
+    for dt in (DIA, 100 * DIA):
+        nuevas_posiciones, nuevas_velocidades = deriva_kepler(posiciones, velocidades, mu, dt)
+        energia = 0.5 * np.sum(velocidades ** 2, axis=1) - mu / radio
+        nueva_energia = (0.5 * np.sum(nuevas_velocidades ** 2, axis=1)
+                         - mu / np.linalg.norm(nuevas_posiciones, axis=1))
+        np.testing.assert_allclose(nueva_energia, energia, rtol=0, atol=1e-9 * mu / radio)
+        np.testing.assert_allclose(np.cross(nuevas_posiciones, nuevas_velocidades),
+                                   np.cross(posiciones, velocidades), rtol=1e-10)